@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 from datetime import datetime, timedelta
 import html
 import styles
@@ -25,7 +24,7 @@ status, color, reason = "SYSTEM BOOT", "#888888", "Initializing..."
 
 try:
     with st.spinner("Connecting to Global Swarm..."):
-        full_data = logic.fetch_market_data()
+        full_data = logic.get_market_data()
         strat_data = logic.load_strategist_data()
         
     if full_data is not None and not full_data.empty:
@@ -106,46 +105,34 @@ if full_data is not None and closes is not None:
         # Deep Dive Chart
         st.markdown('<div class="steel-sub-header"><span class="steel-text-main" style="font-size: 20px !important;">Swarm Deep Dive</span></div>', unsafe_allow_html=True)
         if 'SPY' in closes:
-            spy = closes['SPY']
-            # FIXED: logic.calc_ppo
-            ppo, sig, hist = logic.calc_ppo(spy)
-            # FIXED: logic.calc_cone
-            sma, std, u_cone, l_cone = logic.calc_cone(spy)
-            # FIXED: logic.generate_forecast
-            f_dates, f_mean, f_upper, f_lower = logic.generate_forecast(spy.index[-1], spy.iloc[-1], std.iloc[-1], days=30)
-            
             c1, c2 = st.columns(2)
             with c1: view_mode = st.radio("Select View Horizon:", ["Tactical (60-Day Zoom)", "Strategic (2-Year History)"], horizontal=True)
             with c2: st.caption("🔒 Global Swarm & Sector Rotation locked for Premium Users.")
 
-            days_back = 60 if "Tactical" in view_mode else 730
+            tactical = "Tactical" in view_mode
+            days_back = 60 if tactical else 730
             start_filter = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-            c_data = full_data[full_data.index >= start_filter]
-            
-            fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.03, row_heights=[0.7, 0.3])
-            
-            fig.add_trace(go.Scatter(x=c_data.index, y=l_cone[l_cone.index >= start_filter], line=dict(width=0), showlegend=False, hoverinfo='skip'), row=1, col=1)
-            fig.add_trace(go.Scatter(x=c_data.index, y=u_cone[u_cone.index >= start_filter], fill='tonexty', fillcolor='rgba(0, 100, 255, 0.1)', line=dict(width=0), name="Fair Value Cone", hoverinfo='skip'), row=1, col=1)
-            fig.add_trace(go.Candlestick(x=c_data.index, open=c_data['Open']['SPY'], high=c_data['High']['SPY'], low=c_data['Low']['SPY'], close=c_data['Close']['SPY'], name='SPY'), row=1, col=1)
-
-            if "Tactical" in view_mode:
-                if strat_data is not None:
-                    latest = strat_data.iloc[-1]
-                    dates_fut = [latest['Date'] + timedelta(days=30*i) for i in range(1, 7)]
-                    prices_fut = [latest['Tstk_Adj'] * (1 + latest[f'FP{i}']) for i in range(1, 7)]
-                    fig.add_trace(go.Scatter(x=dates_fut, y=prices_fut, name="Strategist Forecast", line=dict(color=theme["ACCENT_GOLD"], width=3, dash='dot'), mode='lines+markers'), row=1, col=1)
-                else:
-                    fig.add_trace(go.Scatter(x=f_dates, y=f_lower, line=dict(width=0), showlegend=False, hoverinfo='skip'), row=1, col=1)
-                    fig.add_trace(go.Scatter(x=f_dates, y=f_upper, fill='tonexty', fillcolor='rgba(200, 0, 255, 0.15)', line=dict(width=0), name="Uncertainty", hoverinfo='skip'), row=1, col=1)
-                    fig.add_trace(go.Scatter(x=f_dates, y=f_mean, name="Swarm Forecast", line=dict(color=theme["CHART_FONT"], width=2, dash='dot')), row=1, col=1)
-
-            sub_ppo = ppo[ppo.index >= c_data.index[0]]
-            fig.add_trace(go.Scatter(x=c_data.index, y=sub_ppo, name="Swarm Trend", line=dict(color='cyan', width=1)), row=2, col=1)
-            fig.add_trace(go.Scatter(x=c_data.index, y=sig[sig.index >= c_data.index[0]], name="Signal", line=dict(color='orange', width=1)), row=2, col=1)
-            fig.add_trace(go.Bar(x=c_data.index, y=hist[hist.index >= c_data.index[0]], name="Velocity", marker_color=['#00ff00' if v >= 0 else '#ff0000' for v in hist[hist.index >= c_data.index[0]]]), row=2, col=1)
-
-            fig.update_layout(height=500, template=theme["CHART_TEMPLATE"], margin=dict(l=0, r=0, t=0, b=0), showlegend=False, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', font=dict(color=theme["CHART_FONT"]), xaxis_rangeslider_visible=False)
-            fig.update_xaxes(showgrid=False); fig.update_yaxes(showgrid=False)
+
+            def build_deep_dive():
+                spy = closes['SPY']
+                ppo, sig, hist = logic.calc_ppo(spy)
+                _, _, u_cone, l_cone = logic.calc_cone(spy)
+                forecast, strategist = None, None
+                if tactical:
+                    if strat_data is not None:
+                        latest = strat_data.iloc[-1]
+                        dates_fut = [latest['Date'] + timedelta(days=30*i) for i in range(1, 7)]
+                        prices_fut = [latest['Tstk_Adj'] * (1 + latest[f'FP{i}']) for i in range(1, 7)]
+                        strategist = (dates_fut, prices_fut)
+                    else:
+                        forecast = logic.generate_forecast_mc(spy, days=30)
+                c_data = full_data[full_data.index >= start_filter]
+                return styles.render_deep_dive(c_data, (u_cone, l_cone), (ppo, sig, hist), theme,
+                                               forecast=forecast, strategist=strategist)
+
+            # Reruns that keep the data, horizon (window start included) and theme reuse the cached figure
+            fig_key = (logic.data_fingerprint((full_data, strat_data)), view_mode, start_filter, styles.theme_key(theme))
+            fig = pio.from_json(styles.cached_figure_json(fig_key, build_deep_dive))
             st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
             st.markdown("""<div class="premium-banner">🔒 Institutional Access Required: Unlock Sector Rotation & Global Flows</div>""", unsafe_allow_html=True)
 
@@ -162,9 +149,10 @@ if full_data is not None and closes is not None:
 
         st.subheader("⏱️ Tactical Horizons")
         if 'SPY' in closes:
-            # FIXED: logic.calc_ppo
-            latest_hist = logic.calc_ppo(closes['SPY'])[2].iloc[-1]
-            latest_ppo = logic.calc_ppo(closes['SPY'])[0].iloc[-1]
+            # Memoized: same result object the Markets tab already computed
+            spy_ppo, _, spy_hist = logic.calc_ppo(closes['SPY'])
+            latest_hist = spy_hist.iloc[-1]
+            latest_ppo = spy_ppo.iloc[-1]
             h1, h2, h3 = st.columns(3)
             with h1: st.info("**1 WEEK (Momentum)**"); st.markdown("🟢 **RISING**" if latest_hist > 0 else "🔴 **WEAKENING**")
             with h2: st.info("**1 MONTH (Trend)**"); st.markdown("🟢 **BULLISH**" if latest_ppo > 0 else "🔴 **BEARISH**")
@@ -4,6 +4,10 @@ import numpy as np
 import os
 import sys
 
+# Repo root, for the shared history archive in src/
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+from src import data_provider, history_archive
+
 # ==========================================
 # 1. SETUP
 # ==========================================
@@ -45,7 +49,8 @@ bad_dates_map = {
 # ==========================================
 print("Downloading data...")
 tickers = ["HYG", "IEF", "^VIX", "RSP", "SPY", "DX-Y.NYB"]
-data = yf.download(tickers, start="2007-01-01", progress=False)['Close']
+# Served from the memory-mapped archive when ALPHA_SWARM_ARCHIVE_DIR is set
+data = history_archive.fetch_history(tickers, "2007-01-01", source=data_provider.get_provider(yf))['Close']
 data.dropna(inplace=True)
 
 df = pd.DataFrame(index=data.index)
@@ -4,6 +4,10 @@ import numpy as np
 import os
 import sys
 
+# Repo root, for the shared history archive in src/
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+from src import data_provider, history_archive
+
 print("--- [ALPHA SWARM: HISTORICAL BACKTESTER V3 (NO LOOK-AHEAD BIAS)] ---")
 
 # ==========================================
@@ -27,7 +31,8 @@ BREADTH_TRIGGER = -0.025 # RSP underperforms SPY by 2.5% in 20 days
 try:
     print("Downloading data...")
     tickers = [CREDIT_RISKY, CREDIT_SAFE, VOL_INDEX, BREADTH_EQ, BREADTH_MKT]
-    data = yf.download(tickers, start="2007-01-01", progress=False)['Close']
+    # Served from the memory-mapped archive when ALPHA_SWARM_ARCHIVE_DIR is set
+    data = history_archive.fetch_history(tickers, "2007-01-01", source=data_provider.get_provider(yf))['Close']
     data.dropna(inplace=True)
     print(f"[SUCCESS] Downloaded {len(data)} trading days.")
 
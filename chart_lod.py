@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+# --- CHART LEVEL OF DETAIL ---
+# A chart only has so many pixels, so shipping every daily bar of a long
+# history just grows the plotly payload and the per-bar Python lists behind
+# it. Candles are aggregated to weekly or monthly OHLC once daily bars would
+# be thinner than PX_PER_CANDLE; line overlays keep their shape through
+# Largest-Triangle-Three-Buckets (LTTB) downsampling to one point every
+# PX_PER_POINT. Either way the payload is bounded by the target width, not
+# by how much history is loaded.
+
+
+def _month_end_alias(version=pd.__version__):
+    # pandas 2.2 renamed month-end "M" to "ME"; older versions reject "ME"
+    major, minor = (int(part) for part in version.split(".")[:2])
+    return "ME" if (major, minor) >= (2, 2) else "M"
+
+
+CHART_WIDTH_PX = 1200  # Deep Dive plot area in the wide layout
+PX_PER_CANDLE = 4
+PX_PER_POINT = 2
+MONTH_END = _month_end_alias()
+BAR_RULES = ((None, 1), ("W-FRI", 5), (MONTH_END, 21))  # Pandas rule, trading days per bar
+OHLC_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last"}
+
+
+def bar_rule(n_bars, target_px=CHART_WIDTH_PX, px_per_candle=PX_PER_CANDLE):
+    """Finest bar size (None = daily, weekly, monthly) whose candle count fits the width."""
+    max_bars = max(target_px // px_per_candle, 1)
+    for rule, days in BAR_RULES:
+        if n_bars / days <= max_bars:
+            return rule
+    return BAR_RULES[-1][0]
+
+
+def line_points(target_px=CHART_WIDTH_PX, px_per_point=PX_PER_POINT):
+    """Point budget for one line overlay."""
+    return max(target_px // px_per_point, 3)
+
+
+def _last_days(index, rule):
+    # Label each bar by its last trading day, not the calendar period end
+    return index.to_series().resample(rule).last().dropna()
+
+
+def resample_ohlc(ohlc, rule):
+    """Aggregates a daily Open/High/Low/Close frame to `rule` bars labelled by their last trading day."""
+    if rule is None:
+        return ohlc
+    bars = ohlc.resample(rule).agg(OHLC_AGG).dropna(how="all")
+    bars.index = pd.DatetimeIndex(_last_days(ohlc.index, rule).reindex(bars.index))
+    return bars
+
+
+def resample_last(series, rule):
+    """Last value per `rule` bar, on the same labels as resample_ohlc."""
+    if rule is None:
+        return series
+    bars = series.resample(rule).last()
+    labels = _last_days(series.index, rule)
+    bars = bars.reindex(labels.index)
+    bars.index = pd.DatetimeIndex(labels)
+    return bars
+
+
+def lttb_indices(x, y, n_out):
+    """Positions LTTB keeps from the points (x, y): first, last and one per bucket in between."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)  # n_out - 2 buckets between the end points
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(hi, edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        # Point making the largest triangle with the last kept point and the next bucket's centroid
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def lttb(data, n_out, column=None):
+    """LTTB-downsamples a date-indexed Series, or a frame's rows by one column (default the first).
+
+    Rows with NaN in the selecting values are dropped first.
+    """
+    values = data if isinstance(data, pd.Series) else data[data.columns[0] if column is None else column]
+    data = data[values.notna()]
+    values = values.dropna()
+    x = values.index.asi8 - values.index.asi8[0] if len(values) else []
+    return data.iloc[lttb_indices(x, values.to_numpy(), n_out)]
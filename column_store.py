@@ -0,0 +1,70 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# --- COMPACT OHLCV PANEL ---
+# fetch_market_data returns a float64 (field, ticker) MultiIndex frame. Each
+# replica holds one per cache entry. CompactPanel keeps the same data as a
+# single float32 block laid out (field, ticker, date): half the memory, and
+# every field or ticker column is a zero-copy view. It answers the handful
+# of frame operations app.py and logic.py use on the market data.
+
+
+class CompactPanel:
+    """float32 stand-in for the (field, ticker) OHLCV frame from fetch_market_data."""
+
+    def __init__(self, values, index, fields, tickers):
+        self.values = values
+        self.index = pd.DatetimeIndex(index)
+        self.fields = pd.Index(fields)
+        self.tickers = pd.Index(tickers)
+
+    @classmethod
+    def from_frame(cls, data):
+        fields = data.columns.get_level_values(0).unique()
+        tickers = data.columns.get_level_values(1).unique()
+        values = np.empty((len(fields), len(tickers), len(data.index)), dtype=np.float32)
+        for i, field in enumerate(fields):
+            values[i] = data[field].reindex(columns=tickers).to_numpy(dtype=np.float32).T
+        return cls(values, data.index, fields, tickers)
+
+    def to_frame(self):
+        """Expands back to a float64 MultiIndex frame (copies)."""
+        return pd.concat({f: self[f].astype(float) for f in self.fields}, axis=1, names=["Price", "Ticker"])
+
+    @property
+    def columns(self):
+        return pd.MultiIndex.from_product([self.fields, self.tickers], names=["Price", "Ticker"])
+
+    @property
+    def empty(self):
+        return self.values.size == 0
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, field):
+        return field in self.fields
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            # Date x ticker frame over the shared block, no copy
+            block = self.values[self.fields.get_loc(key)]
+            return pd.DataFrame(block.T, index=self.index, columns=self.tickers, copy=False)
+        # Boolean row mask, e.g. panel[panel.index >= start]
+        rows = np.flatnonzero(np.asarray(key, dtype=bool))
+        if rows.size and rows[-1] - rows[0] + 1 == rows.size:
+            rows = slice(rows[0], rows[-1] + 1)  # Contiguous range stays a view
+        return CompactPanel(self.values[:, :, rows], self.index[rows], self.fields, self.tickers)
+
+    def content_hash(self):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.ascontiguousarray(self.values).tobytes())
+        h.update(self.index.asi8.tobytes())
+        h.update(repr((list(self.fields), list(self.tickers))).encode())
+        return h.hexdigest()
@@ -3,114 +3,457 @@ import numpy as np
 import yfinance as yf
 from datetime import datetime, timedelta
 import os
+import json
+import time
+import concurrent.futures
+import threading
+from collections import deque
 import streamlit as st
+import price_store
+import refresher
+import column_store
+from src import cache_backend, correlation, data_provider
+# Pure pieces shared with the src/ research engines, re-exported as logic.*
+from src.indicator_memo import INDICATOR_CACHE_SIZE, clear_indicator_cache, data_fingerprint, memoize_indicator
+from src.governance_rules import (
+    CREDIT_TRIG, VIX_PANIC, VIX_EXTREME, BREADTH_TRIG, DXY_SPIKE, GOV_STATES, GOV_LEVEL_NAMES,
+    GOV_LEVEL_BY_REASON, GOV_THRESHOLD_DEFAULTS, CREDIT_LOOKBACK, BREADTH_LOOKBACK, DXY_LOOKBACK,
+    governance_inputs, score_governance,
+)
 
-@st.cache_data(ttl=3600)
+CACHE_TTL = 3600
+REFRESH_INTERVAL = CACHE_TTL * 0.8  # Re-fetch before the shared entry expires
+MARKET_TICKERS = ["SPY", "^DJI", "^IXIC", "HYG", "IEF", "^VIX", "RSP", "DX-Y.NYB", "GC=F", "CL=F"]
+DOWNLOAD_WORKERS = 4  # Concurrent retry loops; their downloads still take turns on the lock
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF = 0.5  # Seconds, doubled on each retry
+# yf.download keeps each call's results in module globals (yfinance.shared),
+# so two calls in flight clobber each other. Every call takes this lock;
+# yfinance's own threads=True parallelizes the symbols inside one call.
+_download_lock = threading.Lock()
+
+def _download_frame(tickers, start, threads=False):
+    """One yf.download call, normalized to (field, ticker) columns holding only the requested tickers."""
+    with _download_lock:
+        data = data_provider.get_provider(yf).download(tickers, start=start, threads=threads)
+    if data is None or data.empty:
+        return None
+    if not isinstance(data.columns, pd.MultiIndex):
+        # Older yfinance returns flat field columns for a single ticker
+        data = pd.concat({tickers[0]: data}, axis=1).swaplevel(0, 1, axis=1)
+    data = data.loc[:, data.columns.get_level_values(1).isin(tickers)]
+    return data if not data.empty else None
+
+def _has_ticker(data, ticker):
+    return data is not None and ("Close", ticker) in data.columns and data[("Close", ticker)].notna().any()
+
+def _download_with_retry(ticker, start):
+    for attempt in range(DOWNLOAD_RETRIES):
+        try:
+            data = _download_frame([ticker], start)
+            if _has_ticker(data, ticker):
+                return data
+        except Exception:
+            pass
+        if attempt < DOWNLOAD_RETRIES - 1:
+            time.sleep(DOWNLOAD_BACKOFF * (2 ** attempt))
+    return None
+
+def download_history(tickers, start):
+    """Downloads all tickers in one threaded yf.download call, retries the missing ones and merges whatever succeeded.
+
+    Returns a yf.download-shaped frame, or None if every ticker failed.
+    """
+    try:
+        data = _download_frame(list(tickers), start, threads=True)
+    except Exception:
+        data = None
+    parts = [data] if data is not None else []
+    # Retry only the symbols the bulk call failed to deliver, each on its own;
+    # the pool overlaps their backoff sleeps while the downloads take turns
+    missing = [t for t in tickers if not _has_ticker(data, t)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        for retried in executor.map(lambda ticker: _download_with_retry(ticker, start), missing):
+            if retried is not None:
+                parts.append(retried)
+    if not parts:
+        return None
+    data = pd.concat(parts, axis=1)
+    return data.loc[:, ~data.columns.duplicated()].sort_index()
+
+def _rebase(store, fresh, start):
+    """Re-downloads, whole, every ticker whose stored bars are on an older dividend/split adjustment.
+
+    Returns the download with those tickers swapped for their full history,
+    and the tickers whose files must be replaced rather than merged into.
+    """
+    try:
+        rebased = store.rebased_tickers(fresh)
+    except Exception:
+        rebased = []
+    if not rebased:
+        return fresh, []
+    full_start = min([pd.Timestamp(start)] + [store.date_range(t)[0] for t in rebased])
+    full = download_history(rebased, full_start.strftime('%Y-%m-%d'))
+    # A top-up on the new basis must not be merged into bars on the old one
+    fresh = fresh.loc[:, ~fresh.columns.get_level_values(1).isin(rebased)]
+    replaced = [t for t in rebased if _has_ticker(full, t)]
+    if replaced:
+        full = full.loc[:, full.columns.get_level_values(1).isin(replaced)]
+        fresh = pd.concat([fresh, full], axis=1).sort_index()
+    return (fresh if not fresh.empty else None), replaced
+
+def _load_history(tickers, start):
+    """Store-first load of daily bars since `start`, topped up from the network and forward-filled."""
+    store = price_store.PriceStore()
+
+    # Only ask the network for bars we don't already hold on disk, one download per distinct start
+    try:
+        starts = store.top_up_starts(tickers, start)
+    except Exception:
+        starts = dict.fromkeys(tickers, pd.Timestamp(start))
+    groups = {}
+    for ticker, ticker_start in starts.items():
+        groups.setdefault(ticker_start, []).append(ticker)
+    parts = [download_history(group, group_start.strftime('%Y-%m-%d')) for group_start, group in sorted(groups.items())]
+    parts = [part for part in parts if part is not None]
+    fresh = pd.concat(parts, axis=1).sort_index() if parts else None
+    fresh, replaced = _rebase(store, fresh, start)
+
+    try:
+        store.update(fresh, replace=replaced)
+    except Exception:
+        pass  # Read-only or full store: the merge below still serves the download
+    try:
+        data = store.load(tickers, start=start)
+    except Exception:
+        data = None
+    if fresh is not None:
+        # Newer bars win whether or not they reached the disk
+        fresh = fresh[fresh.index >= pd.Timestamp(start)]
+        data = fresh if data is None else fresh.combine_first(data)
+
+    if data is None or data.empty:
+        return None
+
+    # Fix the "Sunday Gap" by carrying forward Friday's data
+    return data.ffill()
+
+@cache_backend.shared_cache(ttl=CACHE_TTL)
 def fetch_market_data():
-    """Fetches data from Yahoo Finance and cleans it immediately."""
+    """Fetches data from the local price store, topping it up from Yahoo Finance, and cleans it immediately."""
     try:
-        tickers = ["SPY", "^DJI", "^IXIC", "HYG", "IEF", "^VIX", "RSP", "DX-Y.NYB", "GC=F", "CL=F"]
         start = (datetime.now() - timedelta(days=1825)).strftime('%Y-%m-%d')
-        data = yf.download(tickers, start=start, progress=False)
-        
-        if data is None or data.empty:
-            return None
-
-        # Fix the "Sunday Gap" by carrying forward Friday's data
-        data = data.ffill()
-        
-        return data
+        return _load_history(MARKET_TICKERS, start)
     except Exception:
         return None
 
+# ALPHA_SWARM_COMPACT_PANEL=1 holds the served frame as a float32 CompactPanel
+COMPACT_PANEL = os.environ.get("ALPHA_SWARM_COMPACT_PANEL", "") == "1"
+
+def _refresh_market_data():
+    data = fetch_market_data.refresh(max_age=REFRESH_INTERVAL)
+    if COMPACT_PANEL and data is not None:
+        return column_store.CompactPanel.from_frame(data)
+    return data
+
+_market_refresher = refresher.BackgroundRefresher(_refresh_market_data, REFRESH_INTERVAL)
+
+def get_market_data():
+    """Serves the last good market frame; a background thread keeps it fresh."""
+    return _market_refresher.get()
+
+# --- ROLLING CORRELATION ---
+# Everything moving together is the classic crash tell, so the average
+# pairwise correlation of daily returns is a governance input. The streaming
+# engine lives in src/correlation.py.
+CORR_TICKERS = [t for t in MARKET_TICKERS if t != "^VIX"]  # VIX is a level, not a traded return
+
+@memoize_indicator
+def calc_avg_correlation(closes, window=correlation.CORR_WINDOW):
+    """Average pairwise rolling correlation of daily returns for a date x ticker close matrix."""
+    return correlation.avg_correlation(closes, window)
+
+@memoize_indicator
 def calc_governance(data):
-    """Calculates the 'Traffic Light' safety status with smoothed logic."""
+    """Calculates the 'Traffic Light' safety status with smoothed logic.
+
+    The returned frame carries the full-history Gov_Level (index into
+    GOV_LEVEL_NAMES) and Gov_Reason (index into GOV_STATES) columns.
+    """
     try:
         closes = data['Close']
-        df = pd.DataFrame(index=closes.index)
         
         # --- CALCULATE METRICS ---
-        df['Credit_Ratio'] = closes["HYG"] / closes["IEF"]
-        df['Credit_Delta'] = df['Credit_Ratio'].pct_change(10)
-        
-        if "^VIX" in closes.columns:
-            df['VIX'] = closes["^VIX"]
-        else:
-            df['VIX'] = 0.0
+        df = governance_inputs(closes)
+        # Input only for now: not scored until thresholds are tuned on it
+        df['Avg_Corr'] = calc_avg_correlation(closes[[t for t in CORR_TICKERS if t in closes.columns]])
 
-        df['Breadth_Ratio'] = closes["RSP"] / closes["SPY"]
-        df['Breadth_Delta'] = df['Breadth_Ratio'].pct_change(20)
-        df['DXY_Delta'] = closes["DX-Y.NYB"].pct_change(5)
-        
-        # --- DEFINE TRIGGERS ---
-        CREDIT_TRIG = -0.015  # -1.5% widening
-        VIX_PANIC = 25.0      # Increased from 24 to 25 for stability
-        BREADTH_TRIG = -0.025
-        DXY_SPIKE = 0.02
-        
-        # --- LOGIC GATES ---
-        # 1. Structural Stress (Credit or Dollar)
-        stress_signal = ((df['Credit_Delta'] < CREDIT_TRIG) | (df['DXY_Delta'] > DXY_SPIKE)).fillna(False)
-        
-        # 2. VIX Panic
-        vix_signal = (df['VIX'] > VIX_PANIC).fillna(False)
-        
-        # 3. Breadth Breakdown
-        breadth_signal = (df['Breadth_Delta'] < BREADTH_TRIG).fillna(False)
-        
-        if not df.empty:
-            latest = df.iloc[-1]
-            l_stress = stress_signal.iloc[-1]
-            l_vix = vix_signal.iloc[-1]
-            l_breadth = breadth_signal.iloc[-1]
-        else:
+        # --- DETERMINE STATUS (The Tuned Logic, every day at once) ---
+        reasons = score_governance(df['Credit_Delta'], df['VIX'], df['Breadth_Delta'], df['DXY_Delta'])
+        df['Gov_Reason'] = reasons
+        df['Gov_Level'] = GOV_LEVEL_BY_REASON[reasons]
+
+        if df.empty:
             return df, "SYSTEM BOOT", "#888888", "Initializing..."
 
-        # --- DETERMINE STATUS (The Tuned Logic) ---
-        
-        # RED: Requires Stress + VIX Panic (The Confirmation Rule)
-        if l_stress and l_vix:
-             return df, "DEFENSIVE MODE", "#f93e3e", "Structural Failure Confirmed"
-             
-        # OR RED: If VIX is simply massive (>30)
-        elif latest['VIX'] > 30:
-             return df, "DEFENSIVE MODE", "#f93e3e", "Extreme Volatility"
-
-        # YELLOW: Stress Detected (but VIX < 25) OR Breadth Warning
-        elif l_stress:
-             return df, "CAUTION", "#ffaa00", "Credit/Currency Stress"
-        elif l_vix:
-             return df, "CAUTION", "#ffaa00", "Elevated Volatility"
-        elif l_breadth:
-             return df, "WATCHLIST", "#f1c40f", "Market Breadth Narrowing"
-             
-        # GREEN: All Clear
-        else: 
-            return df, "COMFORT ZONE", "#00d26a", "System Integrity Nominal"
+        status, color, reason = GOV_STATES[reasons[-1]]
+        return df, status, color, reason
             
     except Exception:
         safe_df = pd.DataFrame()
         return safe_df, "DATA ERROR", "#888888", "Feed Disconnected"
 
+class GovernanceEngine:
+    """Streaming version of calc_governance that rescores in O(1) per new bar.
+
+    Ring buffers hold only the lookbacks the deltas need (10 credit, 20
+    breadth, 5 dollar), so polling intraday never touches the full history.
+    Average correlation streams through a CorrelationEngine.
+    """
+
+    CREDIT_LOOKBACK = CREDIT_LOOKBACK
+    BREADTH_LOOKBACK = BREADTH_LOOKBACK
+    DXY_LOOKBACK = DXY_LOOKBACK
+    CORR_LOOKBACK = correlation.CORR_WINDOW
+
+    def __init__(self, **thresholds):
+        self.thresholds = thresholds
+        self._credit = deque(maxlen=self.CREDIT_LOOKBACK + 1)
+        self._breadth = deque(maxlen=self.BREADTH_LOOKBACK + 1)
+        self._dxy = deque(maxlen=self.DXY_LOOKBACK + 1)
+        self._corr = correlation.CorrelationEngine(CORR_TICKERS, self.CORR_LOOKBACK)
+        self.latest = None
+
+    @classmethod
+    def from_history(cls, closes, **thresholds):
+        """Warms the buffers from the tail of a Close frame shaped like fetch_market_data()['Close']."""
+        engine = cls(**thresholds)
+        warmup = max(cls.CREDIT_LOOKBACK, cls.BREADTH_LOOKBACK, cls.DXY_LOOKBACK, cls.CORR_LOOKBACK) + 1
+        for _, row in closes.tail(warmup).iterrows():
+            engine.update(row)
+        return engine
+
+    @staticmethod
+    def _push(buffer, value, new_bar):
+        if not new_bar and buffer:
+            buffer.pop()  # Revised print of the bar we already have
+        buffer.append(value)
+        if len(buffer) < buffer.maxlen:
+            return np.nan
+        return value / buffer[0] - 1
+
+    def update(self, closes, new_bar=True):
+        """Feeds one bar of closes (ticker -> price). Pass new_bar=False to revise the current bar."""
+        vix = closes["^VIX"] if "^VIX" in closes else 0.0
+        credit_delta = self._push(self._credit, closes["HYG"] / closes["IEF"], new_bar)
+        breadth_delta = self._push(self._breadth, closes["RSP"] / closes["SPY"], new_bar)
+        dxy_delta = self._push(self._dxy, closes["DX-Y.NYB"], new_bar)
+        avg_corr = self._corr.update(pd.Series(closes), new_bar)
+
+        code = int(score_governance(credit_delta, vix, breadth_delta, dxy_delta, **self.thresholds))
+        self.latest = {
+            'Credit_Delta': credit_delta, 'VIX': vix, 'Breadth_Delta': breadth_delta,
+            'DXY_Delta': dxy_delta, 'Avg_Corr': avg_corr, 'Gov_Reason': code, 'Gov_Level': int(GOV_LEVEL_BY_REASON[code]),
+        }
+        return GOV_STATES[code]
+
+# --- BATCH GOVERNANCE ACROSS PROXY UNIVERSES ---
+# One row per universe. Ticker columns name the proxies in the close matrix;
+# threshold columns are optional and fall back to the live triggers.
+DEFAULT_UNIVERSE = {
+    'name': "US Core", 'credit_risky': "HYG", 'credit_safe': "IEF", 'vix': "^VIX",
+    'breadth_eq': "RSP", 'breadth_mkt': "SPY", 'dollar': "DX-Y.NYB",
+}
+
+def _pct_change_2d(values, periods):
+    out = np.full(values.shape, np.nan)
+    out[periods:] = values[periods:] / values[:-periods] - 1
+    return out
+
+def _proxy_matrix(matrix, columns, tickers, fill):
+    idx = columns.get_indexer(pd.Index(tickers).fillna(""))
+    out = matrix[:, idx]
+    out[:, idx < 0] = fill  # Universe has no such proxy
+    return out
+
+def calc_governance_panel(closes, universes):
+    """Runs the traffic-light rules for many proxy universes in one vectorized pass.
+
+    closes is a wide date x ticker close matrix; universes is a DataFrame
+    (or list of dicts) shaped like DEFAULT_UNIVERSE with optional threshold
+    columns. Returns (reasons, levels) date x universe frames of codes
+    indexing GOV_STATES and GOV_LEVEL_NAMES.
+    """
+    cfg = pd.DataFrame(universes).reset_index(drop=True)
+    matrix = closes.to_numpy(dtype=float)
+    cols = closes.columns
+
+    credit_ratio = _proxy_matrix(matrix, cols, cfg['credit_risky'], np.nan) / _proxy_matrix(matrix, cols, cfg['credit_safe'], np.nan)
+    breadth_ratio = _proxy_matrix(matrix, cols, cfg['breadth_eq'], np.nan) / _proxy_matrix(matrix, cols, cfg['breadth_mkt'], np.nan)
+    vix = _proxy_matrix(matrix, cols, cfg.get('vix', pd.Series([None] * len(cfg))), 0.0)
+    dollar = _proxy_matrix(matrix, cols, cfg.get('dollar', pd.Series([None] * len(cfg))), np.nan)
+
+    # Thresholds broadcast as one row per universe
+    thresholds = {
+        key: cfg[key].fillna(default).to_numpy(dtype=float) if key in cfg else default
+        for key, default in GOV_THRESHOLD_DEFAULTS.items()
+    }
+    with np.errstate(divide='ignore', invalid='ignore'):
+        codes = score_governance(
+            _pct_change_2d(credit_ratio, GovernanceEngine.CREDIT_LOOKBACK), vix,
+            _pct_change_2d(breadth_ratio, GovernanceEngine.BREADTH_LOOKBACK),
+            _pct_change_2d(dollar, GovernanceEngine.DXY_LOOKBACK), **thresholds
+        )
+
+    names = cfg['name'] if 'name' in cfg else cfg.index
+    reasons = pd.DataFrame(codes, index=closes.index, columns=list(names))
+    levels = pd.DataFrame(GOV_LEVEL_BY_REASON[codes], index=closes.index, columns=list(names))
+    return reasons, levels
+
 # --- STANDARD MATH FUNCTIONS ---
-def calc_ppo(price):
+@memoize_indicator
+def calc_ppo(price, fast=12, slow=26, signal=9):
     if isinstance(price, pd.DataFrame): price = price.iloc[:, 0]
-    ema12 = price.ewm(span=12, adjust=False).mean()
-    ema26 = price.ewm(span=26, adjust=False).mean()
+    ema12 = price.ewm(span=fast, adjust=False).mean()
+    ema26 = price.ewm(span=slow, adjust=False).mean()
     ppo_line = ((ema12 - ema26) / ema26) * 100
-    signal_line = ppo_line.ewm(span=9, adjust=False).mean()
+    signal_line = ppo_line.ewm(span=signal, adjust=False).mean()
     hist = ppo_line - signal_line
     return ppo_line, signal_line, hist
 
-def calc_cone(price):
+# --- MATRIX EMA (many tickers at once) ---
+EMA_BLOCK = 32  # Rows per matrix-multiply block: bigger blocks waste flops on the triangular kernel
+
+def _ema_kernel(alpha, size):
+    i = np.arange(size)
+    lags = i[:, None] - i[None, :]
+    kernel = np.where(lags >= 0, alpha * (1 - alpha) ** np.maximum(lags, 0), 0.0)
+    carry = (1 - alpha) ** (i + 1)
+    return kernel, carry
+
+def ema_matrix(values, span):
+    """EMA down the rows of a 2-D array, matching pandas ewm(span=span, adjust=False).mean() per column.
+
+    Gap-free stretches are solved a block of rows at a time with one matrix
+    multiply (y = K @ x + carry * y_prev); only rows with interior NaNs fall
+    back to the row-by-row pandas recurrence, so there is no per-ticker loop.
+    """
+    x = np.asarray(values, dtype=float)
+    squeeze = x.ndim == 1
+    if squeeze:
+        x = x[:, None]
+    n, m = x.shape
+    out = np.empty((n, m))
+    if n == 0:
+        return out[:, 0] if squeeze else out
+
+    alpha = 2.0 / (span + 1.0)
+    valid = ~np.isnan(x)
+    # Only columns that don't print on row 0 need their leading gap handled
+    late = np.flatnonzero(~valid[0])
+    first = valid[:, late].argmax(axis=0)
+    empty = late[~valid[first, late]]
+    if late.size:
+        # An EMA of a constant is that constant, so back-filling each column's
+        # first print lets every column start at row 0 without changing results
+        lead = np.arange(n)[:, None] < first[None, :]
+        x = x.copy()
+        x[:, late] = np.where(lead, x[first, late], x[:, late])
+        x[:, empty] = 0.0
+        valid[:, late] |= lead
+        valid[:, empty] = True
+
+    gaps = np.flatnonzero(~valid.all(axis=1))
+    kernel, carry = _ema_kernel(alpha, EMA_BLOCK)
+    w = x[0].copy()
+    old_wt = np.ones(m)
+    out[0] = w
+    decaying = False
+    i = 1
+    while i < n:
+        next_gap = gaps[np.searchsorted(gaps, i)] if gaps.size and gaps[-1] >= i else n
+        if next_gap == i or decaying:
+            # pandas ignore_na=False: weights keep decaying across missing prints
+            xi = x[i]
+            obs = ~np.isnan(xi)
+            old_wt = old_wt * (1 - alpha)
+            w = np.where(obs, (old_wt * w + alpha * xi) / (old_wt + alpha), w)
+            old_wt = np.where(obs, 1.0, old_wt)
+            decaying = not obs.all()
+            out[i] = w
+            i += 1
+        else:
+            j = min(i + EMA_BLOCK, next_gap)
+            k = j - i
+            block = out[i:j]
+            np.matmul(kernel[:k, :k], x[i:j], out=block)
+            block += carry[:k, None] * w
+            w = block[-1]
+            i = j
+
+    if late.size:
+        out[:, late] = np.where(lead, np.nan, out[:, late])
+        out[:, empty] = np.nan
+    return out[:, 0] if squeeze else out
+
+@memoize_indicator
+def calc_ppo_panel(closes, fast=12, slow=26, signal=9):
+    """calc_ppo for every column of a date x ticker close frame in one pass."""
+    values = closes.to_numpy(dtype=float)
+    ema_fast = ema_matrix(values, fast)
+    ema_slow = ema_matrix(values, slow)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ppo_line = ((ema_fast - ema_slow) / ema_slow) * 100
+    signal_line = ema_matrix(ppo_line, signal)
+    frame = lambda v: pd.DataFrame(v, index=closes.index, columns=closes.columns)
+    return frame(ppo_line), frame(signal_line), frame(ppo_line - signal_line)
+
+@memoize_indicator
+def calc_cone(price, window=20, z=1.28):
     if isinstance(price, pd.DataFrame): price = price.iloc[:, 0]
-    window = 20
     sma = price.rolling(window=window).mean()
     std = price.rolling(window=window).std()
-    upper_band = sma + (1.28 * std)
-    lower_band = sma - (1.28 * std)
+    upper_band = sma + (z * std)
+    lower_band = sma - (z * std)
     return sma, std, upper_band, lower_band
 
+@memoize_indicator
+def calc_cone_panel(closes, windows=(10, 20, 50), z_levels=(1.28,)):
+    """calc_cone for every ticker, window and band width from one pass of cumulative sums.
+
+    Returns {window: (sma, std, {z: (upper, lower)})} of date x ticker frames,
+    matching pandas rolling mean/std (ddof=1, full windows only).
+    """
+    values = closes.to_numpy(dtype=float)
+    n = values.shape[0]
+    valid = ~np.isnan(values)
+    # Center on each column's first print so the running sums stay small
+    ref = np.nan_to_num(values[valid.argmax(axis=0), np.arange(values.shape[1])]) if n else np.zeros(values.shape[1])
+    dev = np.where(valid, values - ref, 0.0)
+    zero = np.zeros((1, values.shape[1]))
+    count_cum = np.vstack([zero, np.cumsum(valid, axis=0)])
+    sum_cum = np.vstack([zero, np.cumsum(dev, axis=0)])
+    sq_cum = np.vstack([zero, np.cumsum(dev * dev, axis=0)])
+
+    frame = lambda v: pd.DataFrame(v, index=closes.index, columns=closes.columns)
+    cones = {}
+    for window in windows:
+        sma = np.full(values.shape, np.nan)
+        std = np.full(values.shape, np.nan)
+        if 1 < window <= n:
+            count = count_cum[window:] - count_cum[:-window]
+            total = sum_cum[window:] - sum_cum[:-window]
+            sq = sq_cum[window:] - sq_cum[:-window]
+            full = count == window
+            mean_dev = total / window
+            var = np.maximum((sq - window * mean_dev * mean_dev) / (window - 1), 0.0)
+            sma[window - 1:] = np.where(full, mean_dev + ref, np.nan)
+            std[window - 1:] = np.where(full, np.sqrt(var), np.nan)
+        bands = {z: (frame(sma + z * std), frame(sma - z * std)) for z in z_levels}
+        cones[window] = (frame(sma), frame(std), bands)
+    return cones
+
 def generate_forecast(start_date, last_price, last_std, days=30):
     future_dates = [start_date + timedelta(days=i) for i in range(1, days + 1)]
     drift = 0.0003
@@ -122,7 +465,73 @@ def generate_forecast(start_date, last_price, last_std, days=30):
     future_lower = future_mean - width
     return future_dates, future_mean.tolist(), future_upper.tolist(), future_lower.tolist()
 
-@st.cache_data(ttl=3600)
+@memoize_indicator
+def generate_forecast_mc(price, days=30, n_paths=20000, block_size=5, lookback=756, band=(10, 90), seed=0):
+    """Monte Carlo version of generate_forecast from a block bootstrap of historical log returns.
+
+    All paths are simulated as one (n_paths, days) array: random block starts
+    are drawn up front, the returns gathered with fancy indexing and
+    compounded with a cumulative sum. Each step is one trading day's return,
+    so `days` counts trading days and the dates are the business days after
+    the last close. Returns (dates, median, upper, lower) where upper/lower
+    are the `band` percentiles of simulated price.
+    """
+    if isinstance(price, pd.DataFrame): price = price.iloc[:, 0]
+    price = price.dropna()
+    returns = np.diff(np.log(price.to_numpy(dtype=float)[-(lookback + 1):]))
+    future_dates = list(pd.bdate_range(price.index[-1] + pd.offsets.BDay(1), periods=days))
+    last_price = float(price.iloc[-1])
+    if returns.size < block_size:
+        flat = [last_price] * days
+        return future_dates, flat, flat, flat
+
+    rng = np.random.default_rng(seed)
+    n_blocks = -(-days // block_size)
+    # Day-major layout keeps each day's paths contiguous for the percentile pass
+    starts = rng.integers(0, returns.size - block_size + 1, size=(n_blocks, 1, n_paths))
+    idx = (starts + np.arange(block_size)[None, :, None]).reshape(-1, n_paths)[:days]
+    log_paths = np.cumsum(returns[idx], axis=0)
+
+    # exp() is monotonic, so take percentiles in log space and only exponentiate the bands.
+    # One sort per day beats np.percentile's multi-kth partition by ~3x here.
+    log_paths.sort(axis=1)
+    pos = np.array([band[0], 50, band[1]]) / 100 * (n_paths - 1)
+    lo, frac = np.floor(pos).astype(int), pos % 1
+    hi = np.minimum(lo + 1, n_paths - 1)
+    bands = log_paths[:, lo] * (1 - frac) + log_paths[:, hi] * frac
+    lower, median, upper = last_price * np.exp(bands.T)
+    return future_dates, median.tolist(), upper.tolist(), lower.tolist()
+
+# --- SECTOR DATA ---
+# assets/sector_map.json lists ~10 constituents per sector. The rotation and
+# breadth engines (src/sector_rotation.py, src/breadth.py) run on the close
+# matrix fetch_sector_data() returns.
+SECTOR_MAP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sector_map.json")
+SECTOR_BENCHMARK = "SPY"
+SECTOR_HISTORY_DAYS = 730
+
+def load_sector_map(path=SECTOR_MAP_PATH):
+    """{sector: [tickers]} from assets/sector_map.json."""
+    with open(path) as f:
+        return json.load(f)
+
+def sector_universe(sector_map):
+    """Every constituent once, in map order."""
+    return list(dict.fromkeys(t for members in sector_map.values() for t in members))
+
+@cache_backend.shared_cache(ttl=CACHE_TTL)
+def fetch_sector_data():
+    """Close matrix for every sector map constituent plus the benchmark, from the local price store."""
+    try:
+        tickers = sector_universe(load_sector_map()) + [SECTOR_BENCHMARK]
+        start = (datetime.now() - timedelta(days=SECTOR_HISTORY_DAYS)).strftime('%Y-%m-%d')
+        data = _load_history(tickers, start)
+        return None if data is None else data['Close']
+    except Exception:
+        return None
+
+# A local CSV: cheap to read, and operators edit it, so cache per process only
+@cache_backend.process_cache(ttl=CACHE_TTL)
 def load_strategist_data():
     try:
         root_dir = os.path.dirname(os.path.abspath(__file__))
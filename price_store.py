@@ -0,0 +1,138 @@
+import os
+import tempfile
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+# --- LOCAL COLUMNAR PRICE STORE ---
+# One Parquet file per ticker holding the full daily OHLCV history.
+# fetch_market_data reads from here first and only asks the network
+# for what each ticker is missing: bars after its last stored date, or
+# its whole history when the file does not reach back to the start asked for.
+# yfinance back-adjusts every earlier bar on each dividend and split, so the
+# re-pulled overlap bars are compared with the stored ones; a ticker whose
+# settled bars moved is re-downloaded whole and its file replaced.
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "market_store")
+TOP_UP_OVERLAP_DAYS = 3  # Re-pull the last few bars in case the final one was a partial session
+BACKFILL_SLACK_DAYS = 7  # A first bar this close to the requested start counts as covering it (weekends, holidays)
+ADJUSTMENT_RTOL = 1e-4  # Settled closes further apart than this mean the history was re-adjusted
+
+
+def get_store_dir():
+    return os.environ.get("ALPHA_SWARM_STORE_DIR", DEFAULT_STORE_DIR)
+
+
+class PriceStore:
+    """Per-ticker Parquet files of daily bars, merged into yfinance-shaped frames on read."""
+
+    def __init__(self, store_dir=None):
+        self.store_dir = store_dir or get_store_dir()
+
+    def _path(self, ticker):
+        # Tickers like ^VIX, GC=F and DX-Y.NYB are not all filename-safe
+        return os.path.join(self.store_dir, quote(ticker, safe="") + ".parquet")
+
+    def read(self, ticker):
+        path = self._path(ticker)
+        if not os.path.exists(path):
+            return None
+        try:
+            frame = pd.read_parquet(path)
+        except Exception:
+            return None
+        return frame if not frame.empty else None
+
+    def write(self, ticker, frame):
+        os.makedirs(self.store_dir, exist_ok=True)
+        path = self._path(ticker)
+        # A unique temp file per call: threads and processes may write the same ticker
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=self.store_dir)
+        os.close(fd)
+        try:
+            frame.to_parquet(tmp_path)
+            # Atomic swap so concurrent readers never see a half-written file
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def date_range(self, ticker):
+        """(first, last) stored dates, or None if nothing is stored."""
+        frame = self.read(ticker)
+        return None if frame is None else (frame.index.min(), frame.index.max())
+
+    def last_date(self, ticker):
+        stored = self.date_range(ticker)
+        return None if stored is None else stored[1]
+
+    def top_up_starts(self, tickers, default_start):
+        """{ticker: earliest date the network must be asked for} so each ticker covers default_start onwards.
+
+        Tickers with nothing stored, or whose file starts after default_start,
+        get the full range; the rest only need the bars after their last date.
+        """
+        default_start = pd.Timestamp(default_start)
+        starts = {}
+        for ticker in tickers:
+            stored = self.date_range(ticker)
+            if stored is None or stored[0] > default_start + pd.Timedelta(days=BACKFILL_SLACK_DAYS):
+                starts[ticker] = default_start
+            else:
+                starts[ticker] = max(stored[1] - pd.Timedelta(days=TOP_UP_OVERLAP_DAYS), default_start)
+        return starts
+
+    def rebased_tickers(self, data):
+        """Tickers in a (field, ticker) download whose closes disagree with the stored ones on shared dates.
+
+        The last stored bar is skipped: it may have been a partial session.
+        """
+        rebased = []
+        if data is None or data.empty or not isinstance(data.columns, pd.MultiIndex):
+            return rebased
+        for ticker in data.columns.get_level_values(1).unique():
+            stored = self.read(ticker)
+            if stored is None or "Close" not in stored.columns or ("Close", ticker) not in data.columns:
+                continue
+            settled = stored["Close"].iloc[:-1]
+            fresh = data[("Close", ticker)].dropna()
+            shared = settled.index.intersection(fresh.index)
+            if not np.allclose(fresh[shared].to_numpy(dtype=float), settled[shared].to_numpy(dtype=float),
+                               rtol=ADJUSTMENT_RTOL, equal_nan=True):
+                rebased.append(ticker)
+        return rebased
+
+    def update(self, data, replace=()):
+        """Splits a (field, ticker) download frame and merges each ticker into its file.
+
+        Tickers in `replace` overwrite their file instead of merging into it.
+        """
+        if data is None or data.empty or not isinstance(data.columns, pd.MultiIndex):
+            return
+        for ticker in data.columns.get_level_values(1).unique():
+            fresh = data.xs(ticker, axis=1, level=1).dropna(how="all")
+            if fresh.empty:
+                continue
+            existing = None if ticker in replace else self.read(ticker)
+            if existing is not None:
+                # Newer download wins on overlapping dates
+                existing = existing[~existing.index.isin(fresh.index)]
+                fresh = pd.concat([existing, fresh]).sort_index()
+            self.write(ticker, fresh)
+
+    def load(self, tickers, start=None):
+        """Returns a (field, ticker) MultiIndex frame like yf.download, or None if nothing is stored."""
+        frames = {}
+        for ticker in tickers:
+            frame = self.read(ticker)
+            if frame is None:
+                continue
+            if start is not None:
+                frame = frame[frame.index >= pd.Timestamp(start)]
+            frames[ticker] = frame
+        if not frames:
+            return None
+        data = pd.concat(frames, axis=1).swaplevel(0, 1, axis=1)
+        data.columns.names = ["Price", "Ticker"]
+        return data.sort_index(axis=1, level=0, sort_remaining=False).sort_index()
@@ -0,0 +1,73 @@
+import time
+import threading
+
+# --- STALE-WHILE-REVALIDATE ---
+# Holds the last good value from a loader and re-fetches it on a daemon
+# thread before it expires, so page loads never block on the network once
+# the first value is in and a failed refresh never replaces good data.
+
+
+class BackgroundRefresher:
+    """Serves the last good loader result and refreshes it every `interval` seconds in the background."""
+
+    def __init__(self, loader, interval):
+        self.loader = loader
+        self.interval = interval
+        self.last_success = None
+        self.last_error = None
+        self._value = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get(self):
+        """Returns the held value, loading synchronously only on a cold start."""
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self.refresh()
+        if self._value is not None:
+            self._ensure_thread()
+        return self._value
+
+    def refresh(self):
+        """Runs the loader once; the held value is only replaced by a good result."""
+        try:
+            value = self.loader()
+        except Exception as e:
+            value = None
+            self.last_error = e
+        if value is None:
+            return False
+        self._value = value
+        self.last_success = time.time()
+        self.last_error = None
+        return True
+
+    def _thread_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_thread(self):
+        if self._thread_alive():
+            return
+        # Every session thread calls get(): only one of them may start the refresher
+        with self._lock:
+            if self._thread_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="alpha-swarm-refresher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            age = time.time() - (self.last_success or 0)
+            # After a failure retry sooner, but don't hammer the feed
+            wait = self.interval - age if age < self.interval else min(60, self.interval)
+            if self._stop.wait(max(wait, 0)):
+                break
+            self.refresh()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
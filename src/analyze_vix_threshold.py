@@ -3,11 +3,24 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
+import sys
 
-def analyze_vix():
-    print("Starting VIX Threshold Analysis...")
+try:
+    from src import data_provider, event_study, history_archive
+except ImportError:  # Run as a script from inside src/
+    import data_provider
+    import event_study
+    import history_archive
 
-    # 1. Fetch data
+# --- SURFACE SCAN ---
+SCAN_THRESHOLDS = list(range(15, 46))
+SCAN_HORIZONS = (21, 63, "90D", 126)
+SCAN_BOOT = 500
+APP_VIX_LEVELS = (25, 30)  # logic.VIX_PANIC and the VIX_EXTREME override
+
+
+def fetch_vix_spx():
+    """10 years of aligned ^VIX and ^GSPC closes as a VIX/SP500 frame, or None."""
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365*10 + 100) # Extra buffer
 
@@ -15,10 +28,10 @@ def analyze_vix():
 
     tickers = ["^VIX", "^GSPC"]
     try:
-        data = yf.download(tickers, start=start_date, end=end_date, progress=False)
+        data = history_archive.fetch_history(tickers, start_date, end_date, source=data_provider.get_provider(yf))
     except Exception as e:
         print(f"Error downloading data: {e}")
-        return
+        return None
 
     # Handle MultiIndex columns
     # yfinance returns MultiIndex columns: (Price, Ticker)
@@ -33,20 +46,25 @@ def analyze_vix():
     if "^VIX" not in closes.columns or "^GSPC" not in closes.columns:
         print("Error: Could not find ^VIX or ^GSPC in downloaded data.")
         print(f"Columns found: {closes.columns}")
-        return
-
-    vix = closes["^VIX"]
-    sp500 = closes["^GSPC"]
-
-    # 2. Identify crossings
-    # VIX > 24 AND Prev(VIX) <= 24
+        return None
 
     # Create a DataFrame for analysis
-    df = pd.DataFrame({
-        'VIX': vix,
-        'SP500': sp500
+    return pd.DataFrame({
+        'VIX': closes["^VIX"],
+        'SP500': closes["^GSPC"]
     }).dropna()
 
+
+def analyze_vix():
+    print("Starting VIX Threshold Analysis...")
+
+    # 1. Fetch data
+    df = fetch_vix_spx()
+    if df is None:
+        return
+
+    # 2. Identify crossings
+    # VIX > 24 AND Prev(VIX) <= 24
     df['VIX_Prev'] = df['VIX'].shift(1)
     df['Cross_Above_24'] = (df['VIX'] > 24) & (df['VIX_Prev'] <= 24)
 
@@ -56,41 +74,23 @@ def analyze_vix():
 
     results = []
 
+    # Forward 3-month (90 calendar day) return and worst close for every day at once
+    horizon = "90D"
+    fwd_returns, fwd_minima = event_study.forward_matrices(df['SP500'], horizons=(horizon,))
+
     for date in crossing_dates:
         # Get S&P 500 price on that date
         try:
             price_t0 = df.loc[date, 'SP500']
+            pct_return = fwd_returns.at[date, horizon]
 
-            # Find price 3 months later (approx 90 calendar days)
-            target_date = date + timedelta(days=90)
-
-            # Find nearest trading day at or after target_date
-            # Using searchsorted for efficient binary search on the index
-            idx_pos = df.index.searchsorted(target_date)
-
-            if idx_pos >= len(df):
+            if np.isnan(pct_return):
                 print(f"Skipping {date.date()}: Not enough future data (less than 3 months left).")
                 continue
 
-            date_t3m = df.index[idx_pos]
-            price_t3m = df.iloc[idx_pos]['SP500']
-
-            # Calculate return
-            pct_return = (price_t3m - price_t0) / price_t0
-
-            # Calculate Max Drawdown in the 3 month period
-            # Period from date (exclusive) to date_t3m (inclusive)
-            # Find the start index (first date > date)
-            start_idx = df.index.searchsorted(date, side='right')
-            # End index is idx_pos (inclusive), so slice up to idx_pos + 1
-            period_data = df.iloc[start_idx : idx_pos + 1]
-
-            if period_data.empty:
-                max_drawdown = 0.0
-            else:
-                # Measure min price in period vs t0 price.
-                min_price = period_data['SP500'].min()
-                max_drawdown = (min_price - price_t0) / price_t0
+            price_t3m = price_t0 * (1 + pct_return)
+            # Min close after the event through the 3 month date, vs t0 price
+            max_drawdown = fwd_minima.at[date, horizon]
 
             # Determine outcome description
             outcome_parts = []
@@ -184,5 +184,79 @@ def analyze_vix():
 
     print(f"Analysis saved to {output_path}")
 
+def scan_vix_surface(df, thresholds=SCAN_THRESHOLDS, horizons=SCAN_HORIZONS, n_boot=SCAN_BOOT):
+    """Event stats for VIX crossing each threshold, over each horizon.
+
+    The forward return and forward-min matrices are built once and shared
+    by every threshold. Returns {stat: threshold x horizon frame} for
+    Events, Win_Rate, Mean, Median, Mean_Min and the Mean CI bounds.
+    """
+    forward = event_study.forward_matrices(df['SP500'], horizons)
+    rows = {}
+    for level in thresholds:
+        trigger = event_study.crossings(df['VIX'], level)
+        _, summary = event_study.event_study(df['SP500'], trigger, n_boot=n_boot, forward=forward)
+        rows[level] = summary
+    stats = pd.concat(rows, names=["Threshold"])
+    return {name: stats[name].unstack("Horizon")[list(horizons)]
+            for name in ["Events", "Win_Rate", "Mean", "Median", "Mean_Min", "Mean_Lo", "Mean_Hi"]}
+
+
+def _heat(win_rate):
+    if np.isnan(win_rate):
+        return "⚪"
+    return "🟢" if win_rate >= 0.6 else "🟡" if win_rate >= 0.4 else "🔴"
+
+
+def surface_markdown(surface):
+    """Heatmap tables (win rate + mean return, then mean drawdown) for a scan_vix_surface result."""
+    horizons = list(surface["Win_Rate"].columns)
+    header = "| VIX Cross | " + " | ".join(str(h) for h in horizons) + " |\n"
+    header += "|---" * (len(horizons) + 1) + "|\n"
+
+    def label(level):
+        return f"**{level}** (app)" if level in APP_VIX_LEVELS else str(level)
+
+    md = "### Win Rate / Mean Return (events)\n\n" + header
+    for level in surface["Win_Rate"].index:
+        cells = []
+        for h in horizons:
+            win, mean, n = surface["Win_Rate"].at[level, h], surface["Mean"].at[level, h], surface["Events"].at[level, h]
+            cells.append("--" if n == 0 else f"{_heat(win)} {win:.0%} / {mean:+.1%} ({n})")
+        md += f"| {label(level)} | " + " | ".join(cells) + " |\n"
+
+    md += "\n### Mean Max Drawdown\n\n" + header
+    for level in surface["Mean_Min"].index:
+        cells = ["--" if np.isnan(v) else f"{v:.1%}" for v in surface["Mean_Min"].loc[level]]
+        md += f"| {label(level)} | " + " | ".join(cells) + " |\n"
+    return md
+
+
+def scan_vix():
+    print("Starting VIX Threshold Surface Scan...")
+    df = fetch_vix_spx()
+    if df is None:
+        return None
+
+    surface = scan_vix_surface(df)
+
+    md_content = "# VIX Threshold Surface: Crossing Level x Horizon\n\n"
+    md_content += "S&P 500 behaviour after the VIX closes above each level (previous close at or below it), "
+    md_content += "over the last 10 years. Horizons are trading days, or calendar days where marked D. "
+    md_content += "Cells show win rate / mean return (event count); 🟢 >= 60% wins, 🔴 < 40%. "
+    md_content += f"Rows in bold are the app's thresholds (VIX_PANIC {APP_VIX_LEVELS[0]}, extreme override {APP_VIX_LEVELS[1]}).\n\n"
+    md_content += surface_markdown(surface)
+
+    output_path = "docs/VIX_Threshold_Surface.md"
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w") as f:
+        f.write(md_content)
+
+    print(f"Surface saved to {output_path}")
+    return surface
+
 if __name__ == "__main__":
-    analyze_vix()
+    if "--scan" in sys.argv:
+        scan_vix()
+    else:
+        analyze_vix()
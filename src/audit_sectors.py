@@ -1,6 +1,11 @@
 import yfinance as yf
 import pandas as pd
-import concurrent.futures
+
+try:
+    from src import data_provider, sector_metadata
+except ImportError:  # Run as a script from inside src/
+    import data_provider
+    import sector_metadata
 
 # --- INPUT: DAD'S LIST (Add more here) ---
 # For now, I put in a mix of common ETFs and Stocks to test.
@@ -17,10 +22,11 @@ sector_counts = {}
 missing_data = []
 
 def fetch_sector_info(ticker):
-    """Fetches sector info for a single ticker."""
+    """Fetches sector info for a single ticker (uncached, rate limited)."""
     try:
-        # Fetch info from Yahoo
-        info = yf.Ticker(ticker).info
+        sector_metadata.rate_limiter.acquire()
+        # Fetch info from the configured provider (Yahoo by default)
+        info = data_provider.get_provider(yf).info(ticker)
         
         # Get Sector (or 'ETF' if it's a fund)
         sector = info.get('sector', 'Unknown/ETF')
@@ -29,29 +35,24 @@ def fetch_sector_info(ticker):
         return ticker, None, e
 
 if __name__ == '__main__':
+    # The hand-picked list plus every symbol the dashboard maps to a sector
+    universe = sector_metadata.load_universe()
+    tickers = list(dict.fromkeys(tickers + list(universe)))
     print(f"🔍 Auditing {len(tickers)} tickers for GICS Sector coverage...")
     print("-" * 50)
-    
-    # Use ThreadPoolExecutor for concurrent requests
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit all tasks
-        future_to_ticker = {executor.submit(fetch_sector_info, ticker): ticker for ticker in tickers}
-
-        # Process as they complete
-        for future in concurrent.futures.as_completed(future_to_ticker):
-            ticker, sector, error = future.result()
 
-            if error:
-                print(f"❌ {ticker}: Failed ({error})")
-                missing_data.append(ticker)
-            else:
-                # Count it
-                if sector in sector_counts:
-                    sector_counts[sector] += 1
-                else:
-                    sector_counts[sector] = 1
+    # Cached for a week and rate limited, so warm re-runs are near instant
+    for ticker, info in sector_metadata.get_universe_info(tickers).items():
+        if info is None:
+            print(f"❌ {ticker}: Failed")
+            missing_data.append(ticker)
+            continue
 
-                print(f"✅ {ticker}: {sector}")
+        # Get Sector (or 'ETF' if it's a fund)
+        sector = info.get('sector') or 'Unknown/ETF'
+        sector_counts[sector] = sector_counts.get(sector, 0) + 1
+        mapped = f" (mapped: {universe[ticker]})" if ticker in universe else ""
+        print(f"✅ {ticker}: {sector}{mapped}")
 
     print("-" * 50)
     print("📊 FINAL SECTOR BREAKDOWN")
@@ -0,0 +1,116 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+try:
+    from src import indicator_memo
+except ImportError:  # Run as a script from inside src/
+    import indicator_memo
+
+# --- CONSTITUENT BREADTH ---
+# Participation across a universe of names (by default the sector map):
+# percent above moving averages, 52-week new highs/lows, the advance/decline
+# line and a McClellan-style oscillator. The batch version works on the
+# whole date x ticker matrix with rolling windows and cumulative sums; the
+# streaming BreadthEngine keeps only the trailing window and updates in
+# O(tickers) per bar.
+BREADTH_MA_WINDOWS = (50, 200)
+HIGH_LOW_WINDOW = 252
+MCCLELLAN_SPANS = (19, 39)  # The classic 10% and 5% smoothing constants
+
+
+def _mcclellan(net, spans):
+    fast, slow = (pd.Series(net).ewm(span=span, adjust=False).mean().to_numpy() for span in spans)
+    return fast - slow
+
+
+@indicator_memo.memoize_indicator
+def calc_breadth(closes, ma_windows=BREADTH_MA_WINDOWS, high_low_window=HIGH_LOW_WINDOW, mcclellan_spans=MCCLELLAN_SPANS):
+    """Breadth series for a date x ticker close matrix.
+
+    Columns: Pct_Above_<n> for each MA window (share of names with a full
+    window that close above it), New_Highs/New_Lows (closes at the
+    high_low_window extreme), Advances, Declines, AD_Line and McClellan.
+    """
+    values = closes.to_numpy(dtype=float)
+    out = pd.DataFrame(index=closes.index)
+    with np.errstate(invalid='ignore'):
+        for window in ma_windows:
+            ma = closes.rolling(window).mean().to_numpy()
+            has_ma = ~np.isnan(ma)
+            out[f'Pct_Above_{window}'] = 100 * (values > ma).sum(axis=1) / has_ma.sum(axis=1)
+
+        out['New_Highs'] = (values >= closes.rolling(high_low_window).max().to_numpy()).sum(axis=1)
+        out['New_Lows'] = (values <= closes.rolling(high_low_window).min().to_numpy()).sum(axis=1)
+
+        change = np.full_like(values, np.nan)
+        change[1:] = values[1:] - values[:-1]
+        advances = (change > 0).sum(axis=1)
+        declines = (change < 0).sum(axis=1)
+    out['Advances'] = advances
+    out['Declines'] = declines
+    net = (advances - declines).astype(float)
+    out['AD_Line'] = np.cumsum(net)
+    out['McClellan'] = _mcclellan(net, mcclellan_spans)
+    return out
+
+
+class BreadthEngine:
+    """Streaming version of calc_breadth; each bar costs O(window x tickers), not O(history)."""
+
+    def __init__(self, tickers, ma_windows=BREADTH_MA_WINDOWS, high_low_window=HIGH_LOW_WINDOW,
+                 mcclellan_spans=MCCLELLAN_SPANS):
+        self.tickers = pd.Index(tickers)
+        self.ma_windows = ma_windows
+        self.high_low_window = high_low_window
+        self.alphas = [2.0 / (span + 1) for span in mcclellan_spans]
+        self._rows = deque(maxlen=max(max(ma_windows), high_low_window, 2))
+        self._state = None   # (ad_line, ema_fast, ema_slow) after the latest bar
+        self._before = None  # ... and before it, so the bar can be revised
+        self.latest = None
+
+    @classmethod
+    def from_history(cls, closes, **params):
+        """Replays a close matrix so the engine continues exactly where calc_breadth ends."""
+        engine = cls(closes.columns, **params)
+        for _, row in closes.iterrows():
+            engine.update(row)
+        return engine
+
+    def update(self, closes, new_bar=True):
+        """Feeds one bar of closes (ticker -> price). Pass new_bar=False to revise the current bar."""
+        row = closes.reindex(self.tickers).to_numpy(dtype=float)
+        if not new_bar and self._rows:
+            self._rows.pop()
+            self._state = self._before
+        self._before = self._state
+        self._rows.append(row)
+        window = np.array(self._rows)
+
+        latest = {}
+        with np.errstate(invalid='ignore'):
+            for w in self.ma_windows:
+                ma = window[-w:].mean(axis=0) if len(window) >= w else np.full_like(row, np.nan)
+                latest[f'Pct_Above_{w}'] = 100 * (row > ma).sum() / (~np.isnan(ma)).sum()
+            full = len(window) >= self.high_low_window
+            recent = window[-self.high_low_window:]
+            latest['New_Highs'] = int((row >= recent.max(axis=0)).sum()) if full else 0
+            latest['New_Lows'] = int((row <= recent.min(axis=0)).sum()) if full else 0
+            change = row - window[-2] if len(window) > 1 else np.full_like(row, np.nan)
+            latest['Advances'] = int((change > 0).sum())
+            latest['Declines'] = int((change < 0).sum())
+
+        net = float(latest['Advances'] - latest['Declines'])
+        if self._state is None:
+            ad_line, fast, slow = net, net, net
+        else:
+            ad_line, fast, slow = self._state
+            ad_line += net
+            fast += self.alphas[0] * (net - fast)
+            slow += self.alphas[1] * (net - slow)
+        self._state = (ad_line, fast, slow)
+        latest['AD_Line'] = ad_line
+        latest['McClellan'] = fast - slow
+        self.latest = latest
+        return latest
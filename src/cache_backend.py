@@ -0,0 +1,248 @@
+import os
+import time
+import uuid
+import pickle
+import sqlite3
+import hashlib
+import functools
+import threading
+from contextlib import contextmanager
+
+# --- SHARED CROSS-PROCESS CACHE ---
+# Replaces per-process st.cache_data for the expensive loaders so every
+# Streamlit replica on a host shares one fetch per TTL window. The default
+# backend is a SQLite file; a Redis-style service only has to implement
+# the CacheBackend methods and be installed with set_cache_backend().
+# Loaders of cheap local files use process_cache instead: an in-memory
+# cache per process, so edits to those files show up after a restart.
+# ALPHA_SWARM_CACHE=none turns both off (tests/conftest.py does this).
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache", "alpha_swarm_cache.sqlite")
+LOCK_LEASE_SECONDS = 120  # A crashed holder's lock is ignored after this
+LOCK_WAIT_SECONDS = 60    # Give up waiting and fetch anyway rather than hang the page
+
+_backend = None
+
+
+class CacheBackend:
+    """Interface for a cache shared between processes.
+
+    get() returns (value, stored_at) or None when missing or expired.
+    lock() is a context manager giving single-flight across processes.
+    """
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self, key):
+        yield
+
+
+class NullCacheBackend(CacheBackend):
+    """Caches nothing. Used when ALPHA_SWARM_CACHE=none (e.g. in tests)."""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl):
+        pass
+
+    def delete(self, key):
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Values in a dict, private to this process and gone on restart."""
+
+    def __init__(self):
+        self._entries = {}
+        self._guard = threading.Lock()
+
+    def get(self, key):
+        with self._guard:
+            entry = self._entries.get(key)
+        if entry is None or entry[2] < time.time():
+            return None
+        return entry[0], entry[1]
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        with self._guard:
+            self._entries[key] = (value, now, now + ttl)
+
+    def delete(self, key):
+        with self._guard:
+            self._entries.pop(key, None)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Pickled values in a local SQLite file, safe for many processes on one host."""
+
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_CACHE_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, stored_at REAL, expires_at REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, owner TEXT, expires_at REAL)")
+
+    @contextmanager
+    def _connect(self):
+        """One transaction on a fresh connection, closed on exit (a bare sqlite3 `with` only commits)."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        with self._connect() as conn:
+            row = conn.execute("SELECT value, stored_at, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or row[2] < time.time():
+            return None
+        return pickle.loads(row[0]), row[1]
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", (key, blob, now, now + ttl))
+
+    def delete(self, key):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    @contextmanager
+    def lock(self, key):
+        owner = uuid.uuid4().hex
+        deadline = time.time() + LOCK_WAIT_SECONDS
+        acquired = False
+        try:
+            while not acquired and time.time() < deadline:
+                now = time.time()
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM locks WHERE key = ? AND expires_at < ?", (key, now))
+                    cur = conn.execute("INSERT OR IGNORE INTO locks VALUES (?, ?, ?)", (key, owner, now + LOCK_LEASE_SECONDS))
+                    acquired = cur.rowcount == 1
+                if not acquired:
+                    time.sleep(0.1)
+        except sqlite3.Error:
+            pass  # Proceed unlocked; worst case two replicas fetch once each
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    with self._connect() as conn:
+                        conn.execute("DELETE FROM locks WHERE key = ? AND owner = ?", (key, owner))
+                except sqlite3.Error:
+                    pass  # The lease expires on its own
+
+
+def set_cache_backend(backend):
+    """Installs a backend for this process (e.g. a Redis implementation)."""
+    global _backend
+    _backend = backend
+
+
+def _cache_disabled():
+    return os.environ.get("ALPHA_SWARM_CACHE", "").lower() in ("none", "off", "0")
+
+
+def get_cache_backend():
+    global _backend
+    if _backend is not None:
+        return _backend
+    setting = os.environ.get("ALPHA_SWARM_CACHE", "")
+    if _cache_disabled():
+        return NullCacheBackend()
+    try:
+        _backend = SQLiteCacheBackend(setting or None)
+    except Exception:
+        # Unwritable disk: behave like no cache rather than break the page
+        return NullCacheBackend()
+    return _backend
+
+
+_process_backend = MemoryCacheBackend()
+
+
+def get_process_backend():
+    """The in-process backend behind process_cache (a NullCacheBackend when caching is off)."""
+    return NullCacheBackend() if _cache_disabled() else _process_backend
+
+
+def make_key(func, args, kwargs):
+    raw = f"{func.__module__}.{func.__qualname__}:{args!r}:{sorted(kwargs.items())!r}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _safe_get(backend, key):
+    try:
+        return backend.get(key)
+    except Exception:
+        return None
+
+
+def shared_cache(ttl):
+    """Decorator memoizing a loader in the shared backend. None results are never cached."""
+    return _memoize(ttl, lambda: get_cache_backend())
+
+
+def process_cache(ttl):
+    """Like shared_cache, but the cache lives in this process only."""
+    return _memoize(ttl, lambda: get_process_backend())
+
+
+def _memoize(ttl, backend_for_call):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            backend = backend_for_call()
+            key = make_key(func, args, kwargs)
+            hit = _safe_get(backend, key)
+            if hit is not None:
+                return hit[0]
+            with backend.lock(key):
+                # Another replica may have filled it while we waited
+                hit = _safe_get(backend, key)
+                if hit is not None:
+                    return hit[0]
+                value = func(*args, **kwargs)
+                if value is not None:
+                    try:
+                        backend.set(key, value, ttl)
+                    except Exception:
+                        pass  # Still serve the fresh value even if it can't be shared
+                return value
+
+        def refresh(*args, max_age=0, **kwargs):
+            """Re-runs the loader unless the shared entry is younger than max_age seconds.
+
+            Lets background refreshers in many replicas agree on one fetch per window.
+            """
+            backend = backend_for_call()
+            key = make_key(func, args, kwargs)
+            with backend.lock(key):
+                hit = _safe_get(backend, key)
+                if hit is not None and time.time() - hit[1] < max_age:
+                    return hit[0]
+                value = func(*args, **kwargs)
+                if value is not None:
+                    try:
+                        backend.set(key, value, ttl)
+                    except Exception:
+                        pass
+                return value
+
+        wrapper.refresh = refresh
+        return wrapper
+    return decorator
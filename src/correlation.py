@@ -0,0 +1,128 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# --- ROLLING CORRELATION ---
+# Everything moving together is the classic crash tell, so the average
+# pairwise correlation of daily returns is a governance input. The engine
+# keeps the windowed sums behind every pair's correlation (count, sum, sum of
+# squares, cross products) as ticker x ticker matrices and updates them with
+# rank-1 adds and drops, so a bar costs O(tickers^2) whatever the window.
+# A pair only uses rows where both tickers have a return, like
+# DataFrame.rolling().corr(). Works on any close matrix, e.g. the market
+# tickers joined with logic.fetch_sector_data().
+
+CORR_WINDOW = 21
+
+
+class CorrelationEngine:
+    """Rolling correlation of daily returns across `tickers`, updated in O(tickers^2) per bar."""
+
+    def __init__(self, tickers, window=CORR_WINDOW, min_periods=None):
+        self.tickers = pd.Index(tickers)
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        n = len(self.tickers)
+        self._count, self._sum, self._sumsq, self._cross = (np.zeros((n, n)) for _ in range(4))
+        self._returns = deque()
+        self._closes = deque(maxlen=2)
+        self._evicted = None  # Return row the latest bar pushed out, restored on revision
+        self.latest = np.nan
+
+    @classmethod
+    def from_history(cls, closes, **params):
+        """Replays a close matrix so the engine continues exactly where avg_correlation ends."""
+        engine = cls(closes.columns, **params)
+        for row in closes.to_numpy(dtype=float):
+            engine.update(row)
+        return engine
+
+    def _apply(self, rows, signs):
+        """Adds (sign +1) or drops (sign -1) return rows; one matrix product per sum."""
+        rows = np.atleast_2d(rows)
+        valid = ~np.isnan(rows)
+        x = np.where(valid, rows, 0.0)
+        m = valid.astype(float)
+        signs = np.asarray(signs, dtype=float)[:, None]
+        sm = signs * m
+        self._count += m.T @ sm
+        self._sum += x.T @ sm  # [i, j]: sum of i's returns on rows j also has one
+        self._sumsq += (x * x).T @ sm
+        self._cross += x.T @ (signs * x)
+
+    def update(self, closes, new_bar=True):
+        """Feeds one bar of closes (Series by ticker, or an array in ticker order) and
+        returns the average pairwise correlation. Pass new_bar=False to revise the current bar."""
+        if isinstance(closes, pd.Series):
+            closes = closes.reindex(self.tickers)
+        row = np.asarray(closes, dtype=float)
+        changes, signs = [], []
+        if not new_bar and self._returns:
+            changes.append(self._returns.pop())
+            signs.append(-1)
+            self._closes.pop()
+            if self._evicted is not None:
+                self._returns.appendleft(self._evicted)
+                changes.append(self._evicted)
+                signs.append(1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = row / self._closes[-1] - 1 if self._closes else np.full_like(row, np.nan)
+        self._closes.append(row)
+        self._returns.append(returns)
+        changes.append(returns)
+        signs.append(1)
+        self._evicted = None
+        if len(self._returns) > self.window:
+            self._evicted = self._returns.popleft()
+            changes.append(self._evicted)
+            signs.append(-1)
+        self._apply(np.array(changes), signs)
+
+        self.latest = self.average()
+        return self.latest
+
+    def _corr(self):
+        n = self._count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = self._cross - self._sum * self._sum.T / n
+            var = self._sumsq - self._sum ** 2 / n
+            corr = np.clip(cov / np.sqrt(var * var.T), -1.0, 1.0)
+        corr[n < self.min_periods] = np.nan
+        return corr
+
+    def matrix(self):
+        """Current ticker x ticker correlation matrix (NaN for pairs short of min_periods)."""
+        return pd.DataFrame(self._corr(), index=self.tickers, columns=self.tickers)
+
+    def average(self):
+        """Mean of the off-diagonal correlations that are defined, or NaN if none are."""
+        # Tickers short of min_periods have no defined pairs
+        active = np.flatnonzero(np.diagonal(self._count) >= self.min_periods)
+        size = active.size
+        if size < 2:
+            return np.nan
+        block = np.ix_(active, active) if size < len(self.tickers) else np.s_[:, :]
+        n = self._count[block]
+        if n.min() == n.max():
+            # Every active ticker has a return on the same rows: the correlation matrix
+            # is D^-1/2 C D^-1/2, and its total is a quadratic form in the inverse vols
+            k = n[0, 0]
+            sums = np.diagonal(self._sum)[active]
+            var = np.diagonal(self._sumsq)[active] - sums ** 2 / k
+            if (var > 0).all():
+                u = 1.0 / np.sqrt(var)
+                total = u @ self._cross[block] @ u - (u @ sums) ** 2 / k
+                return (total - size) / (size * (size - 1))
+        corr = self._corr()[block]
+        pairs = corr[~np.eye(size, dtype=bool)]
+        pairs = pairs[~np.isnan(pairs)]
+        return pairs.mean() if pairs.size else np.nan
+
+
+def avg_correlation(closes, window=CORR_WINDOW):
+    """Average pairwise rolling correlation of daily returns for a date x ticker close matrix."""
+    engine = CorrelationEngine(closes.columns, window)
+    values = [engine.update(row) for row in closes.to_numpy(dtype=float)]
+    return pd.Series(values, index=closes.index, name='Avg_Corr', dtype=float)
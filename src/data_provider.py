@@ -0,0 +1,133 @@
+import os
+import json
+import time
+import random
+from urllib.parse import quote
+
+import pandas as pd
+
+# --- MARKET DATA PROVIDERS ---
+# Analytics ask a DataProvider for bars instead of calling yfinance directly,
+# so the network can be swapped for a local replay (load tests, benchmarks,
+# offline research) or a faster vendor without touching the analytics.
+#
+# Replay directories hold one Parquet file of daily bars per ticker, the
+# same layout as the dashboard's price store (data/market_store), plus an
+# optional info.json of per-ticker metadata.
+#
+#   ALPHA_SWARM_PROVIDER=replay:/path/to/dir   serve bars from disk
+#   ALPHA_SWARM_REPLAY_LATENCY=0.25            simulated seconds per call
+
+_provider = None
+
+
+class DataProvider:
+    """Interface every data source implements."""
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        """Daily OHLCV as a (field, ticker) MultiIndex frame like yf.download, or None."""
+        raise NotImplementedError
+
+    def info(self, ticker):
+        """Metadata dict for one ticker (e.g. 'sector'), like yf.Ticker(t).info."""
+        raise NotImplementedError
+
+
+class YFinanceProvider(DataProvider):
+    """Live Yahoo Finance. Callers may hand in their own yfinance module import."""
+
+    def __init__(self, yf_module=None):
+        if yf_module is None:
+            import yfinance as yf_module
+        self.yf = yf_module
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        kwargs.setdefault("progress", False)
+        return self.yf.download(tickers, start=start, end=end, **kwargs)
+
+    def info(self, ticker):
+        return self.yf.Ticker(ticker).info
+
+
+class ReplayProvider(DataProvider):
+    """Serves recorded bars from disk with optional simulated latency."""
+
+    def __init__(self, root_dir, latency=0.0, jitter=0.0):
+        self.root_dir = root_dir
+        self.latency = latency
+        self.jitter = jitter
+
+    def _wait(self):
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _path(self, ticker):
+        return os.path.join(self.root_dir, quote(ticker, safe="") + ".parquet")
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        self._wait()
+        if isinstance(tickers, str):
+            tickers = tickers.split()
+        frames = {}
+        for ticker in tickers:
+            path = self._path(ticker)
+            if not os.path.exists(path):
+                continue
+            frame = pd.read_parquet(path)
+            if start is not None:
+                frame = frame[frame.index >= pd.Timestamp(start)]
+            if end is not None:
+                frame = frame[frame.index < pd.Timestamp(end)]  # yf.download's end is exclusive
+            frames[ticker] = frame
+        if not frames:
+            return None
+        data = pd.concat(frames, axis=1).swaplevel(0, 1, axis=1)
+        data.columns.names = ["Price", "Ticker"]
+        return data.sort_index(axis=1, level=0, sort_remaining=False).sort_index()
+
+    def info(self, ticker):
+        self._wait()
+        path = os.path.join(self.root_dir, "info.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f).get(ticker, {})
+
+
+def record_replay(source, tickers, root_dir, start=None, end=None, with_info=False):
+    """Captures bars (and optionally metadata) from `source` into a replay directory."""
+    os.makedirs(root_dir, exist_ok=True)
+    data = source.download(tickers, start=start, end=end)
+    if data is not None and not data.empty:
+        for ticker in data.columns.get_level_values(1).unique():
+            frame = data.xs(ticker, axis=1, level=1).dropna(how="all")
+            if not frame.empty:
+                frame.to_parquet(os.path.join(root_dir, quote(ticker, safe="") + ".parquet"))
+    if with_info:
+        info = {}
+        for ticker in tickers:
+            try:
+                info[ticker] = dict(source.info(ticker))
+            except Exception:
+                continue
+        with open(os.path.join(root_dir, "info.json"), "w") as f:
+            json.dump(info, f, default=str)
+    return data
+
+
+def set_provider(provider):
+    """Installs a provider for this process; None restores the environment default."""
+    global _provider
+    _provider = provider
+
+
+def get_provider(yf_module=None):
+    """The installed provider, else the one ALPHA_SWARM_PROVIDER names, else yfinance."""
+    if _provider is not None:
+        return _provider
+    setting = os.environ.get("ALPHA_SWARM_PROVIDER", "")
+    if setting.startswith("replay:"):
+        latency = float(os.environ.get("ALPHA_SWARM_REPLAY_LATENCY", "0") or 0)
+        return ReplayProvider(setting[len("replay:"):], latency=latency)
+    return YFinanceProvider(yf_module)
@@ -0,0 +1,142 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# --- EVENT STUDY ENGINE ---
+# Generalizes analyze_vix: for any boolean trigger over a price series, how
+# did the price behave over the following horizons? Forward returns and
+# forward minima are computed for every day at once. Minima come from a
+# sparse table of strided rolling mins, O(n log n) to build and O(1) per
+# window, so a trigger only selects rows and a scan over many triggers
+# reuses the same matrices.
+#
+# Horizons are ints (trading days ahead) or calendar offsets such as "90D"
+# (first trading day at or after date + offset, as analyze_vix does).
+
+DEFAULT_HORIZONS = (21, 63, 126, "90D")
+N_BOOT = 2000
+CI = (5, 95)
+BOOT_BLOCK = 256  # Resamples drawn per block, bounding the counts matrix at BOOT_BLOCK x events
+
+
+def crossings(series, level):
+    """True on days `series` closes above `level` after closing at or below it the day before."""
+    return (series > level) & (series.shift(1) <= level)
+
+
+def horizon_targets(index, horizon):
+    """Row each day's horizon lands on; len(index) where it runs past the data."""
+    n = len(index)
+    if isinstance(horizon, (int, np.integer)):
+        return np.minimum(np.arange(n) + int(horizon), n)
+    return index.searchsorted(index + pd.Timedelta(horizon))
+
+
+def _sparse_min(values):
+    """levels[k][i] = min(values[i : i + 2**k])."""
+    levels = [values]
+    span = 1
+    while 2 * span <= len(values):
+        prev = levels[-1]
+        levels.append(np.fmin(prev[:-span], prev[span:]))
+        span *= 2
+    return levels
+
+
+def _range_min(levels, lo, hi):
+    """min(values[lo:hi]) per row for vectors of bounds with hi > lo."""
+    k = np.floor(np.log2(hi - lo)).astype(int)
+    out = np.empty(len(lo))
+    for level in np.unique(k):
+        rows = k == level
+        table = levels[level]
+        out[rows] = np.fmin(table[lo[rows]], table[hi[rows] - (1 << level)])
+    return out
+
+
+def forward_matrices(prices, horizons=DEFAULT_HORIZONS):
+    """(returns, minima): date x horizon frames for every day in `prices`.
+
+    returns  price at the horizon vs the day's close
+    minima   lowest close after the day, through the horizon, vs the day's close
+             (positive if it never traded below; the max-drawdown column)
+    Both are NaN where the horizon runs past the data.
+    """
+    prices = prices.dropna()
+    values = prices.to_numpy(dtype=float)
+    n = len(values)
+    rets = np.full((n, len(horizons)), np.nan)
+    mins = np.full((n, len(horizons)), np.nan)
+    levels = _sparse_min(values) if n else []
+    for j, horizon in enumerate(horizons):
+        target = horizon_targets(prices.index, horizon)
+        ok = target < n
+        rows = np.flatnonzero(ok)
+        rets[rows, j] = values[target[rows]] / values[rows] - 1.0
+        mins[rows, j] = _range_min(levels, rows + 1, target[rows] + 1) / values[rows] - 1.0
+    columns = pd.Index(list(horizons), name="Horizon")
+    return (pd.DataFrame(rets, index=prices.index, columns=columns),
+            pd.DataFrame(mins, index=prices.index, columns=columns))
+
+
+def bootstrap_mean_ci(values, n_boot=N_BOOT, ci=CI, seed=0):
+    """Percentile CI of the column means of an events x horizons array, ignoring NaNs.
+
+    Each resample is drawn as multinomial counts per event, so its means are
+    one matrix product against the NaN-zeroed values and the validity mask:
+    memory grows with n_boot x events, never n_boot x events x horizons.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    k, h = values.shape
+    if k == 0:
+        return np.full(h, np.nan), np.full(h, np.nan)
+    rng = np.random.default_rng(seed)
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    weight = valid.astype(float)
+    means = np.empty((n_boot, h))
+    for lo in range(0, n_boot, BOOT_BLOCK):
+        counts = rng.multinomial(k, np.full(k, 1.0 / k), size=min(BOOT_BLOCK, n_boot - lo)).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means[lo:lo + len(counts)] = (counts @ filled) / (counts @ weight)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lo, hi = np.nanpercentile(means, ci, axis=0)
+    return lo, hi
+
+
+def summarize_events(returns, minima, n_boot=N_BOOT, ci=CI, seed=0):
+    """Per-horizon stats for event rows of the forward matrices, with bootstrap CIs."""
+    r = returns.to_numpy(dtype=float)
+    m = minima.to_numpy(dtype=float)
+    valid = ~np.isnan(r)
+    wins = np.where(valid, r > 0, np.nan)
+    stats = {"Events": valid.sum(axis=0)}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # Horizons with no complete events are NaN
+        if len(r):
+            stats.update(Mean=np.nanmean(r, axis=0), Median=np.nanmedian(r, axis=0),
+                         Win_Rate=np.nanmean(wins, axis=0), Mean_Min=np.nanmean(m, axis=0),
+                         Worst_Min=np.nanmin(m, axis=0))
+        else:
+            stats.update(dict.fromkeys(["Mean", "Median", "Win_Rate", "Mean_Min", "Worst_Min"], np.nan))
+        stats["Mean_Lo"], stats["Mean_Hi"] = bootstrap_mean_ci(r, n_boot, ci, seed)
+        stats["Win_Lo"], stats["Win_Hi"] = bootstrap_mean_ci(wins, n_boot, ci, seed)
+    return pd.DataFrame(stats, index=returns.columns)
+
+
+def event_study(prices, trigger, horizons=DEFAULT_HORIZONS, n_boot=N_BOOT, ci=CI, seed=0, forward=None):
+    """Forward behaviour of `prices` after each day `trigger` is True.
+
+    Pass `forward` (the forward_matrices() pair) to reuse it across triggers.
+    Returns (events, summary): per-event Return/Min columns keyed by horizon,
+    and summarize_events() of them.
+    """
+    returns, minima = forward if forward is not None else forward_matrices(prices, horizons)
+    mask = trigger.reindex(returns.index, fill_value=False).fillna(False).to_numpy(dtype=bool)
+    ev_returns, ev_minima = returns[mask], minima[mask]
+    events = pd.concat({"Return": ev_returns, "Min": ev_minima}, axis=1)
+    return events, summarize_events(ev_returns, ev_minima, n_boot, ci, seed)
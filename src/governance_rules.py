@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+# --- GOVERNANCE TRIGGERS ---
+# The traffic-light rules on their own, with no data loading or app state:
+# logic.calc_governance and GovernanceEngine score the live feed with them,
+# and the research engines (threshold_sweep, walk_forward) replay history.
+CREDIT_TRIG = -0.015  # -1.5% widening
+VIX_PANIC = 25.0      # Increased from 24 to 25 for stability
+VIX_EXTREME = 30.0
+BREADTH_TRIG = -0.025
+DXY_SPIKE = 0.02
+
+# Reason codes index into GOV_STATES, in rule priority order
+GOV_STATES = [
+    ("DEFENSIVE MODE", "#f93e3e", "Structural Failure Confirmed"),
+    ("DEFENSIVE MODE", "#f93e3e", "Extreme Volatility"),
+    ("CAUTION", "#ffaa00", "Credit/Currency Stress"),
+    ("CAUTION", "#ffaa00", "Elevated Volatility"),
+    ("WATCHLIST", "#f1c40f", "Market Breadth Narrowing"),
+    ("COMFORT ZONE", "#00d26a", "System Integrity Nominal"),
+]
+GOV_LEVEL_NAMES = ["COMFORT ZONE", "WATCHLIST", "CAUTION", "DEFENSIVE MODE"]
+GOV_LEVEL_BY_REASON = np.array([3, 3, 2, 2, 1, 0])
+
+
+def score_governance(credit_delta, vix, breadth_delta, dxy_delta,
+                     credit_trig=CREDIT_TRIG, vix_panic=VIX_PANIC, breadth_trig=BREADTH_TRIG,
+                     dxy_spike=DXY_SPIKE, vix_extreme=VIX_EXTREME):
+    """Vectorized traffic-light rules. Returns reason codes (see GOV_STATES) shaped like the inputs."""
+    credit_delta, vix, breadth_delta, dxy_delta = (
+        np.asarray(x, dtype=float) for x in (credit_delta, vix, breadth_delta, dxy_delta)
+    )
+    # NaN compares False, same as the old fillna(False)
+    with np.errstate(invalid='ignore'):
+        # 1. Structural Stress (Credit or Dollar)
+        stress_signal = (credit_delta < credit_trig) | (dxy_delta > dxy_spike)
+        # 2. VIX Panic
+        vix_signal = vix > vix_panic
+        extreme_vix = vix > vix_extreme
+        # 3. Breadth Breakdown
+        breadth_signal = breadth_delta < breadth_trig
+
+    # RED needs Stress + VIX Panic (the Confirmation Rule) or a massive VIX;
+    # YELLOW is Stress or VIX alone; Breadth alone is only a Watchlist.
+    return np.select(
+        [stress_signal & vix_signal, extreme_vix, stress_signal, vix_signal, breadth_signal],
+        [0, 1, 2, 3, 4],
+        default=5,
+    )
+
+GOV_THRESHOLD_DEFAULTS = {
+    'credit_trig': CREDIT_TRIG, 'vix_panic': VIX_PANIC, 'breadth_trig': BREADTH_TRIG,
+    'dxy_spike': DXY_SPIKE, 'vix_extreme': VIX_EXTREME,
+}
+# Days behind each delta
+CREDIT_LOOKBACK = 10
+BREADTH_LOOKBACK = 20
+DXY_LOOKBACK = 5
+
+
+
+def governance_inputs(closes):
+    """Credit, VIX, breadth and dollar metrics score_governance reads, for a date x ticker close matrix."""
+    df = pd.DataFrame(index=closes.index)
+    df['Credit_Ratio'] = closes["HYG"] / closes["IEF"]
+    df['Credit_Delta'] = df['Credit_Ratio'].pct_change(CREDIT_LOOKBACK)
+
+    if "^VIX" in closes.columns:
+        df['VIX'] = closes["^VIX"]
+    else:
+        df['VIX'] = 0.0
+
+    df['Breadth_Ratio'] = closes["RSP"] / closes["SPY"]
+    df['Breadth_Delta'] = df['Breadth_Ratio'].pct_change(BREADTH_LOOKBACK)
+    df['DXY_Delta'] = closes["DX-Y.NYB"].pct_change(DXY_LOOKBACK)
+    return df
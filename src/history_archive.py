@@ -0,0 +1,197 @@
+import os
+import json
+import shutil
+import tempfile
+import time
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+try:
+    from src import data_provider
+except ImportError:  # Run as a script from inside src/
+    import data_provider
+
+# --- MEMORY-MAPPED HISTORY ARCHIVE ---
+# Research tools replay decades of daily bars. Instead of downloading from
+# 2007 on every run, they open this archive, which holds one fixed-stride
+# binary file per ticker:
+#
+#   meta.json         fields, tickers and the requested start of the archive
+#   dates.npy         shared trading calendar (int64 ns), one entry per row
+#   <ticker>.f64      float64 rows of len(fields) values, aligned to dates.npy
+#
+# Files are opened with np.memmap on first touch, so a run only pages in
+# the date range it slices and every process shares the OS page cache.
+# Values stay float64 so studies match a live download to the last bit.
+#
+# Every write goes into a fresh version directory and then atomically
+# repoints the CURRENT file at it. A reader pins the version it read meta
+# from, so the files it maps later always match the calendar it holds,
+# however many rewrites happen meanwhile.
+#
+#   ALPHA_SWARM_ARCHIVE_DIR=/path/to/dir   route research downloads through
+#                                          an archive kept in this directory
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "history_archive")
+STALE_DAYS = 4  # Tolerates weekends and holidays before an archive counts as behind
+CURRENT_FILE = "CURRENT"
+
+
+def get_archive_dir():
+    return os.environ.get("ALPHA_SWARM_ARCHIVE_DIR") or DEFAULT_ARCHIVE_DIR
+
+
+class HistoryArchive(data_provider.DataProvider):
+    """Lazily memory-mapped daily bars; serves yf.download-shaped frames."""
+
+    def __init__(self, root_dir=None):
+        self.root_dir = root_dir or get_archive_dir()
+        self._reset()
+
+    def _reset(self):
+        self._version_dir = None
+        self._meta = None
+        self._dates = None
+        self._maps = {}
+
+    def _path(self, name):
+        return os.path.join(self.root_dir, name)
+
+    def _ticker_path(self, version_dir, ticker):
+        return os.path.join(version_dir, quote(ticker, safe="") + ".f64")
+
+    def _current_version(self):
+        try:
+            with open(self._path(CURRENT_FILE)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _load_meta(self):
+        if self._meta is None:
+            version = self._current_version()
+            if version is None:
+                return None
+            version_dir = self._path(version)
+            with open(os.path.join(version_dir, "meta.json")) as f:
+                self._meta = json.load(f)
+            self._dates = pd.DatetimeIndex(np.load(os.path.join(version_dir, "dates.npy")).view("datetime64[ns]"))
+            self._version_dir = version_dir
+        return self._meta
+
+    def _rows(self, ticker):
+        if ticker not in self._maps:
+            meta = self._meta
+            self._maps[ticker] = np.memmap(self._ticker_path(self._version_dir, ticker), dtype=np.float64, mode="r",
+                                           shape=(len(self._dates), len(meta["fields"])))
+        return self._maps[ticker]
+
+    @property
+    def tickers(self):
+        meta = self._load_meta()
+        return [] if meta is None else list(meta["tickers"])
+
+    @property
+    def start(self):
+        meta = self._load_meta()
+        return None if meta is None else pd.Timestamp(meta["start"])
+
+    def covers(self, tickers, start=None, end=None):
+        """True if every ticker and the whole [start, end) window are already archived."""
+        meta = self._load_meta()
+        if meta is None or not set(tickers) <= set(meta["tickers"]) or len(self._dates) == 0:
+            return False
+        if start is not None and pd.Timestamp(start) < pd.Timestamp(meta["start"]):
+            return False
+        end = pd.Timestamp(end) if end is not None else pd.Timestamp.now().normalize()
+        return self._dates[-1] >= end - pd.Timedelta(days=STALE_DAYS)
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        if isinstance(tickers, str):
+            tickers = tickers.split()
+        try:
+            return self._download(tickers, start, end)
+        except FileNotFoundError:
+            # Our pinned version was pruned by later writes: re-pin to the current one
+            self._reset()
+            return self._download(tickers, start, end)
+
+    def _download(self, tickers, start, end):
+        meta = self._load_meta()
+        if meta is None:
+            return None
+        tickers = [t for t in tickers if t in meta["tickers"]]
+        if not tickers:
+            return None
+        # Binary search the calendar, then touch only those rows of each file
+        lo = 0 if start is None else self._dates.searchsorted(pd.Timestamp(start))
+        hi = len(self._dates) if end is None else self._dates.searchsorted(pd.Timestamp(end))  # Exclusive, like yf
+        fields = meta["fields"]
+        block = np.stack([self._rows(t)[lo:hi] for t in tickers], axis=2)  # rows x fields x tickers
+        columns = pd.MultiIndex.from_product([fields, tickers], names=["Price", "Ticker"])
+        data = pd.DataFrame(block.reshape(hi - lo, -1), index=self._dates[lo:hi], columns=columns)
+        return data.dropna(how="all")
+
+    def info(self, ticker):
+        return {}
+
+    def write(self, data, start=None):
+        """Writes a (field, ticker) download frame as a new archive version and makes it current."""
+        os.makedirs(self.root_dir, exist_ok=True)
+        previous = self._current_version()
+        # Version names sort by creation time, which is what pruning goes by
+        version_dir = tempfile.mkdtemp(prefix=f"v{time.time_ns():020d}-", dir=self.root_dir)
+        data = data.sort_index()
+        fields = list(data.columns.get_level_values(0).unique())
+        tickers = list(data.columns.get_level_values(1).unique())
+        for ticker in tickers:
+            rows = data.xs(ticker, axis=1, level=1).reindex(columns=fields).to_numpy(dtype=np.float64)
+            np.ascontiguousarray(rows).tofile(self._ticker_path(version_dir, ticker))
+        np.save(os.path.join(version_dir, "dates.npy"), data.index.values.astype("datetime64[ns]").view(np.int64))
+        meta = {"fields": fields, "tickers": tickers,
+                "start": str(pd.Timestamp(start if start is not None else data.index[0]).date())}
+        with open(os.path.join(version_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+
+        # Atomic swap of the pointer; readers pinned to the old version keep reading it
+        fd, tmp_path = tempfile.mkstemp(prefix=CURRENT_FILE + ".", suffix=".tmp", dir=self.root_dir)
+        with os.fdopen(fd, "w") as f:
+            f.write(os.path.basename(version_dir))
+        os.replace(tmp_path, self._path(CURRENT_FILE))
+        self._prune(previous)
+        self._reset()
+
+    def _prune(self, previous):
+        """Deletes versions older than the one just replaced; it stays for readers still pinned to it."""
+        if previous is None:
+            return
+        for name in os.listdir(self.root_dir):
+            if name.startswith("v") and name < previous and os.path.isdir(self._path(name)):
+                shutil.rmtree(self._path(name), ignore_errors=True)
+
+def load_history(tickers, start, end=None, source=None, root_dir=None):
+    """Bars for `tickers` from the archive, downloading and archiving them first if missing.
+
+    Returns a (field, ticker) MultiIndex frame like yf.download, or None.
+    """
+    archive = HistoryArchive(root_dir)
+    if not archive.covers(tickers, start, end):
+        source = source or data_provider.get_provider()
+        # Re-pull the union so the archive keeps serving earlier callers too
+        wanted = list(dict.fromkeys(archive.tickers + list(tickers)))
+        first = pd.Timestamp(start) if archive.start is None else min(pd.Timestamp(start), archive.start)
+        fresh = source.download(wanted, start=first.strftime('%Y-%m-%d'))
+        if fresh is None or fresh.empty or not isinstance(fresh.columns, pd.MultiIndex):
+            return None
+        archive.write(fresh, start=first)
+    return archive.download(tickers, start=start, end=end)
+
+
+def fetch_history(tickers, start, end=None, source=None):
+    """Research entry point: archived bars when ALPHA_SWARM_ARCHIVE_DIR is set, else a plain download."""
+    source = source or data_provider.get_provider()
+    if not os.environ.get("ALPHA_SWARM_ARCHIVE_DIR"):
+        return source.download(tickers, start=start, end=end)
+    return load_history(tickers, start, end=end, source=source)
@@ -0,0 +1,72 @@
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# --- INDICATOR MEMO ---
+# Reruns hand the same frames to calc_ppo/calc_cone/calc_governance several
+# times per render. Results are memoized on a content hash of the inputs plus
+# the parameters, so each indicator is computed once per data version.
+# Cached results are shared: callers must not mutate them.
+INDICATOR_CACHE_SIZE = 64
+_indicator_cache = OrderedDict()
+_indicator_lock = threading.Lock()
+
+
+def data_fingerprint(obj):
+    """Content hash of a Series/DataFrame/CompactPanel (values, index and labels) or a dict/tuple of them."""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(obj, (pd.Series, pd.DataFrame)):
+        values = obj.to_numpy()
+        if values.dtype.kind in "fiub":
+            # Raw buffer hashing is ~10x faster than hash_pandas_object for price frames
+            h.update(repr(values.shape).encode())
+            h.update(np.ascontiguousarray(values).tobytes())
+        else:
+            h.update(pd.util.hash_pandas_object(obj, index=False).to_numpy().tobytes())
+        if isinstance(obj.index, pd.DatetimeIndex):
+            h.update(obj.index.asi8.tobytes())
+        else:
+            h.update(pd.util.hash_pandas_object(obj.index).to_numpy().tobytes())
+        labels = obj.columns if isinstance(obj, pd.DataFrame) else [obj.name]
+        h.update(repr(list(labels)).encode())
+    elif hasattr(type(obj), "content_hash"):  # column_store.CompactPanel
+        h.update(obj.content_hash().encode())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            h.update(repr(key).encode())
+            h.update(data_fingerprint(obj[key]).encode())
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            h.update(data_fingerprint(item).encode())
+    else:
+        h.update(repr(obj).encode())
+    return h.hexdigest()
+
+
+def memoize_indicator(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (f"{func.__module__}.{func.__qualname__}", data_fingerprint(args), data_fingerprint(kwargs))
+        except Exception:
+            return func(*args, **kwargs)
+        with _indicator_lock:
+            if key in _indicator_cache:
+                _indicator_cache.move_to_end(key)
+                return _indicator_cache[key]
+        result = func(*args, **kwargs)
+        with _indicator_lock:
+            _indicator_cache[key] = result
+            while len(_indicator_cache) > INDICATOR_CACHE_SIZE:
+                _indicator_cache.popitem(last=False)
+        return result
+    return wrapper
+
+
+def clear_indicator_cache():
+    with _indicator_lock:
+        _indicator_cache.clear()
@@ -0,0 +1,86 @@
+import os
+import json
+import time
+import threading
+import concurrent.futures
+
+import yfinance as yf
+
+try:
+    from src import cache_backend, data_provider
+except ImportError:  # Run as a script from inside src/
+    import cache_backend
+    import data_provider
+
+# --- SECTOR METADATA SERVICE ---
+# Ticker metadata (sector, industry, fund type) barely changes, but each
+# lookup is a slow, throttled Yahoo call. Lookups go through the shared
+# cache backend with a one-week TTL, so a warm audit of the whole
+# assets/sector_map.json universe is only local reads. Cold lookups run
+# on a small bounded pool behind one process-wide token bucket, which
+# keeps bursts under the upstream rate limit however many threads ask.
+
+SECTOR_MAP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "sector_map.json")
+SECTOR_CACHE_TTL = 7 * 24 * 3600
+MAX_WORKERS = 8
+RATE_PER_SECOND = 4.0  # Sustained Yahoo metadata calls
+RATE_BURST = 8
+INFO_FIELDS = ("sector", "industry", "quoteType", "shortName")
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate=RATE_PER_SECOND, capacity=RATE_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available, then takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+rate_limiter = TokenBucket()
+
+
+def load_universe(path=SECTOR_MAP_PATH):
+    """{ticker: sector} for every symbol in the sector map."""
+    with open(path) as f:
+        sector_map = json.load(f)
+    return {ticker: sector for sector, tickers in sector_map.items() for ticker in tickers}
+
+
+def fetch_info(ticker):
+    """One rate-limited upstream lookup, trimmed to INFO_FIELDS."""
+    rate_limiter.acquire()
+    info = data_provider.get_provider(yf).info(ticker) or {}
+    return {field: info.get(field) for field in INFO_FIELDS}
+
+
+@cache_backend.shared_cache(ttl=SECTOR_CACHE_TTL)
+def get_info(ticker):
+    """Cached metadata for one ticker, or None if the lookup failed (failures are not cached)."""
+    try:
+        return fetch_info(ticker)
+    except Exception:
+        return None
+
+
+def get_universe_info(tickers=None, workers=MAX_WORKERS):
+    """{ticker: metadata dict or None} for `tickers` (default: the whole sector map)."""
+    if tickers is None:
+        tickers = list(load_universe())
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(tickers, executor.map(get_info, tickers)))
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from src import indicator_memo
+except ImportError:  # Run as a script from inside src/
+    import indicator_memo
+
+# --- SECTOR ROTATION ---
+# Runs on one date x ticker close matrix (logic.fetch_sector_data()) and
+# the sector map (logic.load_sector_map()): sector composites are a single
+# matmul of daily returns against a ticker->sector membership matrix, and
+# relative strength, ranks and rotation-quadrant coordinates are column-wise
+# array math over sectors and constituents at once.
+ROTATION_LOOKBACKS = (21, 63, 126)
+RS_RATIO_WINDOW = 63     # RS-Ratio: relative strength vs its own moving average (100 = par)
+RS_MOMENTUM_WINDOW = 10  # RS-Momentum: RS-Ratio vs its value this many days ago
+# Index is 2 * (RS_Ratio > 100) + (RS_Momentum > 100)
+QUADRANTS = np.array(["Lagging", "Improving", "Weakening", "Leading"], dtype=object)
+
+
+def sector_composites(closes, sector_map):
+    """Equal-weight sector indices (start at 1.0) from daily constituent returns."""
+    sectors = list(sector_map)
+    position = {t: i for i, t in enumerate(closes.columns)}
+    member = np.zeros((closes.shape[1], len(sectors)))
+    for j, sector in enumerate(sectors):
+        for ticker in sector_map[sector]:
+            if ticker in position:
+                member[position[ticker], j] = 1.0
+
+    values = closes.to_numpy(dtype=float)
+    rets = np.full_like(values, np.nan)
+    rets[1:] = values[1:] / values[:-1] - 1.0
+    valid = ~np.isnan(rets)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sector_rets = (np.where(valid, rets, 0.0) @ member) / (valid @ member)
+    # Days before any constituent trades are flat
+    composite = np.cumprod(1.0 + np.nan_to_num(sector_rets), axis=0)
+    return pd.DataFrame(composite, index=closes.index, columns=sectors)
+
+
+def _rotation_table(prices, benchmark, lookbacks):
+    """Latest RS per lookback, composite rank and quadrant, plus RS-Ratio/RS-Momentum histories."""
+    rel = prices.div(benchmark, axis=0)
+    table = pd.DataFrame(index=prices.columns)
+    for lookback in lookbacks:
+        table[f"RS_{lookback}"] = rel.iloc[-1] / rel.iloc[-1 - lookback] - 1.0 if len(rel) > lookback else np.nan
+    table["Composite"] = table.mean(axis=1)
+    table["Rank"] = table["Composite"].rank(ascending=False, method="min")
+
+    ratio = 100 * rel / rel.rolling(RS_RATIO_WINDOW).mean()
+    momentum = 100 * ratio / ratio.shift(RS_MOMENTUM_WINDOW)
+    table["RS_Ratio"] = ratio.iloc[-1]
+    table["RS_Momentum"] = momentum.iloc[-1]
+    known = table["RS_Ratio"].notna() & table["RS_Momentum"].notna()
+    codes = 2 * (table["RS_Ratio"] > 100).to_numpy(dtype=int) + (table["RS_Momentum"] > 100).to_numpy(dtype=int)
+    table["Quadrant"] = np.where(known, QUADRANTS[codes], None)
+    return table, ratio, momentum
+
+
+@indicator_memo.memoize_indicator
+def calc_sector_rotation(closes, sector_map, benchmark="SPY", lookbacks=ROTATION_LOOKBACKS):
+    """Relative strength vs the benchmark, ranks and rotation quadrants for sectors and constituents.
+
+    Returns a dict:
+      'sectors'       per sector: RS_<n> per lookback, Composite, Rank, RS_Ratio, RS_Momentum, Quadrant
+      'constituents'  the same per ticker, plus Sector and Sector_Rank (rank inside its sector)
+      'rs_ratio', 'rs_momentum'  date x sector quadrant coordinates (for rotation trails)
+
+    sector_map is {sector: [tickers]}, e.g. logic.load_sector_map().
+    """
+    benchmark_px = closes[benchmark]
+    members = [t for t in dict.fromkeys(t for tickers in sector_map.values() for t in tickers) if t in closes.columns]
+    prices = closes[members]
+
+    sectors, rs_ratio, rs_momentum = _rotation_table(sector_composites(prices, sector_map), benchmark_px, lookbacks)
+    constituents, _, _ = _rotation_table(prices, benchmark_px, lookbacks)
+    home = {t: sector for sector, tickers in reversed(list(sector_map.items())) for t in tickers}
+    constituents.insert(0, "Sector", constituents.index.map(home))
+    constituents["Sector_Rank"] = constituents.groupby("Sector")["Composite"].rank(ascending=False, method="min")
+    return {'sectors': sectors, 'constituents': constituents, 'rs_ratio': rs_ratio, 'rs_momentum': rs_momentum}
@@ -0,0 +1,202 @@
+import os
+import itertools
+import contextlib
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import yfinance as yf
+
+try:
+    from src import backtest, data_provider, governance_rules, history_archive
+except ImportError:  # Run as a script from inside src/
+    import backtest
+    import data_provider
+    import governance_rules
+    import history_archive
+
+# --- GOVERNANCE THRESHOLD SWEEP ---
+# Scores every combination in a threshold grid against two yardsticks:
+#   - the bad-dates list from the v4 audit (was the morning signal off
+#     COMFORT ZONE on the day?), and
+#   - backtest.py P&L of trading SPY on the resulting levels.
+# The ratios and deltas are computed once by governance_inputs. They go into
+# one shared-memory block that every worker process maps, so no
+# per-task pickling of price history. Results stream into a Parquet file one
+# row group per batch.
+
+BAD_DATES = {
+    "2007-08-08": "Credit Freeze (BNP)",
+    "2008-09-15": "Lehman Bankruptcy",
+    "2008-10-01": "2008 Crash Peak",
+    "2010-05-06": "Flash Crash",
+    "2011-08-03": "US Debt Downgrade",
+    "2018-12-12": "Trade War / Rates",
+    "2020-02-19": "COVID Start",
+    "2020-03-11": "COVID Panic",
+    "2022-06-08": "Inflation Shock",
+    "2025-04-09": "Tariff Flop",
+}
+BAD_DATE_TOLERANCE_DAYS = 4  # Same nearest-trading-day window as audit_bad_dates_v4_final
+
+DEFAULT_GRID = {
+    'credit_trig': [-0.010, -0.0125, -0.015, -0.0175, -0.020],
+    'vix_panic': [22.0, 23.0, 24.0, 25.0, 26.0, 28.0],
+    'breadth_trig': [-0.015, -0.020, -0.025, -0.030, -0.035],
+    'dxy_spike': [0.015, 0.020, 0.025, 0.030],
+    'vix_extreme': [30.0, 35.0, 40.0],
+}
+SWEEP_BATCH = 256
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "sweeps", "governance_sweep.parquet")
+
+_worker = {}
+
+
+def bad_date_positions(index, bad_dates=BAD_DATES):
+    """Row of the nearest trading day to each bad date, or -1 when none is within tolerance."""
+    positions = []
+    for date_str in bad_dates:
+        dt = pd.Timestamp(date_str)
+        idx = index.get_indexer([dt], method='nearest')[0]
+        if idx < 1 or abs((index[idx] - dt).days) > BAD_DATE_TOLERANCE_DAYS:
+            positions.append(-1)
+        else:
+            positions.append(idx)
+    return np.array(positions, dtype=np.int64)
+
+
+def prepare_inputs(closes, opens, ticker="SPY"):
+    """(block, index): a rows x days float64 array of Credit_Delta, VIX, Breadth_Delta, DXY_Delta,
+    then `ticker` Open and Close, aligned to the governance index."""
+    gov_df = governance_rules.governance_inputs(closes)
+    block = np.vstack([
+        gov_df['Credit_Delta'].to_numpy(dtype=float),
+        gov_df['VIX'].to_numpy(dtype=float),
+        gov_df['Breadth_Delta'].to_numpy(dtype=float),
+        gov_df['DXY_Delta'].to_numpy(dtype=float),
+        opens[ticker].reindex(gov_df.index).to_numpy(dtype=float),
+        closes[ticker].reindex(gov_df.index).to_numpy(dtype=float),
+    ])
+    return np.ascontiguousarray(block), gov_df.index
+
+
+def grid_combinations(grid):
+    """Every threshold dict in the cartesian product of `grid` (missing keys keep the live defaults)."""
+    keys = list(governance_rules.GOV_THRESHOLD_DEFAULTS)
+    values = [grid.get(k, [governance_rules.GOV_THRESHOLD_DEFAULTS[k]]) for k in keys]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+
+def evaluate(block, params, bad_pos, lo=0, hi=None, warmup=0, **costs):
+    """(row, returns, weights, turnover) for one threshold set over rows [lo, hi) of the input block.
+
+    With warmup=0 the run starts flat on day lo. With warmup >= 2 rows before
+    lo, day lo holds the position the prior signals called for and earns and
+    pays exactly what a continuous run over the whole block would.
+    """
+    start = max(lo - warmup, 0)
+    view = block[:, start:hi]
+    codes = governance_rules.score_governance(view[0], view[1], view[2], view[3], **params)
+    levels = governance_rules.GOV_LEVEL_BY_REASON[codes]
+    _, weights, returns, turnover = backtest.backtest_arrays(levels, view[4], view[5], **costs)
+    trade = slice(lo - start, None)
+    weights, returns, turnover = weights[trade], returns[trade], turnover[trade]
+    stats = backtest.summarize(np.cumprod(1.0 + returns), weights, returns, turnover)
+
+    # Morning signal = level at the previous close
+    end = block.shape[1] if hi is None else hi
+    hits = bad_pos[(bad_pos >= max(lo, 1)) & (bad_pos < end)]
+    morning = governance_rules.GOV_LEVEL_BY_REASON[governance_rules.score_governance(*block[:4, hits - 1], **params)]
+    caught = int((morning > 0).sum())
+
+    row = dict(params)
+    row.update({"bad_dates_caught": caught, "bad_dates_total": int(hits.size)})
+    row.update(stats)
+    return row, returns, weights, turnover
+
+
+def _init_worker(shm_name, shape, bad_pos, costs):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker.update(shm=shm, block=np.ndarray(shape, dtype=np.float64, buffer=shm.buf), bad_pos=bad_pos, costs=costs)
+
+
+def worker_inputs():
+    """(block, bad_pos, costs) inside a task started by input_pool."""
+    return _worker["block"], _worker["bad_pos"], _worker["costs"]
+
+
+@contextlib.contextmanager
+def input_pool(block, bad_pos, costs, workers=None):
+    """Yields an unordered imap whose tasks read the input block through worker_inputs().
+
+    The block is copied once into shared memory and mapped by every
+    worker; workers=1 maps in-process instead.
+    """
+    workers = workers or os.cpu_count() or 1
+    shm, pool = None, None
+    try:
+        if workers == 1:
+            _worker.update(block=block, bad_pos=bad_pos, costs=costs)
+            yield map
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=block.nbytes)
+            np.ndarray(block.shape, dtype=np.float64, buffer=shm.buf)[:] = block
+            pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                        initargs=(shm.name, block.shape, bad_pos, costs))
+            yield pool.imap_unordered
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+        _worker.clear()
+
+
+def _run_batch(batch):
+    block, bad_pos, costs = worker_inputs()
+    return [dict(evaluate(block, params, bad_pos, **costs)[0], run=run) for run, params in batch]
+
+
+def _batches(combos, size):
+    numbered = list(enumerate(combos))
+    return [numbered[i:i + size] for i in range(0, len(numbered), size)]
+
+
+def run_sweep(closes, opens, grid=DEFAULT_GRID, output_path=DEFAULT_OUTPUT, bad_dates=BAD_DATES,
+              workers=None, batch_size=SWEEP_BATCH, **costs):
+    """Evaluates every grid combination and writes one row per combination to `output_path`.
+
+    workers=1 runs in-process. Returns the number of rows written.
+    """
+    block, index = prepare_inputs(closes, opens)
+    bad_pos = bad_date_positions(index, bad_dates)
+    batches = _batches(grid_combinations(grid), batch_size)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    writer, written = None, 0
+    try:
+        with input_pool(block, bad_pos, costs, workers) as imap:
+            for rows in imap(_run_batch, batches):
+                table = pa.Table.from_pylist(rows)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+                written += len(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+if __name__ == "__main__":
+    tickers = ["HYG", "IEF", "^VIX", "RSP", "SPY", "DX-Y.NYB"]
+    print("Loading history since 2007...")
+    data = history_archive.fetch_history(tickers, "2007-01-01", source=data_provider.get_provider(yf))
+    count = run_sweep(data['Close'], data['Open'])
+    results = pd.read_parquet(DEFAULT_OUTPUT)
+    print(f"Evaluated {count} threshold sets -> {DEFAULT_OUTPUT}")
+    print(results.sort_values(["bad_dates_caught", "sharpe"], ascending=False).head(10).to_string(index=False))
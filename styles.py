@@ -1,7 +1,12 @@
 import streamlit as st
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import os
 import base64
+import threading
+from collections import OrderedDict
+import pandas as pd
+import chart_lod
 
 def get_base64_image(image_path):
     try:
@@ -215,6 +220,84 @@ def render_sparkline(data, line_color):
     fig.update_layout(height=40, margin=dict(l=0,r=0,t=0,b=0), xaxis=dict(visible=False), yaxis=dict(visible=False), plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
     return fig
 
+def render_deep_dive(data, cone, ppo, theme, forecast=None, strategist=None, target_px=chart_lod.CHART_WIDTH_PX):
+    """Swarm Deep Dive: SPY candles in the fair value cone over the PPO panel.
+
+    data is the OHLC frame already cut to the view window; cone (upper, lower)
+    and ppo (line, signal, hist) are full-history series, label-sliced to the
+    window here. theme is the apply_theme() palette. forecast is
+    generate_forecast_mc()'s (dates, median, upper, lower) and strategist a
+    (dates, prices) pair; pass at most one.
+
+    Level of detail follows target_px (see chart_lod): candles and the
+    histogram go weekly/monthly once daily bars stop fitting, and lines are
+    LTTB-downsampled. target_px=None plots every daily point.
+    """
+    start = data.index[0]
+    ohlc = pd.DataFrame({field: data[field]['SPY'] for field in chart_lod.OHLC_AGG})
+    band = pd.DataFrame({'upper': cone[0].loc[start:], 'lower': cone[1].loc[start:]})
+    line, signal, hist = (s.loc[start:] for s in ppo)
+    if target_px:
+        rule = chart_lod.bar_rule(len(ohlc), target_px)
+        points = chart_lod.line_points(target_px)
+        ohlc = chart_lod.resample_ohlc(ohlc, rule)
+        hist = chart_lod.resample_last(hist, rule)
+        band = chart_lod.lttb(band, points)  # One set of dates for both edges keeps the fill aligned
+        line, signal = chart_lod.lttb(line, points), chart_lod.lttb(signal, points)
+
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.03, row_heights=[0.7, 0.3])
+
+    fig.add_trace(go.Scatter(x=band.index, y=band['lower'], line=dict(width=0), showlegend=False, hoverinfo='skip'), row=1, col=1)
+    fig.add_trace(go.Scatter(x=band.index, y=band['upper'], fill='tonexty', fillcolor='rgba(0, 100, 255, 0.1)', line=dict(width=0), name="Fair Value Cone", hoverinfo='skip'), row=1, col=1)
+    fig.add_trace(go.Candlestick(x=ohlc.index, open=ohlc['Open'], high=ohlc['High'], low=ohlc['Low'], close=ohlc['Close'], name='SPY'), row=1, col=1)
+
+    if strategist is not None:
+        dates_fut, prices_fut = strategist
+        fig.add_trace(go.Scatter(x=dates_fut, y=prices_fut, name="Strategist Forecast", line=dict(color=theme["ACCENT_GOLD"], width=3, dash='dot'), mode='lines+markers'), row=1, col=1)
+    elif forecast is not None:
+        f_dates, f_median, f_upper, f_lower = forecast
+        fig.add_trace(go.Scatter(x=f_dates, y=f_lower, line=dict(width=0), showlegend=False, hoverinfo='skip'), row=1, col=1)
+        fig.add_trace(go.Scatter(x=f_dates, y=f_upper, fill='tonexty', fillcolor='rgba(200, 0, 255, 0.15)', line=dict(width=0), name="Uncertainty", hoverinfo='skip'), row=1, col=1)
+        fig.add_trace(go.Scatter(x=f_dates, y=f_median, name="Swarm Forecast", line=dict(color=theme["CHART_FONT"], width=2, dash='dot')), row=1, col=1)
+
+    fig.add_trace(go.Scatter(x=line.index, y=line, name="Swarm Trend", line=dict(color='cyan', width=1)), row=2, col=1)
+    fig.add_trace(go.Scatter(x=signal.index, y=signal, name="Signal", line=dict(color='orange', width=1)), row=2, col=1)
+    fig.add_trace(go.Bar(x=hist.index, y=hist, name="Velocity", marker_color=['#00ff00' if v >= 0 else '#ff0000' for v in hist]), row=2, col=1)
+
+    fig.update_layout(height=500, template=theme["CHART_TEMPLATE"], margin=dict(l=0, r=0, t=0, b=0), showlegend=False, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', font=dict(color=theme["CHART_FONT"]), xaxis_rangeslider_visible=False)
+    fig.update_xaxes(showgrid=False); fig.update_yaxes(showgrid=False)
+    return fig
+
+# --- FIGURE CACHE ---
+# A rerun (dark-mode toggle, radio click, any widget) would otherwise rebuild
+# heavy figures from scratch. Figures are kept as serialized plotly JSON in a
+# small process-wide LRU, so every session on the server shares them; a
+# figure is only rebuilt when its key (data version, view, theme) changes.
+FIGURE_CACHE_SIZE = 32
+_figure_cache = OrderedDict()
+_figure_lock = threading.Lock()
+
+def theme_key(theme):
+    """Hashable form of an apply_theme() palette, for figure cache keys."""
+    return tuple(sorted(theme.items()))
+
+def cached_figure_json(key, build):
+    """Plotly JSON of the figure for `key`; `build()` only runs on a miss."""
+    with _figure_lock:
+        if key in _figure_cache:
+            _figure_cache.move_to_end(key)
+            return _figure_cache[key]
+    fig_json = build().to_json()
+    with _figure_lock:
+        _figure_cache[key] = fig_json
+        while len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+    return fig_json
+
+def clear_figure_cache():
+    with _figure_lock:
+        _figure_cache.clear()
+
 FOOTER_HTML = """
 <div style="font-family: 'Fira Code', monospace; font-size: 10px; color: #888; text-align: center; margin-top: 50px; border-top: 1px solid #30363d; padding-top: 20px; text-transform: uppercase;">
 MACROEFFECTS | ALPHA SWARM PROTOCOL | INSTITUTIONAL RISK GOVERNANCE<br>
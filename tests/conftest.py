@@ -0,0 +1,5 @@
+import os
+
+# Keep loaders out of the shared on-disk cache (and the per-process one): a
+# value cached by one test or one earlier run must not leak into another.
+os.environ["ALPHA_SWARM_CACHE"] = "none"
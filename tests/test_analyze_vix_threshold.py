@@ -26,7 +26,8 @@ import unittest
 # Add repo root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.analyze_vix_threshold import analyze_vix
+from src.analyze_vix_threshold import analyze_vix, scan_vix_surface, surface_markdown
+from src import event_study
 
 class TestAnalyzeVixThreshold(unittest.TestCase):
 
@@ -274,5 +275,33 @@ class TestAnalyzeVixThreshold(unittest.TestCase):
             written_content = "".join(call.args[0] for call in handle.write.mock_calls)
             self.assertIn("Buy Signal", written_content)
 
+class TestVixSurfaceScan(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        dates = pd.bdate_range("2015-01-01", periods=1200)
+        self.df = pd.DataFrame({
+            'VIX': np.clip(20 + np.cumsum(rng.normal(0, 1, 1200)) * 0.4 + rng.normal(0, 3, 1200), 9, 60),
+            'SP500': 2000 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, 1200))),
+        }, index=dates)
+
+    def test_surface_matches_single_event_study(self):
+        surface = scan_vix_surface(self.df, thresholds=[20, 25, 30], horizons=(21, "90D"), n_boot=100)
+        self.assertEqual(list(surface["Win_Rate"].index), [20, 25, 30])
+        self.assertEqual(list(surface["Win_Rate"].columns), [21, "90D"])
+
+        _, summary = event_study.event_study(self.df['SP500'], event_study.crossings(self.df['VIX'], 25),
+                                             horizons=(21, "90D"), n_boot=100)
+        for h in (21, "90D"):
+            self.assertEqual(surface["Events"].at[25, h], summary.at[h, "Events"])
+            self.assertAlmostEqual(surface["Win_Rate"].at[25, h], summary.at[h, "Win_Rate"])
+            self.assertAlmostEqual(surface["Mean_Min"].at[25, h], summary.at[h, "Mean_Min"])
+
+    def test_markdown_marks_app_thresholds(self):
+        surface = scan_vix_surface(self.df, thresholds=[24, 25, 30, 59], horizons=(21,), n_boot=100)
+        md = surface_markdown(surface)
+        self.assertIn("| **25** (app) |", md)
+        self.assertIn("| **30** (app) |", md)
+        self.assertIn("| 59 | -- |", md)  # Never crossed
+
 if __name__ == '__main__':
     unittest.main()
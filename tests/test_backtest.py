@@ -0,0 +1,85 @@
+import sys
+import os
+import time
+import unittest
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import backtest
+
+
+def make_bars(periods=500, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2005-01-03", periods=periods)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    opens = closes * np.exp(rng.normal(0, 0.003, periods))
+    levels = rng.integers(0, 4, periods)
+    return pd.Series(levels, index=dates), pd.Series(opens, index=dates), pd.Series(closes, index=dates)
+
+
+def loop_backtest(levels, opens, closes, exposure, cost_bps):
+    """Day-by-day reference: hold yesterday's weight overnight, rebalance at the open."""
+    equity, weight, curve = 1.0, 0.0, []
+    for t in range(len(closes)):
+        if t > 0:
+            equity *= 1 + weight * (opens[t] / closes[t - 1] - 1)
+        new_weight = exposure[levels[t - 1]] if t > 0 else 0.0
+        equity *= 1 - abs(new_weight - weight) * cost_bps / 1e4
+        weight = new_weight
+        equity *= 1 + weight * (closes[t] / opens[t] - 1)
+        curve.append(equity)
+    return np.array(curve)
+
+
+class TestBacktest(unittest.TestCase):
+    def test_matches_day_by_day_loop(self):
+        levels, opens, closes = make_bars()
+        daily, _ = backtest.run_backtest(levels, opens, closes, slippage_bps=5, fee_bps=1)
+        expected = loop_backtest(levels.to_numpy(), opens.to_numpy(), closes.to_numpy(), backtest.EXPOSURE_BY_LEVEL, 6)
+        np.testing.assert_allclose(daily["Equity"].to_numpy(), expected, rtol=1e-12)
+
+    def test_signal_fills_at_next_open(self):
+        levels, opens, closes = make_bars(periods=10)
+        levels[:] = 3
+        levels.iloc[4] = 0  # One comfort reading
+        daily, stats = backtest.run_backtest(levels, opens, closes)
+        self.assertEqual(daily["Exposure"].tolist(), [0, 0, 0, 0, 0, 1, 0, 0, 0, 0])
+        self.assertEqual(stats["trades"], 2)
+        self.assertAlmostEqual(stats["turnover"] * 10 / backtest.TRADING_DAYS, 2.0)
+
+    def test_fully_invested_without_costs_is_buy_and_hold(self):
+        levels, opens, closes = make_bars()
+        levels[:] = 0
+        daily, stats = backtest.run_backtest(levels, opens, closes, slippage_bps=0, fee_bps=0)
+        # First signal is known at the day-0 close and filled at the day-1 open
+        self.assertAlmostEqual(daily["Equity"].iloc[-1], closes.iloc[-1] / opens.iloc[1])
+        self.assertAlmostEqual(stats["max_drawdown"], daily["Drawdown"].min())
+        self.assertLessEqual(stats["max_drawdown"], 0.0)
+
+    def test_dict_exposure_for_legacy_levels(self):
+        levels, opens, closes = make_bars(periods=50)
+        legacy = levels.map({0: 3, 1: 4, 2: 5, 3: 7})
+        mapped, _ = backtest.run_backtest(legacy, opens, closes, exposure={3: 1.0, 4: 0.75, 5: 0.5, 7: 0.0})
+        native, _ = backtest.run_backtest(levels, opens, closes)
+        np.testing.assert_allclose(mapped["Equity"], native["Equity"])
+
+    def test_level_hit_rates(self):
+        levels, opens, closes = make_bars()
+        _, stats = backtest.run_backtest(levels, opens, closes)
+        self.assertEqual(set(stats["level_hit_rates"]), {0, 1, 2, 3})
+        self.assertTrue(0.0 < stats["hit_rate"] < 1.0)
+
+    def test_twenty_years_runs_in_milliseconds(self):
+        levels, opens, closes = make_bars(periods=20 * 252)
+        args = (levels.to_numpy(), opens.to_numpy(), closes.to_numpy())
+        start = time.perf_counter()
+        for _ in range(10):
+            backtest.backtest_arrays(*args)
+        self.assertLess((time.perf_counter() - start) / 10, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
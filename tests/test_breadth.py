@@ -0,0 +1,66 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+from src import breadth
+from test_indicators import make_panel
+
+
+class TestBreadth(unittest.TestCase):
+    def setUp(self):
+        logic.clear_indicator_cache()
+        self.closes = make_panel(periods=400, tickers=30)
+
+    def test_matches_per_ticker_definitions(self):
+        table = breadth.calc_breadth(self.closes)
+        day = self.closes.index[300]
+        ma50 = self.closes.rolling(50).mean().loc[day]
+        above = (self.closes.loc[day] > ma50)[ma50.notna()]
+        self.assertAlmostEqual(table.at[day, 'Pct_Above_50'], 100 * above.mean())
+
+        high = self.closes.rolling(252).max().loc[day]
+        self.assertEqual(table.at[day, 'New_Highs'], (self.closes.loc[day] >= high).sum())
+
+        diff = self.closes.diff()
+        net = (diff > 0).sum(axis=1) - (diff < 0).sum(axis=1)
+        np.testing.assert_array_equal(table['AD_Line'], net.cumsum())
+        ewm = lambda span: net.astype(float).ewm(span=span, adjust=False).mean()
+        np.testing.assert_allclose(table['McClellan'], ewm(19) - ewm(39), atol=1e-9)
+
+    def test_streaming_matches_batch(self):
+        table = breadth.calc_breadth(self.closes)
+        engine = breadth.BreadthEngine(self.closes.columns)
+        for date, row in self.closes.iterrows():
+            latest = engine.update(row)
+            expected = table.loc[date]
+            for key, value in latest.items():
+                np.testing.assert_allclose(value, expected[key], atol=1e-9, err_msg=f"{date} {key}")
+
+    def test_revising_the_current_bar(self):
+        engine = breadth.BreadthEngine.from_history(self.closes.iloc[:-1])
+        first = dict(engine.update(self.closes.iloc[-1]))
+        engine.update(self.closes.iloc[-1] * 0.5, new_bar=False)  # Bad print
+        revised = engine.update(self.closes.iloc[-1], new_bar=False)
+        pd.testing.assert_series_equal(pd.Series(revised), pd.Series(first))
+
+    def test_scales_to_hundreds_of_names(self):
+        closes = make_panel(periods=600, tickers=520)
+        table = breadth.calc_breadth(closes)
+        self.assertEqual(len(table), 600)
+        self.assertLessEqual((table['Advances'] + table['Declines']).max(), 520)
+        self.assertTrue(table['Pct_Above_50'].dropna().between(0, 100).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+import os
+import shutil
+import tempfile
+import sqlite3
+import threading
+import unittest
+from unittest.mock import patch
+import pandas as pd
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import cache_backend
+from src.cache_backend import SQLiteCacheBackend, NullCacheBackend, shared_cache
+
+
+class TestSQLiteCacheBackend(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.backend = SQLiteCacheBackend(os.path.join(self.tmp_dir, "cache.sqlite"))
+        cache_backend.set_cache_backend(self.backend)
+
+    def tearDown(self):
+        cache_backend.set_cache_backend(None)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_round_trip_dataframe(self):
+        df = pd.DataFrame({"a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2))
+        self.backend.set("k", df, ttl=60)
+
+        value, stored_at = self.backend.get("k")
+
+        pd.testing.assert_frame_equal(value, df)
+        self.assertGreater(stored_at, 0)
+
+    def test_expired_entry_is_a_miss(self):
+        self.backend.set("k", "v", ttl=-1)
+        self.assertIsNone(self.backend.get("k"))
+
+    def test_shared_cache_calls_loader_once(self):
+        calls = []
+
+        @shared_cache(ttl=60)
+        def loader(x):
+            calls.append(x)
+            return x * 2
+
+        self.assertEqual(loader(2), 4)
+        self.assertEqual(loader(2), 4)
+        self.assertEqual(loader(3), 6)
+        self.assertEqual(calls, [2, 3])
+
+    def test_none_results_are_not_cached(self):
+        calls = []
+
+        @shared_cache(ttl=60)
+        def loader():
+            calls.append(1)
+            return None
+
+        loader()
+        loader()
+        self.assertEqual(len(calls), 2)
+
+    def test_refresh_respects_max_age(self):
+        calls = []
+
+        @shared_cache(ttl=60)
+        def loader():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(loader(), 1)
+        # Entry is fresh, so another replica's refresh is a cache read
+        self.assertEqual(loader.refresh(max_age=60), 1)
+        self.assertEqual(loader.refresh(max_age=0), 2)
+        self.assertEqual(loader(), 2)
+
+    def test_lock_gives_single_flight(self):
+        calls = []
+        gate = threading.Event()
+
+        @shared_cache(ttl=60)
+        def slow_loader():
+            calls.append(1)
+            gate.wait(1)
+            return "data"
+
+        threads = [threading.Thread(target=slow_loader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        gate.set()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+
+    def test_connections_are_closed(self):
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking_connect(*args, **kwargs):
+            opened.append(connect(*args, **kwargs))
+            return opened[-1]
+
+        with patch("src.cache_backend.sqlite3.connect", side_effect=tracking_connect), \
+                patch("src.cache_backend.LOCK_WAIT_SECONDS", 0.3):
+            self.backend.set("k", "v", ttl=60)
+            self.backend.get("k")
+            with self.backend.lock("k"):
+                with self.backend.lock("k"):  # Polls until it gives up
+                    pass
+
+        self.assertGreater(len(opened), 4)
+        for conn in opened:
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+
+class TestBackendSelection(unittest.TestCase):
+    def tearDown(self):
+        cache_backend.set_cache_backend(None)
+
+    def test_env_disables_cache(self):
+        with patch.dict(os.environ, {"ALPHA_SWARM_CACHE": "none"}):
+            self.assertIsInstance(cache_backend.get_cache_backend(), NullCacheBackend)
+
+    def test_process_cache_is_per_process_and_follows_the_switch(self):
+        calls = []
+
+        @cache_backend.process_cache(ttl=60)
+        def load():
+            calls.append(1)
+            return "frame"
+
+        with patch.dict(os.environ, {"ALPHA_SWARM_CACHE": ""}):
+            self.assertEqual((load(), load()), ("frame", "frame"))
+            self.assertEqual(len(calls), 1)
+        with patch.dict(os.environ, {"ALPHA_SWARM_CACHE": "none"}):
+            load()
+            self.assertIsInstance(cache_backend.get_process_backend(), NullCacheBackend)
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import sys
+import os
+import unittest
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import chart_lod
+
+
+def make_ohlc(periods=2600, seed=0):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods))),
+                      index=pd.date_range("2015-01-01", periods=periods, freq="B"))
+    return pd.DataFrame({"Open": close.shift(1).fillna(100.0), "High": close * 1.01,
+                         "Low": close * 0.99, "Close": close})
+
+
+class TestBarRule(unittest.TestCase):
+    def test_coarsens_only_when_daily_bars_do_not_fit(self):
+        self.assertIsNone(chart_lod.bar_rule(42))          # Tactical 60-day view
+        self.assertEqual(chart_lod.bar_rule(500), "W-FRI")  # Strategic 2-year view
+        self.assertEqual(chart_lod.bar_rule(2600), chart_lod.MONTH_END)  # 10 years
+        self.assertIsNone(chart_lod.bar_rule(500, target_px=4000))
+
+    def test_month_end_alias_follows_pandas_version(self):
+        self.assertEqual(chart_lod._month_end_alias("2.1.4"), "M")
+        self.assertEqual(chart_lod._month_end_alias("2.2.0rc0"), "ME")
+        self.assertEqual(chart_lod._month_end_alias("3.0.0"), "ME")
+
+
+class TestResample(unittest.TestCase):
+    def test_weekly_bars_match_groupby(self):
+        ohlc = make_ohlc(periods=300)
+        bars = chart_lod.resample_ohlc(ohlc, "W-FRI")
+
+        for label, week in ohlc.groupby(ohlc.index.to_period("W-FRI")):
+            row = bars.loc[week.index[-1]]  # Labelled by the week's last trading day
+            self.assertEqual(row["Open"], week["Open"].iloc[0])
+            self.assertEqual(row["High"], week["High"].max())
+            self.assertEqual(row["Low"], week["Low"].min())
+            self.assertEqual(row["Close"], week["Close"].iloc[-1])
+        self.assertEqual(len(bars), ohlc.index.to_period("W-FRI").nunique())
+
+    def test_resample_last_shares_the_bar_labels(self):
+        ohlc = make_ohlc(periods=700)
+        bars = chart_lod.resample_ohlc(ohlc, chart_lod.MONTH_END)
+        last = chart_lod.resample_last(ohlc["Close"], chart_lod.MONTH_END)
+        self.assertTrue(last.index.equals(bars.index))
+        np.testing.assert_array_equal(last.to_numpy(), bars["Close"].to_numpy())
+
+
+class TestLttb(unittest.TestCase):
+    def test_keeps_end_points_and_spikes_within_budget(self):
+        close = make_ohlc()["Close"]
+        close.iloc[1234] = close.max() * 2  # A one-day spike must survive downsampling
+
+        sampled = chart_lod.lttb(close, 300)
+
+        self.assertEqual(len(sampled), 300)
+        self.assertTrue(sampled.index.is_monotonic_increasing)
+        self.assertEqual(sampled.index[0], close.index[0])
+        self.assertEqual(sampled.index[-1], close.index[-1])
+        self.assertIn(close.index[1234], sampled.index)
+
+    def test_short_series_and_nans(self):
+        close = make_ohlc(periods=50)["Close"]
+        close.iloc[:5] = np.nan
+        pd.testing.assert_series_equal(chart_lod.lttb(close, 300), close.dropna())
+
+    def test_frame_rows_follow_one_column(self):
+        ohlc = make_ohlc(periods=1000)
+        band = pd.DataFrame({"upper": ohlc["High"], "lower": ohlc["Low"]})
+        sampled = chart_lod.lttb(band, 100)
+        self.assertEqual(list(sampled.columns), ["upper", "lower"])
+        self.assertTrue(sampled.index.equals(chart_lod.lttb(band["upper"], 100).index))
+
+
+if __name__ == '__main__':
+    unittest.main()
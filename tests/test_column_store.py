@@ -0,0 +1,65 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+from column_store import CompactPanel
+from test_governance import make_closes
+
+
+def make_market_frame(periods=300, seed=0):
+    closes = make_closes(periods=periods, seed=seed)
+    fields = {"Close": closes, "Open": closes * 0.99, "High": closes * 1.01, "Low": closes * 0.98}
+    return pd.concat(fields, axis=1, names=["Price", "Ticker"])
+
+
+class TestCompactPanel(unittest.TestCase):
+    def setUp(self):
+        self.frame = make_market_frame()
+        self.panel = CompactPanel.from_frame(self.frame)
+
+    def test_round_trip_and_half_memory(self):
+        self.assertEqual(self.panel.values.dtype, np.float32)
+        self.assertEqual(self.panel.nbytes * 2, self.frame.to_numpy().nbytes)
+        pd.testing.assert_frame_equal(self.panel.to_frame(), self.frame, check_exact=False, rtol=1e-6, check_freq=False)
+
+    def test_field_and_ticker_views_are_zero_copy(self):
+        closes = self.panel['Close']
+        self.assertEqual(list(closes.columns), list(self.frame['Close'].columns))
+        self.assertTrue(np.shares_memory(closes.to_numpy(), self.panel.values))
+        self.assertTrue(np.shares_memory(self.panel['Open']['SPY'].to_numpy(), self.panel.values))
+
+    def test_date_mask_slices_like_a_frame(self):
+        start = self.panel.index[100]
+        sub = self.panel[self.panel.index >= start]
+        self.assertEqual(len(sub), len(self.panel) - 100)
+        self.assertEqual(sub.index[0], start)
+        self.assertTrue(np.shares_memory(sub.values, self.panel.values))
+        self.assertTrue(self.panel[self.panel.index > self.panel.index[-1]].empty)
+
+    def test_governance_matches_float64_frame(self):
+        logic.clear_indicator_cache()
+        expected, status, _, reason = logic.calc_governance(self.frame)
+        actual, c_status, _, c_reason = logic.calc_governance(self.panel)
+        self.assertEqual((c_status, c_reason), (status, reason))
+        self.assertEqual(actual['Gov_Level'].tolist(), expected['Gov_Level'].tolist())
+
+    def test_fingerprint_follows_content(self):
+        same = CompactPanel.from_frame(self.frame.copy())
+        self.assertEqual(logic.data_fingerprint(same), logic.data_fingerprint(self.panel))
+        bumped = CompactPanel.from_frame(self.frame * 1.01)
+        self.assertNotEqual(logic.data_fingerprint(bumped), logic.data_fingerprint(self.panel))
+
+
+if __name__ == '__main__':
+    unittest.main()
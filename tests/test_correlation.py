@@ -0,0 +1,70 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+from src import correlation
+from test_governance import make_closes
+
+
+def pandas_avg_corr(closes, window):
+    """Reference: DataFrame.rolling().corr() for every pair, then the mean of the defined ones."""
+    returns = closes.pct_change()
+    pairs = [(a, b) for i, a in enumerate(closes.columns) for b in closes.columns[i + 1:]]
+    table = pd.concat([returns[a].rolling(window).corr(returns[b]) for a, b in pairs], axis=1)
+    return table.mean(axis=1)
+
+
+class TestCorrelationEngine(unittest.TestCase):
+    def test_matches_pairwise_rolling_corr(self):
+        closes = make_closes(periods=120, seed=5).drop(columns=["^VIX"])
+        closes.iloc[40:45, 1] = np.nan  # A gap only drops the pairs that ticker is in
+
+        avg = logic.calc_avg_correlation(closes, window=21)
+
+        expected = pandas_avg_corr(closes, 21)
+        np.testing.assert_allclose(avg.to_numpy(), expected.to_numpy(), atol=1e-9)
+        self.assertTrue(avg.iloc[:21].isna().all())
+
+        engine = correlation.CorrelationEngine.from_history(closes, window=21)
+        expected_matrix = closes.pct_change().tail(21).corr()
+        np.testing.assert_allclose(engine.matrix().to_numpy(), expected_matrix.to_numpy(), atol=1e-9)
+
+    def test_revising_the_current_bar(self):
+        closes = make_closes(periods=60, seed=6).drop(columns=["^VIX"])
+        engine = correlation.CorrelationEngine.from_history(closes.iloc[:-1], window=21)
+        first = engine.update(closes.iloc[-1])
+
+        # Everything gaps down together, then the print is revised back
+        engine.update(closes.iloc[-1] * 0.9, new_bar=False)
+        self.assertGreater(engine.latest, first)
+        revised = engine.update(closes.iloc[-1], new_bar=False)
+
+        self.assertAlmostEqual(revised, first)
+        self.assertAlmostEqual(revised, logic.calc_avg_correlation(closes, window=21).iloc[-1])
+
+
+class TestGovernanceCorrelation(unittest.TestCase):
+    def test_governance_exposes_avg_corr(self):
+        closes = make_closes(periods=80, seed=7)
+        gov_df, _, _, _ = logic.calc_governance({'Close': closes})
+
+        expected = logic.calc_avg_correlation(closes[["SPY", "HYG", "IEF", "RSP", "DX-Y.NYB"]])
+        np.testing.assert_allclose(gov_df['Avg_Corr'].to_numpy(), expected.to_numpy())
+
+        engine = logic.GovernanceEngine.from_history(closes)
+        self.assertAlmostEqual(engine.latest['Avg_Corr'], gov_df['Avg_Corr'].iloc[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import data_provider
+from src.data_provider import ReplayProvider, YFinanceProvider, record_replay
+
+
+class FakeSource(data_provider.DataProvider):
+    def download(self, tickers, start=None, end=None, **kwargs):
+        dates = pd.date_range("2024-01-01", periods=10)
+        columns = pd.MultiIndex.from_product([["Close", "Open"], tickers], names=["Price", "Ticker"])
+        return pd.DataFrame(np.arange(10 * len(columns), dtype=float).reshape(10, -1), index=dates, columns=columns)
+
+    def info(self, ticker):
+        return {"sector": "Technology"} if ticker == "AAPL" else {}
+
+
+class TestReplayProvider(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.recorded = record_replay(FakeSource(), ["AAPL", "^VIX"], self.tmp_dir, with_info=True)
+
+    def tearDown(self):
+        data_provider.set_provider(None)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_replays_what_was_recorded(self):
+        data = ReplayProvider(self.tmp_dir).download(["AAPL", "^VIX"])
+        pd.testing.assert_frame_equal(data, self.recorded, check_freq=False)
+
+    def test_end_is_exclusive_like_yfinance(self):
+        data = ReplayProvider(self.tmp_dir).download(["AAPL"], start="2024-01-03", end="2024-01-06")
+        self.assertEqual(list(data.index.day), [3, 4, 5])
+
+    def test_missing_ticker_and_info(self):
+        replay = ReplayProvider(self.tmp_dir)
+        self.assertIsNone(replay.download(["MSFT"]))
+        self.assertEqual(replay.info("AAPL"), {"sector": "Technology"})
+        self.assertEqual(replay.info("MSFT"), {})
+
+    @patch('src.data_provider.time.sleep')
+    def test_simulated_latency(self, mock_sleep):
+        ReplayProvider(self.tmp_dir, latency=0.25).download(["AAPL"])
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_environment_selects_replay(self):
+        env = {"ALPHA_SWARM_PROVIDER": f"replay:{self.tmp_dir}", "ALPHA_SWARM_REPLAY_LATENCY": "0.1"}
+        with patch.dict(os.environ, env):
+            provider = data_provider.get_provider()
+        self.assertIsInstance(provider, ReplayProvider)
+        self.assertEqual(provider.latency, 0.1)
+
+    def test_yfinance_is_default_and_uses_given_module(self):
+        mock_yf = MagicMock()
+        with patch.dict(os.environ, {"ALPHA_SWARM_PROVIDER": ""}):
+            provider = data_provider.get_provider(mock_yf)
+        self.assertIsInstance(provider, YFinanceProvider)
+        provider.download(["SPY"], start="2024-01-01")
+        mock_yf.download.assert_called_once_with(["SPY"], start="2024-01-01", end=None, progress=False)
+
+    def test_installed_provider_wins(self):
+        replay = ReplayProvider(self.tmp_dir)
+        data_provider.set_provider(replay)
+        self.assertIs(data_provider.get_provider(MagicMock()), replay)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+
+
+def fake_download(failures):
+    """yf.download stand-in; `failures` maps ticker -> number of calls that should come back empty."""
+    calls = []
+
+    def download(tickers, start=None, **kwargs):
+        calls.append(list(tickers))
+        good = []
+        for t in tickers:
+            if failures.get(t, 0) > 0:
+                failures[t] -= 1
+            else:
+                good.append(t)
+        if not good:
+            raise Exception("No data")
+        dates = pd.date_range(start, periods=5)
+        columns = pd.MultiIndex.from_product([["Close", "Open"], good], names=["Price", "Ticker"])
+        return pd.DataFrame(np.ones((5, len(columns))), index=dates, columns=columns)
+
+    return download, calls
+
+
+@patch('logic.time.sleep')
+class TestDownloadHistory(unittest.TestCase):
+    def test_one_threaded_call_for_all_tickers(self, mock_sleep):
+        download, calls = fake_download({})
+        with patch('logic.yf.download', side_effect=download) as mock_download:
+            data = logic.download_history(logic.MARKET_TICKERS, "2024-01-01")
+
+        self.assertEqual(set(data['Close'].columns), set(logic.MARKET_TICKERS))
+        self.assertEqual(calls, [logic.MARKET_TICKERS])
+        self.assertTrue(mock_download.call_args.kwargs["threads"])
+        mock_sleep.assert_not_called()
+
+    def test_downloads_never_overlap(self, mock_sleep):
+        download, _ = fake_download({"DX-Y.NYB": 99, "GC=F": 99, "CL=F": 99})
+        in_flight, overlaps = [0], []
+
+        def exclusive(*args, **kwargs):
+            in_flight[0] += 1
+            overlaps.append(in_flight[0] > 1)
+            try:
+                threading.Event().wait(0.01)  # time.sleep is patched out for the whole class
+                return download(*args, **kwargs)
+            finally:
+                in_flight[0] -= 1
+
+        with patch('logic.yf.download', side_effect=exclusive):
+            logic.download_history(logic.MARKET_TICKERS, "2024-01-01")
+
+        self.assertEqual(len(overlaps), 1 + 3 * logic.DOWNLOAD_RETRIES)
+        self.assertFalse(any(overlaps))
+
+    def test_flaky_ticker_is_retried_alone(self, mock_sleep):
+        download, calls = fake_download({"DX-Y.NYB": 2})
+        with patch('logic.yf.download', side_effect=download):
+            data = logic.download_history(logic.MARKET_TICKERS, "2024-01-01")
+
+        self.assertIn("DX-Y.NYB", data['Close'].columns)
+        self.assertEqual(calls.count(["DX-Y.NYB"]), 2)
+        self.assertEqual(mock_sleep.call_args_list[0][0][0], logic.DOWNLOAD_BACKOFF)
+
+    def test_dead_ticker_does_not_blank_the_rest(self, mock_sleep):
+        download, _ = fake_download({"DX-Y.NYB": 99})
+        with patch('logic.yf.download', side_effect=download):
+            data = logic.download_history(logic.MARKET_TICKERS, "2024-01-01")
+
+        self.assertNotIn("DX-Y.NYB", data['Close'].columns)
+        self.assertEqual(len(data['Close'].columns), len(logic.MARKET_TICKERS) - 1)
+        self.assertEqual(mock_sleep.call_count, logic.DOWNLOAD_RETRIES - 1)
+
+    def test_everything_failing_returns_none(self, mock_sleep):
+        with patch('logic.yf.download', side_effect=Exception("Offline")):
+            self.assertIsNone(logic.download_history(["SPY", "HYG"], "2024-01-01"))
+
+
+if __name__ == '__main__':
+    unittest.main()
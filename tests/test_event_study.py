@@ -0,0 +1,97 @@
+import sys
+import os
+import unittest
+from datetime import timedelta
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import event_study
+
+
+def make_market(periods=1500, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2012-01-02", periods=periods)
+    spx = pd.Series(2000 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, periods))), index=dates)
+    vix = pd.Series(np.clip(18 + np.cumsum(rng.normal(0, 1.2, periods)) * 0.3 + rng.normal(0, 3, periods), 9, 80),
+                    index=dates)
+    return spx, vix
+
+
+def loop_forward(prices, date, days):
+    """analyze_vix's original per-event lookup."""
+    idx_pos = prices.index.searchsorted(date + timedelta(days=days))
+    if idx_pos >= len(prices):
+        return np.nan, np.nan
+    price_t0 = prices[date]
+    start_idx = prices.index.searchsorted(date, side='right')
+    period = prices.iloc[start_idx:idx_pos + 1]
+    return prices.iloc[idx_pos] / price_t0 - 1, period.min() / price_t0 - 1
+
+
+class TestEventStudy(unittest.TestCase):
+    def setUp(self):
+        self.spx, self.vix = make_market()
+
+    def test_forward_matrices_match_per_event_loop(self):
+        returns, minima = event_study.forward_matrices(self.spx, horizons=(5, "90D"))
+        for date in self.spx.index[::37].append(self.spx.index[-70:-60]):
+            want_ret, want_min = loop_forward(self.spx, date, 90)
+            np.testing.assert_allclose([returns.at[date, "90D"], minima.at[date, "90D"]], [want_ret, want_min])
+        i = 100
+        np.testing.assert_allclose(returns[5].iloc[i], self.spx.iloc[i + 5] / self.spx.iloc[i] - 1)
+        np.testing.assert_allclose(minima[5].iloc[i], self.spx.iloc[i + 1:i + 6].min() / self.spx.iloc[i] - 1)
+        self.assertTrue(returns[5].iloc[-5:].isna().all())
+
+    def test_event_study_summary(self):
+        trigger = event_study.crossings(self.vix, 24)
+        events, summary = event_study.event_study(self.spx, trigger, horizons=(21, 63), n_boot=500)
+
+        self.assertEqual(list(events.index), list(self.vix.index[trigger.to_numpy()]))
+        for horizon in (21, 63):
+            rets = events[("Return", horizon)].dropna()
+            row = summary.loc[horizon]
+            self.assertEqual(row["Events"], len(rets))
+            self.assertAlmostEqual(row["Mean"], rets.mean())
+            self.assertAlmostEqual(row["Win_Rate"], (rets > 0).mean())
+            self.assertLessEqual(row["Mean_Lo"], row["Mean"])
+            self.assertGreaterEqual(row["Mean_Hi"], row["Mean"])
+            self.assertLessEqual(row["Worst_Min"], row["Mean_Min"])
+
+    def test_bootstrap_ci_matches_brute_force_resampling(self):
+        rng = np.random.default_rng(3)
+        values = rng.normal(0.01, 0.05, (400, 3))
+        values[::5, 1] = np.nan
+        values[:, 2] = np.nan
+
+        lo, hi = event_study.bootstrap_mean_ci(values, n_boot=3000)
+
+        picks = rng.integers(0, 400, (3000, 400))
+        means = np.nanmean(values[picks, :2], axis=1)
+        want_lo, want_hi = np.percentile(means, event_study.CI, axis=0)
+        np.testing.assert_allclose(lo[:2], want_lo, atol=5e-4)
+        np.testing.assert_allclose(hi[:2], want_hi, atol=5e-4)
+        self.assertTrue(np.isnan(lo[2]) and np.isnan(hi[2]))
+
+    def test_no_events(self):
+        trigger = pd.Series(False, index=self.spx.index)
+        events, summary = event_study.event_study(self.spx, trigger, horizons=(21,))
+        self.assertTrue(events.empty)
+        self.assertEqual(summary.loc[21, "Events"], 0)
+        self.assertTrue(np.isnan(summary.loc[21, "Mean"]))
+
+    def test_shared_forward_matrices_across_triggers(self):
+        forward = event_study.forward_matrices(self.spx, horizons=(21,))
+        for level in range(15, 46):
+            _, reused = event_study.event_study(self.spx, event_study.crossings(self.vix, level),
+                                                n_boot=200, forward=forward)
+            if level == 24:
+                _, fresh = event_study.event_study(self.spx, event_study.crossings(self.vix, level),
+                                                   horizons=(21,), n_boot=200)
+                pd.testing.assert_frame_equal(reused, fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
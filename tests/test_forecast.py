@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
 import numpy as np
+import pandas as pd
 
 # Mock dependencies
 sys.modules["streamlit"] = MagicMock()
@@ -42,7 +43,7 @@ sys.modules["streamlit"].cache_data = mock_cache_data
 # Ensure fetch_market_data returns None or raises exception so we don't proceed to UI logic
 sys.modules["yfinance"].download.side_effect = Exception("Mocked error")
 
-from logic import generate_forecast
+from logic import generate_forecast, generate_forecast_mc
 
 class TestForecast(unittest.TestCase):
     def test_forecast_basic(self):
@@ -85,5 +86,48 @@ class TestForecast(unittest.TestCase):
             width_next = uppers[i+1] - means[i+1]
             self.assertLess(width_i, width_next)
 
+class TestForecastMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        dates = pd.date_range("2020-01-01", periods=800, freq="B")
+        self.price = pd.Series(100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, 800))), index=dates)
+
+    def test_shape_and_ordering(self):
+        dates, median, upper, lower = generate_forecast_mc(self.price, days=30, n_paths=5000)
+
+        self.assertEqual(len(dates), 30)
+        # One bootstrap step per trading day: the dates are the next 30 business days
+        self.assertEqual(dates, list(pd.bdate_range(self.price.index[-1], periods=31)[1:]))
+        self.assertTrue(all(d.weekday() < 5 for d in dates))
+        for lo, mid, hi in zip(lower, median, upper):
+            self.assertLess(lo, mid)
+            self.assertLess(mid, hi)
+        # Bands fan out with the horizon
+        self.assertLess(upper[0] - lower[0], upper[-1] - lower[-1])
+
+    def test_seeded_runs_repeat(self):
+        first = generate_forecast_mc.__wrapped__(self.price, n_paths=2000, seed=3)
+        second = generate_forecast_mc.__wrapped__(self.price, n_paths=2000, seed=3)
+        other = generate_forecast_mc.__wrapped__(self.price, n_paths=2000, seed=4)
+        self.assertEqual(first[1:], second[1:])
+        self.assertNotEqual(first[1], other[1])
+
+    def test_bands_match_numpy_percentile(self):
+        _, median, upper, lower = generate_forecast_mc(self.price, days=5, n_paths=1001, block_size=1, seed=0)
+
+        # Rebuild the same draws and compare against np.percentile on prices
+        returns = np.diff(np.log(self.price.to_numpy()[-757:]))
+        starts = np.random.default_rng(0).integers(0, returns.size, size=(5, 1, 1001)).reshape(5, 1001)
+        paths = self.price.iloc[-1] * np.exp(np.cumsum(returns[starts], axis=0))
+        np.testing.assert_allclose(median, np.percentile(paths, 50, axis=1), rtol=1e-12)
+        np.testing.assert_allclose(upper, np.percentile(paths, 90, axis=1), rtol=1e-3)
+        np.testing.assert_allclose(lower, np.percentile(paths, 10, axis=1), rtol=1e-3)
+
+    def test_short_history_is_flat(self):
+        _, median, upper, lower = generate_forecast_mc(self.price.iloc[:3], days=4)
+        self.assertEqual(median, upper)
+        self.assertEqual(lower, [self.price.iloc[2]] * 4)
+
+
 if __name__ == '__main__':
     unittest.main()
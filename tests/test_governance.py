@@ -0,0 +1,133 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+
+
+def make_closes(periods=300, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2020-01-01", periods=periods, freq="B")
+    walk = lambda scale: 100 * np.exp(np.cumsum(rng.normal(0, scale, periods)))
+    closes = pd.DataFrame({
+        "HYG": walk(0.01), "IEF": walk(0.005), "RSP": walk(0.012),
+        "SPY": walk(0.01), "DX-Y.NYB": walk(0.006),
+        "^VIX": 12 + 25 * rng.random(periods),
+    }, index=dates)
+    return closes
+
+
+def scalar_status(row):
+    """The original per-row if/elif chain, kept as the reference."""
+    stress = (row['Credit_Delta'] < -0.015) or (row['DXY_Delta'] > 0.02)
+    vix = row['VIX'] > 25.0
+    breadth = row['Breadth_Delta'] < -0.025
+    if stress and vix:
+        return "Structural Failure Confirmed"
+    elif row['VIX'] > 30:
+        return "Extreme Volatility"
+    elif stress:
+        return "Credit/Currency Stress"
+    elif vix:
+        return "Elevated Volatility"
+    elif breadth:
+        return "Market Breadth Narrowing"
+    return "System Integrity Nominal"
+
+
+class TestGovernanceSeries(unittest.TestCase):
+    def test_series_matches_scalar_rules_every_day(self):
+        gov_df, status, color, reason = logic.calc_governance({'Close': make_closes()})
+
+        expected = gov_df.apply(scalar_status, axis=1)
+        actual = gov_df['Gov_Reason'].map(lambda code: logic.GOV_STATES[code][2])
+
+        self.assertTrue((expected == actual).all())
+        self.assertEqual(reason, expected.iloc[-1])
+        # Every reason code maps onto one of the four levels
+        for code, level in zip(gov_df['Gov_Reason'], gov_df['Gov_Level']):
+            self.assertEqual(logic.GOV_LEVEL_NAMES[level], logic.GOV_STATES[code][0])
+
+    def test_score_governance_priorities(self):
+        nan = np.nan
+        codes = logic.score_governance(
+            credit_delta=[-0.02, 0.0, -0.02, 0.0, 0.0, nan],
+            vix=[26.0, 31.0, 20.0, 26.0, 20.0, nan],
+            breadth_delta=[0.0, 0.0, 0.0, 0.0, -0.03, nan],
+            dxy_delta=[0.0, 0.0, 0.0, 0.0, 0.0, nan],
+        )
+        self.assertEqual(codes.tolist(), [0, 1, 2, 3, 4, 5])
+
+    def test_empty_frame_is_system_boot(self):
+        _, status, _, _ = logic.calc_governance({'Close': make_closes().iloc[:0]})
+        self.assertEqual(status, "SYSTEM BOOT")
+
+
+class TestGovernanceEngine(unittest.TestCase):
+    def test_streaming_matches_batch(self):
+        closes = make_closes(periods=120, seed=1)
+        gov_df, _, _, _ = logic.calc_governance({'Close': closes})
+
+        engine = logic.GovernanceEngine()
+        for date, row in closes.iterrows():
+            engine.update(row)
+            self.assertEqual(engine.latest['Gov_Reason'], gov_df.loc[date, 'Gov_Reason'])
+            self.assertTrue(np.allclose(engine.latest['Credit_Delta'], gov_df.loc[date, 'Credit_Delta'], equal_nan=True))
+
+    def test_from_history_then_revise_current_bar(self):
+        closes = make_closes(periods=60, seed=2)
+        engine = logic.GovernanceEngine.from_history(closes.iloc[:-1])
+        engine.update(closes.iloc[-1])
+        first = dict(engine.latest)
+
+        # An intraday revision replaces the last bar instead of advancing the window
+        revised = closes.iloc[-1].copy()
+        revised["^VIX"] = 45.0
+        status, _, _ = engine.update(revised, new_bar=False)
+
+        self.assertEqual(engine.latest['Breadth_Delta'], first['Breadth_Delta'])
+        self.assertEqual(status, "DEFENSIVE MODE")
+        gov_df, _, _, _ = logic.calc_governance({'Close': closes})
+        self.assertEqual(first['Gov_Reason'], gov_df['Gov_Reason'].iloc[-1])
+
+
+class TestGovernancePanel(unittest.TestCase):
+    def test_default_universe_matches_calc_governance(self):
+        closes = make_closes(seed=3)
+        gov_df, _, _, _ = logic.calc_governance({'Close': closes})
+
+        reasons, levels = logic.calc_governance_panel(closes, [logic.DEFAULT_UNIVERSE])
+
+        self.assertEqual(reasons["US Core"].tolist(), gov_df['Gov_Reason'].tolist())
+        self.assertEqual(levels["US Core"].tolist(), gov_df['Gov_Level'].tolist())
+
+    def test_each_universe_uses_its_own_pairs_and_thresholds(self):
+        closes = make_closes(seed=4)
+        closes["EWU"] = closes["SPY"] * 1.1
+        universes = pd.DataFrame([
+            logic.DEFAULT_UNIVERSE,
+            dict(logic.DEFAULT_UNIVERSE, name="Loose VIX", vix_panic=99.0, vix_extreme=99.0),
+            dict(logic.DEFAULT_UNIVERSE, name="No Dollar", breadth_mkt="EWU", dollar=None),
+        ])
+
+        reasons, _ = logic.calc_governance_panel(closes, universes)
+
+        self.assertEqual(list(reasons.columns), ["US Core", "Loose VIX", "No Dollar"])
+        self.assertFalse(reasons["Loose VIX"].isin([0, 1, 3]).any())
+        no_dollar = closes.drop(columns=["DX-Y.NYB"]).assign(**{"DX-Y.NYB": np.nan, "SPY": closes["EWU"]})
+        gov_df, _, _, _ = logic.calc_governance({'Close': no_dollar})
+        self.assertEqual(reasons["No Dollar"].tolist(), gov_df['Gov_Reason'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import data_provider, history_archive
+from src.history_archive import HistoryArchive, load_history
+
+
+class FakeSource(data_provider.DataProvider):
+    def __init__(self):
+        self.calls = []
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        self.calls.append((list(tickers), start))
+        dates = pd.bdate_range("2007-01-01", pd.Timestamp.now().normalize())
+        dates = dates[dates >= pd.Timestamp(start)]
+        columns = pd.MultiIndex.from_product([["Close", "Open"], tickers], names=["Price", "Ticker"])
+        values = np.arange(len(dates) * len(columns), dtype=float).reshape(len(dates), -1) / 7
+        data = pd.DataFrame(values, index=dates, columns=columns)
+        if "^VIX" in tickers:
+            data.loc[dates[:5], (slice(None), "^VIX")] = np.nan  # Listed later than the rest
+        return data
+
+
+class TestHistoryArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_round_trips_download_frame(self):
+        data = FakeSource().download(["SPY", "^VIX"], start="2020-01-01")
+        HistoryArchive(self.tmp_dir).write(data)
+
+        archive = HistoryArchive(self.tmp_dir)
+        pd.testing.assert_frame_equal(archive.download(["SPY", "^VIX"]), data, check_freq=False, check_index_type=False)
+        vix = archive.download(["^VIX"])
+        self.assertEqual(vix.index[0], data.index[5])
+        self.assertIsInstance(archive._rows("SPY"), np.memmap)
+
+    def test_slices_dates_with_exclusive_end(self):
+        data = FakeSource().download(["SPY"], start="2020-01-01")
+        archive = HistoryArchive(self.tmp_dir)
+        archive.write(data)
+
+        window = archive.download(["SPY"], start="2020-02-01", end="2020-03-02")
+        expected = data[(data.index >= "2020-02-01") & (data.index < "2020-03-02")]
+        pd.testing.assert_frame_equal(window, expected, check_freq=False, check_index_type=False)
+        self.assertIsNone(archive.download(["QQQ"]))
+
+    def test_load_history_downloads_once(self):
+        source = FakeSource()
+        first = load_history(["SPY", "^VIX"], "2015-01-01", source=source, root_dir=self.tmp_dir)
+        again = load_history(["^VIX"], "2016-01-01", source=source, root_dir=self.tmp_dir)
+
+        self.assertEqual(len(source.calls), 1)
+        pd.testing.assert_frame_equal(again, first.loc[first.index >= "2016-01-01", (slice(None), ["^VIX"])].dropna(how="all"),
+                                      check_freq=False, check_index_type=False)
+
+    def test_load_history_extends_for_new_tickers_and_earlier_starts(self):
+        source = FakeSource()
+        load_history(["SPY"], "2015-01-01", source=source, root_dir=self.tmp_dir)
+        load_history(["HYG"], "2010-01-01", source=source, root_dir=self.tmp_dir)
+
+        self.assertEqual(source.calls[-1], (["SPY", "HYG"], "2010-01-01"))
+        archive = HistoryArchive(self.tmp_dir)
+        self.assertTrue(archive.covers(["SPY", "HYG"], "2012-01-01"))
+        self.assertFalse(archive.covers(["SPY"], "2008-01-01"))
+
+    def test_fetch_history_bypasses_archive_unless_enabled(self):
+        source = FakeSource()
+        with patch.dict(os.environ, {"ALPHA_SWARM_ARCHIVE_DIR": ""}):
+            history_archive.fetch_history(["SPY"], "2020-01-01", source=source)
+        self.assertFalse(os.listdir(self.tmp_dir))
+
+        with patch.dict(os.environ, {"ALPHA_SWARM_ARCHIVE_DIR": self.tmp_dir}):
+            history_archive.fetch_history(["SPY"], "2020-01-01", source=source)
+            history_archive.fetch_history(["SPY"], "2020-01-01", source=source)
+        self.assertEqual(len(source.calls), 2)
+        self.assertIn(history_archive.CURRENT_FILE, os.listdir(self.tmp_dir))
+
+    def test_reader_keeps_its_version_across_rewrites(self):
+        source = FakeSource()
+        HistoryArchive(self.tmp_dir).write(source.download(["SPY", "HYG"], start="2015-01-01"))
+        reader = HistoryArchive(self.tmp_dir)
+        before = reader.download(["SPY"])  # Pins the version and its calendar; HYG is not mapped yet
+
+        # Widened to an earlier start: every row moves in the new files
+        HistoryArchive(self.tmp_dir).write(source.download(["SPY", "HYG"], start="2010-01-01"))
+        hyg = reader.download(["HYG"])
+
+        pd.testing.assert_index_equal(hyg.index, before.index)
+        expected = source.download(["SPY", "HYG"], start="2015-01-01")["Close"]["HYG"]
+        np.testing.assert_array_equal(hyg["Close"]["HYG"].to_numpy(), expected.to_numpy())
+        self.assertEqual(HistoryArchive(self.tmp_dir).start, pd.Timestamp("2010-01-01"))
+
+    def test_rewrites_prune_all_but_two_versions(self):
+        source = FakeSource()
+        HistoryArchive(self.tmp_dir).write(source.download(["SPY"], start="2020-01-01"))
+        pinned = HistoryArchive(self.tmp_dir)
+        self.assertEqual(pinned.tickers, ["SPY"])  # Pins the first version
+        for start in ["2019-01-01", "2018-01-01"]:
+            HistoryArchive(self.tmp_dir).write(source.download(["SPY"], start=start))
+
+        versions = [name for name in os.listdir(self.tmp_dir) if name != history_archive.CURRENT_FILE]
+        self.assertEqual(len(versions), 2)
+        # The pinned version was pruned: the reader re-pins to the current one
+        self.assertEqual(pinned.download(["SPY"]).index[0], pd.Timestamp("2018-01-01"))
+
+if __name__ == '__main__':
+    unittest.main()
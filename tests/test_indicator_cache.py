@@ -0,0 +1,64 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+from src import indicator_memo
+
+
+class TestIndicatorCache(unittest.TestCase):
+    def setUp(self):
+        logic.clear_indicator_cache()
+        dates = pd.date_range("2020-01-01", periods=200)
+        self.price = pd.Series(100 + np.random.default_rng(0).normal(0, 1, 200).cumsum(), index=dates, name="SPY")
+
+    def test_equal_content_hits_cache(self):
+        first = logic.calc_ppo(self.price)
+        # A copy is a different object with the same content
+        second = logic.calc_ppo(self.price.copy())
+        self.assertIs(first, second)
+
+    def test_changed_data_or_params_miss(self):
+        base = logic.calc_cone(self.price)
+        bumped = self.price.copy()
+        bumped.iloc[-1] += 1.0
+
+        self.assertIsNot(logic.calc_cone(bumped), base)
+        self.assertIsNot(logic.calc_cone(self.price, window=50), base)
+        self.assertIsNot(logic.calc_cone(self.price.rename("QQQ")), base)
+
+    def test_computes_once_per_data_version(self):
+        with patch.object(pd.Series, "ewm", autospec=True, side_effect=pd.Series.ewm) as mock_ewm:
+            logic.calc_ppo(self.price)
+            logic.calc_ppo(self.price)
+            logic.calc_ppo(self.price)
+        self.assertEqual(mock_ewm.call_count, 3)  # fast, slow and signal EMAs, once
+
+    def test_cache_is_bounded(self):
+        for i in range(logic.INDICATOR_CACHE_SIZE + 5):
+            logic.calc_cone(self.price + i)
+        self.assertEqual(len(indicator_memo._indicator_cache), logic.INDICATOR_CACHE_SIZE)
+
+    def test_same_name_in_different_modules(self):
+        def memoized(module, value):
+            def calc(price):
+                return value
+            calc.__module__ = module
+            return indicator_memo.memoize_indicator(calc)
+
+        first, second = memoized("src.breadth", 1), memoized("src.sector_rotation", 2)
+        self.assertEqual((first(self.price), second(self.price)), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
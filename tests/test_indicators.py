@@ -0,0 +1,85 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+
+
+def make_panel(periods=400, tickers=40, seed=0):
+    rng = np.random.default_rng(seed)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (periods, tickers)), axis=0))
+    values[:60, :5] = np.nan      # Late listings
+    values[150:153, 7] = np.nan   # Interior gap
+    values[200, :] = np.nan       # Market-wide missing bar
+    values[:, 9] = np.nan         # Never traded
+    return pd.DataFrame(values, index=pd.date_range("2020-01-01", periods=periods, freq="B"),
+                        columns=[f"T{i}" for i in range(tickers)])
+
+
+class TestEmaMatrix(unittest.TestCase):
+    def test_matches_pandas_ewm(self):
+        closes = make_panel()
+        for span in (9, 12, 26):
+            expected = closes.ewm(span=span, adjust=False).mean().to_numpy()
+            actual = logic.ema_matrix(closes.to_numpy(), span)
+            np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=0)
+            np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+
+    def test_one_dimensional_input(self):
+        price = make_panel()["T0"]
+        expected = price.ewm(span=12, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(logic.ema_matrix(price.to_numpy(), 12), expected, rtol=1e-12)
+
+    def test_long_gap_free_history_stays_exact(self):
+        rng = np.random.default_rng(1)
+        closes = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0, 0.01, (3000, 4)), axis=0)))
+        expected = closes.ewm(span=26, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(logic.ema_matrix(closes.to_numpy(), 26), expected, rtol=1e-12)
+
+
+class TestPpoPanel(unittest.TestCase):
+    def test_matches_calc_ppo_per_ticker(self):
+        logic.clear_indicator_cache()
+        closes = make_panel()
+        ppo, sig, hist = logic.calc_ppo_panel(closes)
+
+        self.assertEqual(list(ppo.columns), list(closes.columns))
+        for ticker in closes.columns:
+            expected = logic.calc_ppo(closes[ticker])
+            for got, want in zip((ppo, sig, hist), expected):
+                np.testing.assert_allclose(got[ticker].to_numpy(), want.to_numpy(), rtol=1e-12, atol=1e-12)
+
+
+class TestConePanel(unittest.TestCase):
+    def test_matches_calc_cone_for_every_window(self):
+        logic.clear_indicator_cache()
+        closes = make_panel() * 40  # Index-level prices stress the running sums
+        cones = logic.calc_cone_panel(closes, windows=(10, 20, 50), z_levels=(1.0, 1.28))
+
+        for window in (10, 20, 50):
+            sma, std, bands = cones[window]
+            for ticker in ["T0", "T7", "T9", "T12"]:
+                want_sma, want_std, want_up, want_low = logic.calc_cone(closes[ticker], window=window, z=1.28)
+                np.testing.assert_allclose(sma[ticker], want_sma, rtol=1e-9)
+                np.testing.assert_allclose(std[ticker], want_std, rtol=1e-6)
+                np.testing.assert_allclose(bands[1.28][0][ticker], want_up, rtol=1e-9)
+                np.testing.assert_allclose(bands[1.28][1][ticker], want_low, rtol=1e-9)
+            self.assertEqual(set(bands), {1.0, 1.28})
+
+    def test_window_longer_than_history(self):
+        sma, std, _ = logic.calc_cone_panel(make_panel().iloc[:30], windows=(50,))[50]
+        self.assertTrue(sma.isna().all().all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import importlib
+import concurrent.futures
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules["streamlit"] = MagicMock()
+sys.modules["yfinance"] = MagicMock()
+
+def mock_cache_data(*args, **kwargs):
+    if len(args) == 1 and callable(args[0]):
+        return args[0]
+    def decorator(func):
+        return func
+    return decorator
+
+mock_st = sys.modules["streamlit"]
+mock_st.cache_data = mock_cache_data
+
+import logic
+from price_store import PriceStore
+
+
+def make_download(tickers, dates, base=100.0):
+    """Builds a yf.download-shaped (field, ticker) frame."""
+    fields = ["Close", "High", "Low", "Open", "Volume"]
+    columns = pd.MultiIndex.from_product([fields, tickers], names=["Price", "Ticker"])
+    values = base + np.arange(len(dates) * len(columns), dtype=float).reshape(len(dates), len(columns))
+    return pd.DataFrame(values, index=dates, columns=columns)
+
+
+def serve_quotes(quotes, factor=1.0):
+    """yf.download stand-in answering every request from one quote table, scaled by an adjustment factor."""
+    def download(tickers, start, **kwargs):
+        rows = quotes.index >= pd.Timestamp(start)
+        return quotes.loc[rows, quotes.columns.get_level_values(1).isin(tickers)] * factor
+    return download
+
+
+class TestPriceStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = PriceStore(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_round_trip_matches_download_shape(self):
+        dates = pd.date_range("2024-01-01", periods=5)
+        data = make_download(["SPY", "^VIX"], dates)
+
+        self.store.update(data)
+        loaded = self.store.load(["SPY", "^VIX"])
+
+        self.assertEqual(list(loaded.columns.names), ["Price", "Ticker"])
+        pd.testing.assert_series_equal(loaded["Close"]["SPY"], data["Close"]["SPY"], check_names=False, check_freq=False)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir, "%5EVIX.parquet")))
+
+    def test_update_merges_and_overwrites_overlap(self):
+        self.store.update(make_download(["SPY"], pd.date_range("2024-01-01", periods=5)))
+        top_up = make_download(["SPY"], pd.date_range("2024-01-04", periods=4), base=500.0)
+
+        self.store.update(top_up)
+        stored = self.store.read("SPY")
+
+        self.assertEqual(len(stored), 7)
+        self.assertEqual(stored.loc["2024-01-04", "Close"], 500.0)
+        self.assertTrue(stored.index.is_monotonic_increasing)
+
+    def test_top_up_starts(self):
+        self.assertEqual(self.store.top_up_starts(["SPY"], "2024-01-01"), {"SPY": pd.Timestamp("2024-01-01")})
+
+        self.store.update(make_download(["SPY", "HYG"], pd.date_range("2024-01-01", periods=10)))
+        self.store.update(make_download(["IEF"], pd.date_range("2024-01-05", periods=20)))
+        starts = self.store.top_up_starts(["SPY", "HYG", "IEF", "GLD"], "2024-01-01")
+
+        top_up = pd.Timestamp("2024-01-10") - pd.Timedelta(days=3)
+        self.assertEqual(starts["SPY"], top_up)
+        self.assertEqual(starts["HYG"], top_up)
+        self.assertEqual(starts["IEF"], pd.Timestamp("2024-01-24") - pd.Timedelta(days=3))
+        # Only the ticker with nothing on disk needs the full range
+        self.assertEqual(starts["GLD"], pd.Timestamp("2024-01-01"))
+
+    def test_top_up_starts_backfills_short_history(self):
+        # Stored by a loader that asked for less history than we need now
+        self.store.update(make_download(["SPY"], pd.date_range("2024-06-01", periods=30)))
+        self.assertEqual(self.store.top_up_starts(["SPY"], "2022-01-01")["SPY"], pd.Timestamp("2022-01-01"))
+        # A first bar within a few days of the start still counts as covered
+        self.assertEqual(self.store.top_up_starts(["SPY"], "2024-05-29")["SPY"],
+                         self.store.last_date("SPY") - pd.Timedelta(days=3))
+
+    def test_concurrent_writes_of_one_ticker(self):
+        frame = make_download(["SPY"], pd.date_range("2024-01-01", periods=50)).xs("SPY", axis=1, level=1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: self.store.write("SPY", frame), range(32)))
+
+        pd.testing.assert_frame_equal(self.store.read("SPY"), frame, check_freq=False)
+        self.assertEqual(os.listdir(self.tmp_dir), ["SPY.parquet"])
+
+    def test_load_missing_returns_none(self):
+        self.assertIsNone(self.store.load(["SPY"]))
+
+
+class TestFetchMarketDataStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.env_patcher = patch.dict(os.environ, {"ALPHA_SWARM_STORE_DIR": self.tmp_dir})
+        self.env_patcher.start()
+        # Other test modules swap in their own streamlit mock; reload against ours
+        with patch.dict(sys.modules, {"streamlit": mock_st}):
+            importlib.reload(logic)
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    @patch('logic.yf.download')
+    def test_tops_up_from_last_stored_date(self, mock_download):
+        today = pd.Timestamp.now().normalize()
+        history = make_download(logic.MARKET_TICKERS, pd.date_range(today - pd.Timedelta(days=1825), today - pd.Timedelta(days=2)))
+        PriceStore(self.tmp_dir).update(history)
+        mock_download.return_value = make_download(logic.MARKET_TICKERS, pd.date_range(end=today, periods=2), base=900.0)
+
+        data = logic.fetch_market_data()
+
+        requested_start = mock_download.call_args[1]["start"]
+        self.assertEqual(pd.Timestamp(requested_start), today - pd.Timedelta(days=5))
+        self.assertEqual(len(data), len(history) + 2)
+        self.assertEqual(data["Open"]["SPY"].iloc[-1], mock_download.return_value["Open"]["SPY"].iloc[-1])
+
+    @patch('logic.yf.download')
+    def test_downloads_grouped_by_start(self, mock_download):
+        today = pd.Timestamp.now().normalize()
+        quotes = make_download(logic.MARKET_TICKERS, pd.date_range(today - pd.Timedelta(days=1825), today))
+        stored = quotes[quotes.index <= today - pd.Timedelta(days=2)]
+        current = [t for t in logic.MARKET_TICKERS if t != "GC=F"]
+        PriceStore(self.tmp_dir).update(stored.loc[:, stored.columns.get_level_values(1).isin(current)])
+        # A short history left behind by a loader with a later start
+        PriceStore(self.tmp_dir).update(stored.loc[:, stored.columns.get_level_values(1) == "GC=F"].tail(5))
+        mock_download.side_effect = serve_quotes(quotes)
+
+        data = logic.fetch_market_data()
+
+        requests = {tuple(call.args[0]): call.kwargs["start"] for call in mock_download.call_args_list}
+        backfill = [start for tickers, start in requests.items() if "GC=F" in tickers]
+        self.assertEqual(backfill, [(today - pd.Timedelta(days=1825)).strftime('%Y-%m-%d')])
+        self.assertTrue(all(pd.Timestamp(start) == today - pd.Timedelta(days=5)
+                            for tickers, start in requests.items() if "GC=F" not in tickers))
+        self.assertEqual(data["Close"]["GC=F"].first_valid_index(), today - pd.Timedelta(days=1825))
+
+    @patch('logic.yf.download')
+    def test_readjusted_history_is_downloaded_whole(self, mock_download):
+        today = pd.Timestamp.now().normalize()
+        quotes = make_download(logic.MARKET_TICKERS, pd.bdate_range(today - pd.Timedelta(days=1825), today))
+
+        mock_download.side_effect = serve_quotes(quotes)
+        logic.fetch_market_data()
+        # An ex-dividend date: yfinance now scales every earlier bar down
+        mock_download.side_effect = serve_quotes(quotes, factor=0.99)
+        mock_download.reset_mock()
+
+        data = logic.fetch_market_data()
+
+        starts = [pd.Timestamp(call.kwargs["start"]) for call in mock_download.call_args_list]
+        self.assertEqual(max(starts), quotes.index[-1] - pd.Timedelta(days=3))  # The top-up
+        self.assertEqual(min(starts), today - pd.Timedelta(days=1825))  # The full re-download
+        expected = quotes["Close"]["HYG"] * 0.99
+        np.testing.assert_allclose(data["Close"]["HYG"].to_numpy(), expected.to_numpy())
+        np.testing.assert_allclose(PriceStore(self.tmp_dir).read("HYG")["Close"].to_numpy(), expected.to_numpy())
+
+    @patch('logic.yf.download')
+    def test_serves_download_when_store_write_fails(self, mock_download):
+        today = pd.Timestamp.now().normalize()
+        quotes = make_download(logic.MARKET_TICKERS, pd.bdate_range(today - pd.Timedelta(days=1825), today))
+        PriceStore(self.tmp_dir).update(quotes[quotes.index <= today - pd.Timedelta(days=20)])
+        mock_download.side_effect = serve_quotes(quotes)
+
+        with patch.object(PriceStore, "write", side_effect=PermissionError("read-only volume")):
+            data = logic.fetch_market_data()
+
+        self.assertEqual(data.index[-1], quotes.index[-1])
+        np.testing.assert_array_equal(data["Close"]["SPY"].to_numpy(), quotes["Close"]["SPY"].to_numpy())
+
+    @patch('logic.time.sleep')
+    @patch('logic.yf.download')
+    def test_serves_store_when_network_fails(self, mock_download, mock_sleep):
+        history = make_download(logic.MARKET_TICKERS, pd.date_range(end=pd.Timestamp.now().normalize(), periods=10))
+        PriceStore(self.tmp_dir).update(history)
+        mock_download.side_effect = Exception("Network down")
+
+        data = logic.fetch_market_data()
+
+        self.assertIsNotNone(data)
+        self.assertEqual(len(data), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
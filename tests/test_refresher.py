@@ -0,0 +1,94 @@
+import sys
+import os
+import time
+import threading
+import unittest
+from unittest.mock import patch
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from refresher import BackgroundRefresher
+
+
+class SequenceLoader:
+    """Returns the queued results in order, raising any that are exceptions."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        result = self.results.pop(0) if self.results else None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestBackgroundRefresher(unittest.TestCase):
+    def test_cold_start_loads_once(self):
+        loader = SequenceLoader(["v1"])
+        r = BackgroundRefresher(loader, interval=60)
+        try:
+            self.assertEqual(r.get(), "v1")
+            self.assertEqual(r.get(), "v1")
+            self.assertEqual(loader.calls, 1)
+        finally:
+            r.stop()
+
+    def test_failed_refresh_keeps_last_good_value(self):
+        loader = SequenceLoader(["v1", None, Exception("Feed down")])
+        r = BackgroundRefresher(loader, interval=60)
+        try:
+            r.get()
+            self.assertFalse(r.refresh())
+            self.assertFalse(r.refresh())
+            self.assertEqual(r.get(), "v1")
+            self.assertIsInstance(r.last_error, Exception)
+        finally:
+            r.stop()
+
+    def test_background_thread_swaps_in_new_value(self):
+        loader = SequenceLoader(["v1", "v2"])
+        r = BackgroundRefresher(loader, interval=0.05)
+        try:
+            self.assertEqual(r.get(), "v1")
+            deadline = time.time() + 2
+            while r.get() != "v2" and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(r.get(), "v2")
+        finally:
+            r.stop()
+
+    def test_no_thread_until_first_good_value(self):
+        r = BackgroundRefresher(SequenceLoader([None]), interval=60)
+        self.assertIsNone(r.get())
+        self.assertIsNone(r._thread)
+
+    def test_concurrent_sessions_start_one_thread(self):
+        r = BackgroundRefresher(SequenceLoader(["v1"]), interval=60)
+        r.refresh()
+        real_thread = threading.Thread
+        created = []
+
+        def slow_thread(*args, **kwargs):
+            time.sleep(0.02)  # Widens the gap between the alive check and the start
+            created.append(real_thread(*args, **kwargs))
+            return created[-1]
+
+        barrier = threading.Barrier(8)
+        sessions = [real_thread(target=lambda: (barrier.wait(), r.get())) for _ in range(8)]
+        try:
+            with patch("refresher.threading.Thread", side_effect=slow_thread):
+                for session in sessions:
+                    session.start()
+                for session in sessions:
+                    session.join()
+            self.assertEqual(len(created), 1)
+        finally:
+            r.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+sys.modules.setdefault("yfinance", MagicMock())
+
+from src import cache_backend, data_provider, sector_metadata
+
+
+class CountingProvider(data_provider.DataProvider):
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+        self._lock = threading.Lock()
+
+    def info(self, ticker):
+        with self._lock:
+            self.calls.append(ticker)
+        if ticker in self.fail:
+            raise RuntimeError("throttled")
+        return {"sector": "Energy", "industry": "Oil", "quoteType": "EQUITY", "longBusinessSummary": "..."}
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_sustained_rate(self):
+        clock = [0.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch.object(sector_metadata.time, "monotonic", lambda: clock[0]), \
+                patch.object(sector_metadata.time, "sleep", fake_sleep):
+            bucket = sector_metadata.TokenBucket(rate=2.0, capacity=3)
+            for _ in range(7):
+                bucket.acquire()
+        # 3 immediate, then one every 0.5 s
+        self.assertAlmostEqual(clock[0], 2.0)
+        self.assertTrue(all(s > 0 for s in sleeps))
+
+
+class TestSectorMetadata(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        cache_backend.set_cache_backend(cache_backend.SQLiteCacheBackend(os.path.join(self.tmp_dir, "cache.sqlite")))
+        sector_metadata.rate_limiter = sector_metadata.TokenBucket(rate=1000.0, capacity=1000)
+
+    def tearDown(self):
+        cache_backend.set_cache_backend(None)
+        data_provider.set_provider(None)
+        sector_metadata.rate_limiter = sector_metadata.TokenBucket()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_universe_covers_sector_map(self):
+        universe = sector_metadata.load_universe()
+        self.assertEqual(universe["XOM"], "Energy")
+        self.assertEqual(universe["BRK-B"], "Financials")
+        self.assertGreater(len(universe), 100)
+
+    def test_warm_cache_skips_upstream(self):
+        provider = CountingProvider()
+        data_provider.set_provider(provider)
+        tickers = list(sector_metadata.load_universe())
+
+        first = sector_metadata.get_universe_info(tickers)
+        second = sector_metadata.get_universe_info(tickers)
+
+        self.assertEqual(len(provider.calls), len(tickers))
+        self.assertEqual(first, second)
+        self.assertEqual(first["XOM"], {"sector": "Energy", "industry": "Oil", "quoteType": "EQUITY", "shortName": None})
+
+    def test_failures_are_retried_next_time(self):
+        provider = CountingProvider(fail={"CVX"})
+        data_provider.set_provider(provider)
+
+        self.assertIsNone(sector_metadata.get_universe_info(["XOM", "CVX"])["CVX"])
+        provider.fail.clear()
+        self.assertEqual(sector_metadata.get_universe_info(["XOM", "CVX"])["CVX"]["sector"], "Energy")
+        self.assertEqual(sorted(provider.calls), ["CVX", "CVX", "XOM"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import sys
+import os
+import time
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+from src import sector_rotation
+
+
+def make_universe(sector_map, periods=300, seed=0):
+    rng = np.random.default_rng(seed)
+    tickers = logic.sector_universe(sector_map) + ["SPY"]
+    drift = np.linspace(-0.001, 0.001, len(tickers))
+    values = 100 * np.exp(np.cumsum(rng.normal(drift, 0.01, (periods, len(tickers))), axis=0))
+    closes = pd.DataFrame(values, index=pd.bdate_range("2023-01-02", periods=periods), columns=tickers)
+    return closes
+
+
+class TestSectorRotation(unittest.TestCase):
+    def setUp(self):
+        logic.clear_indicator_cache()
+        self.sector_map = {"Energy": ["XOM", "CVX", "COP"], "Technology": ["AAPL", "MSFT"], "Utilities": ["NEE"]}
+        self.closes = make_universe(self.sector_map)
+
+    def test_constituent_relative_strength(self):
+        result = sector_rotation.calc_sector_rotation(self.closes, self.sector_map, lookbacks=(21, 63))
+        table = result['constituents']
+        rel = self.closes["MSFT"] / self.closes["SPY"]
+        self.assertAlmostEqual(table.at["MSFT", "RS_63"], rel.iloc[-1] / rel.iloc[-64] - 1)
+        self.assertEqual(table.at["MSFT", "Sector"], "Technology")
+        self.assertEqual(set(table.loc[table.Sector == "Energy", "Sector_Rank"]), {1, 2, 3})
+        self.assertEqual(table["Rank"].min(), 1)
+        best = table["Composite"].idxmax()
+        self.assertEqual(table.at[best, "Rank"], 1)
+
+    def test_sector_composite_is_equal_weight(self):
+        composite = sector_rotation.sector_composites(self.closes, self.sector_map)
+        daily = self.closes[["XOM", "CVX", "COP"]].pct_change().mean(axis=1).fillna(0.0)
+        np.testing.assert_allclose(composite["Energy"], (1 + daily).cumprod())
+        np.testing.assert_allclose(composite["Utilities"], self.closes["NEE"] / self.closes["NEE"].iloc[0])
+
+    def test_quadrants_follow_coordinates(self):
+        result = sector_rotation.calc_sector_rotation(self.closes, self.sector_map)
+        sectors = result['sectors']
+        for sector, row in sectors.iterrows():
+            leading = row.RS_Ratio > 100
+            rising = row.RS_Momentum > 100
+            expected = {(True, True): "Leading", (True, False): "Weakening",
+                        (False, True): "Improving", (False, False): "Lagging"}[(leading, rising)]
+            self.assertEqual(row.Quadrant, expected)
+        self.assertEqual(list(result['rs_ratio'].columns), list(self.sector_map))
+        self.assertAlmostEqual(result['rs_ratio'].iloc[-1]["Energy"], sectors.at["Energy", "RS_Ratio"])
+
+    def test_short_or_missing_history(self):
+        closes = self.closes.iloc[:30].drop(columns=["NEE"])
+        result = sector_rotation.calc_sector_rotation(closes, self.sector_map)
+        self.assertNotIn("NEE", result['constituents'].index)
+        self.assertTrue(result['sectors']["RS_63"].isna().all())
+        self.assertTrue(result['sectors']["Quadrant"].isna().all())
+
+    def test_full_map_refreshes_quickly(self):
+        sector_map = logic.load_sector_map()
+        closes = make_universe(sector_map, periods=500)
+        start = time.perf_counter()
+        result = sector_rotation.calc_sector_rotation(closes, sector_map)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len(result['sectors']), len(sector_map))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import sys
 import os
 import unittest
 import importlib
+import pandas as pd
 from unittest.mock import MagicMock, patch
 
 # Add repo root to path so we can import styles
@@ -11,10 +12,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 mock_streamlit = MagicMock()
 mock_plotly = MagicMock()
 mock_plotly_go = MagicMock()
+mock_plotly_subplots = MagicMock()
 
 sys.modules['streamlit'] = mock_streamlit
 sys.modules['plotly'] = mock_plotly
 sys.modules['plotly.graph_objects'] = mock_plotly_go
+sys.modules['plotly.subplots'] = mock_plotly_subplots
 
 import styles
 
@@ -63,5 +66,62 @@ class TestStyles(unittest.TestCase):
             paper_bgcolor='rgba(0,0,0,0)'
         )
 
+    @patch('styles.make_subplots')
+    @patch('styles.go')
+    def test_render_deep_dive_slices_to_the_window(self, mock_go, mock_subplots):
+        dates = pd.date_range("2024-01-01", periods=10, freq="B")
+        series = pd.Series(range(10), index=dates, dtype=float)
+        window = pd.concat({field: pd.DataFrame({"SPY": series}) for field in ("Open", "High", "Low", "Close")}, axis=1).iloc[6:]
+        theme = {"CHART_TEMPLATE": "plotly_white", "CHART_FONT": "#111111", "ACCENT_GOLD": "#C6A87C"}
+
+        fig = self.styles.render_deep_dive(window, (series + 1, series - 1), (series, series, series - 5), theme=theme)
+
+        self.assertEqual(fig, mock_subplots.return_value)
+        lower = mock_go.Scatter.call_args_list[0].kwargs['y']
+        self.assertEqual(list(lower.index), list(dates[6:]))
+        bar = mock_go.Bar.call_args.kwargs
+        self.assertEqual(bar['marker_color'], ['#00ff00', '#00ff00', '#00ff00', '#00ff00'])
+        self.assertEqual(fig.add_trace.call_count, 6)  # No forecast overlay
+
+    @patch('styles.make_subplots')
+    @patch('styles.go')
+    def test_render_deep_dive_bounds_long_histories(self, mock_go, mock_subplots):
+        dates = pd.date_range("2015-01-01", periods=2600, freq="B")
+        series = pd.Series(range(2600), index=dates, dtype=float)
+        window = pd.concat({field: pd.DataFrame({"SPY": series}) for field in ("Open", "High", "Low", "Close")}, axis=1)
+        theme = {"CHART_TEMPLATE": "plotly_white", "CHART_FONT": "#111111", "ACCENT_GOLD": "#C6A87C"}
+
+        self.styles.render_deep_dive(window, (series + 1, series - 1), (series, series, series - 5), theme=theme, target_px=1200)
+
+        candles = mock_go.Candlestick.call_args.kwargs
+        self.assertLessEqual(len(candles['x']), 300)
+        self.assertEqual(len(mock_go.Bar.call_args.kwargs['marker_color']), len(candles['x']))
+        for call in mock_go.Scatter.call_args_list:
+            self.assertLessEqual(len(call.kwargs['y']), 600)
+
+    def test_cached_figure_json_builds_once_per_key(self):
+        self.styles.clear_figure_cache()
+        build = MagicMock()
+        build.return_value.to_json.side_effect = lambda: f"fig{build.call_count}"
+        light = self.styles.theme_key({"CHART_TEMPLATE": "plotly_white"})
+        dark = self.styles.theme_key({"CHART_TEMPLATE": "plotly_dark"})
+
+        first = self.styles.cached_figure_json(("v1", "Tactical", light), build)
+        again = self.styles.cached_figure_json(("v1", "Tactical", light), build)
+        other = self.styles.cached_figure_json(("v1", "Tactical", dark), build)
+
+        self.assertEqual((first, again, other), ("fig1", "fig1", "fig2"))
+        self.assertEqual(build.call_count, 2)
+
+    def test_figure_cache_is_bounded(self):
+        self.styles.clear_figure_cache()
+        build = MagicMock()
+        build.return_value.to_json.return_value = "{}"
+        for version in range(self.styles.FIGURE_CACHE_SIZE + 1):
+            self.styles.cached_figure_json((version,), build)
+
+        self.styles.cached_figure_json((0,), build)  # Oldest entry was evicted
+        self.assertEqual(build.call_count, self.styles.FIGURE_CACHE_SIZE + 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,63 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+import logic
+from src import backtest, threshold_sweep
+from test_governance import make_closes
+
+
+GRID = {'credit_trig': [-0.01, -0.015], 'vix_panic': [20.0, 25.0, 30.0], 'breadth_trig': [-0.025]}
+
+
+class TestThresholdSweep(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.closes = make_closes(periods=400, seed=5)
+        self.opens = self.closes * 0.999
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def sweep(self, workers):
+        path = os.path.join(self.tmp_dir, f"sweep_{workers}.parquet")
+        count = threshold_sweep.run_sweep(self.closes, self.opens, GRID, path, workers=workers, batch_size=2)
+        self.assertEqual(count, 6)
+        return pd.read_parquet(path).sort_values("run").reset_index(drop=True)
+
+    def test_pool_matches_in_process(self):
+        pd.testing.assert_frame_equal(self.sweep(workers=2), self.sweep(workers=1))
+
+    def test_live_thresholds_match_backtest_of_calc_governance(self):
+        results = self.sweep(workers=1)
+        live = results[(results.credit_trig == logic.CREDIT_TRIG) & (results.vix_panic == logic.VIX_PANIC)].iloc[0]
+
+        gov_df, _, _, _ = logic.calc_governance({'Close': self.closes})
+        _, stats = backtest.run_backtest(gov_df['Gov_Level'], self.opens['SPY'], self.closes['SPY'])
+        self.assertAlmostEqual(live["total_return"], stats["total_return"])
+        self.assertEqual(live["dxy_spike"], logic.DXY_SPIKE)
+
+        # 2020-02-19 and 2020-03-11 fall inside the synthetic history
+        self.assertEqual(live["bad_dates_total"], 2)
+        morning = gov_df['Gov_Level'].shift(1)
+        expected = sum(morning.iloc[i] > 0 for i in threshold_sweep.bad_date_positions(gov_df.index) if i > 0)
+        self.assertEqual(live["bad_dates_caught"], expected)
+
+    def test_bad_dates_outside_history_are_skipped(self):
+        positions = threshold_sweep.bad_date_positions(self.closes.index)
+        self.assertEqual((positions >= 0).sum(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
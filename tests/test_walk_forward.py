@@ -0,0 +1,77 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock dependencies before importing logic
+sys.modules.setdefault("streamlit", MagicMock())
+sys.modules.setdefault("yfinance", MagicMock())
+
+from src import threshold_sweep, walk_forward
+from test_governance import make_closes
+
+
+GRID = {'vix_panic': [20.0, 25.0, 30.0], 'credit_trig': [-0.01, -0.02]}
+
+
+class TestWalkForward(unittest.TestCase):
+    def setUp(self):
+        self.closes = make_closes(periods=700, seed=6)
+        self.opens = self.closes * 0.999
+
+    def test_folds_tile_the_out_of_sample_range(self):
+        folds = walk_forward.make_folds(700, train_days=300, test_days=150)
+        self.assertEqual(folds, [(0, 300, 450), (150, 450, 600), (300, 600, 700)])
+
+    def test_picks_in_sample_best_and_stitches_oos(self):
+        folds, daily, stats = walk_forward.walk_forward(self.closes, self.opens, GRID, train_days=300,
+                                                        test_days=150, workers=1)
+        self.assertEqual(len(folds), 3)
+        self.assertEqual(len(daily), 400)
+        self.assertEqual(daily.index[0], self.closes.index[300])
+        self.assertAlmostEqual(stats["total_return"], daily["Equity"].iloc[-1] - 1.0)
+
+        # Fold 1's choice is the grid's best Sharpe on its own in-sample rows
+        block, index = threshold_sweep.prepare_inputs(self.closes, self.opens)
+        bad_pos = threshold_sweep.bad_date_positions(index)
+        scores = [threshold_sweep.evaluate(block, p, bad_pos, 150, 450)[0]["sharpe"]
+                  for p in threshold_sweep.grid_combinations(GRID)]
+        self.assertAlmostEqual(folds.loc[1, "is_score"], max(scores))
+
+        # Each OOS segment compounds to the fold's reported return
+        segment = daily["Return"].iloc[150:300]
+        self.assertAlmostEqual(np.prod(1 + segment) - 1, folds.loc[1, "oos_return"])
+
+    def test_single_combination_equals_continuous_backtest(self):
+        grid = {'vix_panic': [20.0]}  # Every fold trades the same thresholds
+        folds, daily, stats = walk_forward.walk_forward(self.closes, self.opens, grid, train_days=300,
+                                                        test_days=150, workers=1)
+
+        block, index = threshold_sweep.prepare_inputs(self.closes, self.opens)
+        bad_pos = threshold_sweep.bad_date_positions(index)
+        params = threshold_sweep.grid_combinations(grid)[0]
+        row, returns, weights, turnover = threshold_sweep.evaluate(block, params, bad_pos, 300, 700, warmup=300)
+
+        np.testing.assert_allclose(daily["Return"].to_numpy(), returns)
+        np.testing.assert_allclose(daily["Exposure"].to_numpy(), weights)
+        self.assertAlmostEqual(stats["total_return"], row["total_return"])
+        self.assertAlmostEqual(stats["turnover"], row["turnover"])
+
+    def test_parallel_matches_serial(self):
+        serial = walk_forward.walk_forward(self.closes, self.opens, GRID, train_days=300, test_days=150, workers=1)
+        parallel = walk_forward.walk_forward(self.closes, self.opens, GRID, train_days=300, test_days=150, workers=2)
+        pd.testing.assert_frame_equal(serial[0], parallel[0])
+        pd.testing.assert_frame_equal(serial[1], parallel[1])
+
+    def test_history_shorter_than_training_window(self):
+        folds, daily, stats = walk_forward.walk_forward(self.closes.iloc[:100], self.opens.iloc[:100], GRID, workers=1)
+        self.assertTrue(folds.empty and daily.empty)
+
+
+if __name__ == '__main__':
+    unittest.main()